@@ -0,0 +1,227 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Measures the per-call overhead of every backend's public methods.
+
+The native layers (NVDA and System Access DLLs, SAPI and JAWS COM objects, the Speech Dispatcher client,
+and NSSpeechSynthesizer) are replaced by fakes, so every backend can be measured on any platform.
+
+Usage:
+	python -m benchmarks.bench_backends [--iterations N] [--backend NAME ...] [--method NAME ...]
+"""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import argparse
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+from unittest import mock
+
+# Speechlight Modules:
+from speechlight import darwin, dummy, speech_dispatcher, windows
+from speechlight.base import BaseSpeech
+
+# Local Modules:
+from .fakes import (
+	FakeFunction,
+	FakeJawsApi,
+	FakeNSSpeechSynthesizer,
+	FakeNVDA,
+	FakeSA,
+	FakeSpVoice,
+	FakeSSIPClient,
+)
+
+
+# Constants:
+DEFAULT_ITERATIONS: int = 10_000
+DEFAULT_TEXT: str = "You are hungry."
+WARMUP_ITERATIONS: int = 100
+
+
+class Result(NamedTuple):
+	"""The timings of one method of one backend."""
+
+	backend: str
+	method: str
+	iterations: int
+	mean: float  # Microseconds.
+	median: float  # Microseconds.
+	p99: float  # Microseconds.
+	maximum: float  # Microseconds.
+
+	@property
+	def throughput(self) -> float:
+		"""The number of calls per second."""
+		return 1_000_000 / self.mean if self.mean else float("inf")
+
+
+def make_windows(screen_reader: str) -> BaseSpeech:
+	"""
+	Creates a Windows backend with fake screen reader APIs.
+
+	Args:
+		screen_reader: The screen reader which should be reported as running.
+
+	Returns:
+		The backend.
+	"""
+	speech = windows.Speech()
+	speech._nvda = FakeNVDA(running=screen_reader == windows.SCREEN_READER_NVDA)  # NOQA: SLF001
+	speech._sa = FakeSA(running=screen_reader == windows.SCREEN_READER_SA)  # NOQA: SLF001
+	speech._find_window = FakeFunction(int(screen_reader == windows.SCREEN_READER_JFW))  # NOQA: SLF001
+	speech._jfw = FakeJawsApi()  # NOQA: SLF001
+	speech._sapi = FakeSpVoice()  # NOQA: SLF001
+	return speech
+
+
+def make_speech_dispatcher() -> BaseSpeech:
+	"""
+	Creates a Speech Dispatcher backend with a fake SSIP client.
+
+	Returns:
+		The backend.
+	"""
+	with mock.patch.object(speech_dispatcher.Speech, "_open_client", lambda self: FakeSSIPClient()):
+		return speech_dispatcher.Speech()
+
+
+def make_darwin() -> BaseSpeech:
+	"""
+	Creates a Darwin backend with a fake speech synthesizer.
+
+	Returns:
+		The backend.
+	"""
+	speech = darwin.Speech()
+	speech._darwin = FakeNSSpeechSynthesizer()  # NOQA: SLF001
+	return speech
+
+
+BACKENDS: dict[str, Callable[[], BaseSpeech]] = {
+	"darwin": make_darwin,
+	"dummy": dummy.Speech,
+	"speech_dispatcher": make_speech_dispatcher,
+	"windows-jfw": lambda: make_windows(windows.SCREEN_READER_JFW),
+	"windows-nvda": lambda: make_windows(windows.SCREEN_READER_NVDA),
+	"windows-sa": lambda: make_windows(windows.SCREEN_READER_SA),
+	"windows-sapi": lambda: make_windows(windows.SCREEN_READER_SAPI),
+}
+METHODS: dict[str, Callable[[BaseSpeech, str], object]] = {
+	"braille": lambda speech, text: speech.braille(text),
+	"output": lambda speech, text: speech.output(text),
+	"say": lambda speech, text: speech.say(text),
+	"say-interrupt": lambda speech, text: speech.say(text, interrupt=True),
+	"say_many": lambda speech, text: speech.say_many((text, text, text)),
+	"silence": lambda speech, text: speech.silence(),
+	"speaking": lambda speech, text: speech.speaking(),
+}
+
+
+def measure(backend: str, method: str, iterations: int, text: str = DEFAULT_TEXT) -> Result:
+	"""
+	Measures one method of one backend.
+
+	Args:
+		backend: The backend name, a key of BACKENDS.
+		method: The method name, a key of METHODS.
+		iterations: The number of calls to time.
+		text: The text passed to the method.
+
+	Returns:
+		The timings.
+	"""
+	speech: BaseSpeech = BACKENDS[backend]()
+	func: Callable[[BaseSpeech, str], object] = METHODS[method]
+	for _ in range(WARMUP_ITERATIONS):
+		func(speech, text)
+	samples: list[float] = []
+	clock: Callable[[], int] = time.perf_counter_ns
+	for _ in range(iterations):
+		start: int = clock()
+		func(speech, text)
+		samples.append((clock() - start) / 1000)
+	samples.sort()
+	return Result(
+		backend=backend,
+		method=method,
+		iterations=iterations,
+		mean=statistics.fmean(samples),
+		median=samples[len(samples) // 2],
+		p99=samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+		maximum=samples[-1],
+	)
+
+
+def format_results(results: Sequence[Result]) -> str:
+	"""
+	Formats timings as a table.
+
+	Args:
+		results: The timings.
+
+	Returns:
+		The table.
+	"""
+	header: str = (
+		f"{'backend':<18} {'method':<14} {'mean us':>9} {'median us':>10} {'p99 us':>9} {'max us':>9}"
+		+ f" {'calls/s':>12}"
+	)
+	lines: list[str] = [header, "-" * len(header)]
+	lines.extend(
+		f"{r.backend:<18} {r.method:<14} {r.mean:>9.2f} {r.median:>10.2f} {r.p99:>9.2f} {r.maximum:>9.2f}"
+		+ f" {r.throughput:>12,.0f}"
+		for r in results
+	)
+	return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+	"""
+	Runs the benchmarks from the command line.
+
+	Args:
+		argv: The command line arguments, or None to use sys.argv.
+	"""
+	parser = argparse.ArgumentParser(
+		description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+	)
+	parser.add_argument(
+		"--iterations", type=int, default=DEFAULT_ITERATIONS, help="Calls to time per method."
+	)
+	parser.add_argument("--backend", action="append", choices=sorted(BACKENDS), help="Backends to measure.")
+	parser.add_argument("--method", action="append", choices=sorted(METHODS), help="Methods to measure.")
+	args = parser.parse_args(argv)
+	results: list[Result] = [
+		measure(backend, method, args.iterations)
+		for backend in args.backend or sorted(BACKENDS)
+		for method in args.method or sorted(METHODS)
+	]
+	print(format_results(results))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,178 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compares the compiled text normalizer with a naive chain of regular expressions.
+
+The naive chain applies each rule as a separate pass, as is common when cleaning MUD output
+before sending it to a screen reader.
+
+Usage:
+	python -m benchmarks.bench_normalize [--iterations N] [--unique N]
+"""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import argparse
+import random
+import re
+import statistics
+import time
+from collections.abc import Callable, Sequence
+
+# Speechlight Modules:
+from speechlight.normalize import ANSI_PATTERN, PUNCTUATION_PATTERN, TextNormalizer
+
+
+# Constants:
+DEFAULT_ITERATIONS: int = 20
+DEFAULT_LINES: int = 2000  # The number of lines normalized per iteration.
+DEFAULT_UNIQUE: int = 200  # The number of distinct lines, as MUD output repeats itself.
+SYMBOLS: dict[str, str] = {"&": "and", "@": "at", "->": "to", "<-": "from", "%": "percent", "#": "number"}
+TEMPLATES: tuple[str, ...] = (
+	"\x1b[1;31mYou are hungry.\x1b[0m",
+	"\x1b[32m{name}\x1b[0m says, 'Meet me @ the {place}   & bring {count}% of the gold.'",
+	"HP: {count}   MP: {count}   ->   \x1b[33m{place}\x1b[0m",
+	"==================== {name} ====================",
+	"\x1b]0;{name} - MUD\x07You see #{count} in the {place}!!!!",
+	"  {name} <- {place}\r\n\r\n  {name} -> {place}  ",
+)
+NAMES: tuple[str, ...] = ("Gandalf", "Frodo", "Aragorn", "Legolas", "Gimli", "Boromir")
+PLACES: tuple[str, ...] = ("Prancing Pony", "Rivendell", "Moria", "Lothlorien", "Edoras", "Minas Tirith")
+
+
+class NaiveNormalizer:
+	"""Applies each normalization rule as a separate pass over the text."""
+
+	def __init__(self, symbols: dict[str, str]) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			symbols: A mapping of symbols to their replacements.
+		"""
+		self.symbols: dict[str, str] = symbols
+		self.ansi_regex: re.Pattern[str] = re.compile(ANSI_PATTERN)
+		self.punctuation_regex: re.Pattern[str] = re.compile(PUNCTUATION_PATTERN)
+
+	def __call__(self, text: str) -> str:
+		"""
+		Normalizes text.
+
+		Args:
+			text: The text to normalize.
+
+		Returns:
+			The normalized text.
+		"""
+		text = self.ansi_regex.sub("", text)
+		text = re.sub(r"[ \t]*(?:\n[ \t]*)+", "\n", text)
+		text = re.sub(r"[ \t]+", " ", text)
+		text = self.punctuation_regex.sub(r"\1", text)
+		for symbol in sorted(self.symbols, key=len, reverse=True):
+			text = text.replace(symbol, self.symbols[symbol])
+		return text.strip()
+
+
+def make_lines(count: int, unique: int, seed: int = 0) -> list[str]:
+	"""
+	Generates MUD-like lines of output.
+
+	Args:
+		count: The number of lines.
+		unique: The number of distinct lines.
+		seed: The random seed.
+
+	Returns:
+		The lines.
+	"""
+	rng: random.Random = random.Random(seed)  # NOQA: S311
+	distinct: list[str] = [
+		rng.choice(TEMPLATES).format(
+			name=rng.choice(NAMES), place=rng.choice(PLACES), count=rng.randint(1, 99)
+		)
+		for _ in range(unique)
+	]
+	return [rng.choice(distinct) for _ in range(count)]
+
+
+def measure(func: Callable[[str], str], lines: Sequence[str], iterations: int) -> float:
+	"""
+	Measures the time taken to normalize lines.
+
+	Args:
+		func: The normalizer.
+		lines: The lines to normalize.
+		iterations: The number of times to normalize all lines.
+
+	Returns:
+		The median time per line, in microseconds.
+	"""
+	samples: list[float] = []
+	for _ in range(iterations):
+		start: int = time.perf_counter_ns()
+		for line in lines:
+			func(line)
+		samples.append((time.perf_counter_ns() - start) / 1000 / len(lines))
+	return statistics.median(samples)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+	"""
+	Runs the benchmarks from the command line.
+
+	Args:
+		argv: The command line arguments, or None to use sys.argv.
+
+	Raises:
+		AssertionError: The normalizers produce different results.
+	"""
+	parser = argparse.ArgumentParser(
+		description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+	)
+	parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Passes over the lines.")
+	parser.add_argument("--lines", type=int, default=DEFAULT_LINES, help="Lines normalized per pass.")
+	parser.add_argument("--unique", type=int, default=DEFAULT_UNIQUE, help="Distinct lines.")
+	args = parser.parse_args(argv)
+	lines: list[str] = make_lines(args.lines, args.unique)
+	naive: NaiveNormalizer = NaiveNormalizer(SYMBOLS)
+	compiled: TextNormalizer = TextNormalizer(symbols=SYMBOLS, cache_size=0)
+	for line in set(lines):
+		if naive(line) != compiled(line):
+			raise AssertionError(f"Normalizers disagree on {line!r}: {naive(line)!r} != {compiled(line)!r}")
+	normalizers: dict[str, Callable[[str], str]] = {
+		"naive chain": naive,
+		"compiled": compiled,
+		"compiled, cached": TextNormalizer(symbols=SYMBOLS),
+	}
+	baseline: float | None = None
+	print(f"{'normalizer':<18} {'us/line':>9} {'speedup':>8}")
+	print("-" * 37)
+	for name, func in normalizers.items():
+		elapsed: float = measure(func, lines, args.iterations)
+		baseline = baseline or elapsed
+		print(f"{name:<18} {elapsed:>9.3f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,107 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compares the pronunciation dictionary with calling str.replace once per entry.
+
+Usage:
+	python -m benchmarks.bench_pronunciation [--entries N] [--iterations N]
+"""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import argparse
+import random
+import string
+from collections.abc import Callable, Sequence
+
+# Speechlight Modules:
+from speechlight.pronunciation import PronunciationDictionary
+
+# Local Modules:
+from .bench_normalize import make_lines, measure
+
+
+# Constants:
+DEFAULT_ENTRIES: int = 5000
+DEFAULT_ITERATIONS: int = 5
+DEFAULT_LINES: int = 500
+
+
+def make_entries(count: int, seed: int = 0) -> dict[str, str]:
+	"""
+	Generates dictionary entries which look like game names and abbreviations.
+
+	Args:
+		count: The number of entries.
+		seed: The random seed.
+
+	Returns:
+		A mapping of patterns to their replacements.
+	"""
+	rng: random.Random = random.Random(seed)  # NOQA: S311
+	entries: dict[str, str] = {"Gandalf": "Gan-dalf", "Moria": "Mor-ee-ah", "HP": "hit points"}
+	while len(entries) < count:
+		pattern: str = "".join(rng.choices(string.ascii_letters, k=rng.randint(3, 8)))
+		entries[pattern] = pattern.lower()
+	return entries
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+	"""
+	Runs the benchmarks from the command line.
+
+	Args:
+		argv: The command line arguments, or None to use sys.argv.
+	"""
+	parser = argparse.ArgumentParser(
+		description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+	)
+	parser.add_argument("--entries", type=int, default=DEFAULT_ENTRIES, help="Dictionary entries.")
+	parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Passes over the lines.")
+	parser.add_argument("--lines", type=int, default=DEFAULT_LINES, help="Lines rewritten per pass.")
+	args = parser.parse_args(argv)
+	lines: list[str] = make_lines(args.lines, args.lines)
+	entries: dict[str, str] = make_entries(args.entries)
+
+	def naive(text: str) -> str:
+		for pattern, replacement in entries.items():
+			text = text.replace(pattern, replacement)
+		return text
+
+	dictionary: PronunciationDictionary = PronunciationDictionary(
+		entries, whole_word=False, case_sensitive=True
+	)
+	dictionary("")  # Link the automaton before timing.
+	rewriters: dict[str, Callable[[str], str]] = {"str.replace per entry": naive, "dictionary": dictionary}
+	baseline: float | None = None
+	print(f"{'rewriter':<22} {'us/line':>10} {'speedup':>8}")
+	print("-" * 42)
+	for name, func in rewriters.items():
+		elapsed: float = measure(func, lines, args.iterations)
+		baseline = baseline or elapsed
+		print(f"{name:<22} {elapsed:>10.3f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+	main()
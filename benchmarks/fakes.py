@@ -0,0 +1,278 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Fake native layers, so that every backend can be benchmarked on any platform."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import itertools
+import time
+from collections.abc import Callable, Iterable
+from types import SimpleNamespace
+from typing import Any
+
+
+def _delay(latency: float) -> None:
+	"""
+	Simulates the cost of a native call.
+
+	Args:
+		latency: The number of seconds the call takes.
+	"""
+	if latency > 0:
+		time.sleep(latency)
+
+
+class FakeFunction:
+	"""A fake ctypes foreign function which returns a fixed result."""
+
+	def __init__(self, result: int = 0, latency: float = 0.0) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			result: The value returned by each call.
+			latency: The number of seconds each call takes.
+		"""
+		self.result: int = result
+		self.latency: float = latency
+		self.argtypes: Any = None
+		self.restype: Any = None
+		self.calls: int = 0
+
+	def __call__(self, *args: Any) -> int:
+		"""
+		Calls the function.
+
+		Args:
+			*args: Ignored.
+
+		Returns:
+			The fixed result.
+		"""
+		self.calls += 1
+		_delay(self.latency)
+		return self.result
+
+
+class FakeNVDA:
+	"""A fake nvdaControllerClient DLL, which reports that NVDA is running."""
+
+	def __init__(self, *, running: bool = True, latency: float = 0.0) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			running: True if NVDA should be reported as running.
+			latency: The number of seconds each call takes.
+		"""
+		self.nvdaController_testIfRunning = FakeFunction(0 if running else 1, latency)
+		self.nvdaController_speakText = FakeFunction(0, latency)
+		self.nvdaController_brailleMessage = FakeFunction(0, latency)
+		self.nvdaController_cancelSpeech = FakeFunction(0, latency)
+
+
+class FakeSA:
+	"""A fake SAAPI DLL, which reports that System Access is running."""
+
+	def __init__(self, *, running: bool = True, latency: float = 0.0) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			running: True if System Access should be reported as running.
+			latency: The number of seconds each call takes.
+		"""
+		self.SA_IsRunning = FakeFunction(int(running), latency)
+		self.SA_SayW = FakeFunction(1, latency)
+		self.SA_BrlShowTextW = FakeFunction(1, latency)
+		self.SA_StopAudio = FakeFunction(1, latency)
+
+
+class FakeSpVoice:
+	"""A fake SAPI.SpVoice COM object."""
+
+	def __init__(self, *, latency: float = 0.0) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			latency: The number of seconds each call takes.
+		"""
+		self.latency: float = latency
+		self.Status: SimpleNamespace = SimpleNamespace(RunningState=1)  # Not speaking.
+
+	def Speak(self, text: str, flags: int) -> int:  # NOQA: N802
+		"""
+		Speaks text.
+
+		Args:
+			text: The text to be spoken.
+			flags: SAPI speak flags.
+
+		Returns:
+			The stream number.
+		"""
+		_delay(self.latency)
+		return 1
+
+
+class FakeJawsApi:
+	"""A fake FreedomSci.JawsApi COM object."""
+
+	def __init__(self, *, latency: float = 0.0) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			latency: The number of seconds each call takes.
+		"""
+		self.latency: float = latency
+
+	def SayString(self, text: str, flush: int) -> bool:  # NOQA: N802
+		"""
+		Speaks text.
+
+		Args:
+			text: The text to be spoken.
+			flush: 1 if speech should be silenced first.
+
+		Returns:
+			True.
+		"""
+		_delay(self.latency)
+		return True
+
+	def RunFunction(self, function: str) -> bool:  # NOQA: N802
+		"""
+		Runs a JAWS script function.
+
+		Args:
+			function: The function call.
+
+		Returns:
+			True.
+		"""
+		_delay(self.latency)
+		return True
+
+	def StopSpeech(self) -> None:  # NOQA: N802
+		"""Silences speech."""
+		_delay(self.latency)
+
+
+class FakeSSIPClient:
+	"""A fake speechd.SSIPClient, which fires BEGIN and END callbacks synchronously."""
+
+	def __init__(self, name: str = "speechlight", *, latency: float = 0.0, **kwargs: Any) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			name: The client name.
+			latency: The number of seconds each call takes.
+			**kwargs: Ignored SSIPClient arguments.
+		"""
+		self.name: str = name
+		self.latency: float = latency
+		self._message_ids: itertools.count[int] = itertools.count(1)
+
+	def speak(
+		self,
+		text: str,
+		callback: Callable[..., object] | None = None,
+		event_types: Iterable[str] | None = None,
+	) -> tuple[int, str, tuple[str, ...]]:
+		"""
+		Speaks text.
+
+		Args:
+			text: The text to be spoken.
+			callback: The event callback.
+			event_types: The event types passed to the callback.
+
+		Returns:
+			The SSIP result.
+		"""
+		_delay(self.latency)
+		message_id: int = next(self._message_ids)
+		if callback is not None:
+			for event_type in event_types or ():
+				if event_type != "cancel":
+					callback(event_type)
+		return 225, "OK MESSAGE QUEUED", (str(message_id),)
+
+	def _command(self, *args: Any, **kwargs: Any) -> None:
+		"""
+		Simulates an SSIP command which has no result.
+
+		Args:
+			*args: Ignored.
+			**kwargs: Ignored.
+		"""
+		_delay(self.latency)
+
+	set_priority = set_data_mode = cancel = block_begin = block_end = _command
+
+	def close(self) -> None:
+		"""Closes the connection."""
+
+
+class FakeNSSpeechSynthesizer:
+	"""A fake Cocoa NSSpeechSynthesizer."""
+
+	def __init__(self, *, latency: float = 0.0) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			latency: The number of seconds each call takes.
+		"""
+		self.latency: float = latency
+
+	def startSpeakingString_(self, text: str) -> bool:  # NOQA: N802
+		"""
+		Speaks text.
+
+		Args:
+			text: The text to be spoken.
+
+		Returns:
+			True.
+		"""
+		_delay(self.latency)
+		return True
+
+	def stopSpeaking(self) -> None:  # NOQA: N802
+		"""Silences speech."""
+		_delay(self.latency)
+
+	def isSpeaking(self) -> bool:  # NOQA: N802
+		"""
+		Determines if text is being spoken.
+
+		Returns:
+			False.
+		"""
+		_delay(self.latency)
+		return False
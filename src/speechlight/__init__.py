@@ -25,29 +25,106 @@
 from __future__ import annotations
 
 # Built-in Modules:
-import platform
 import sys
+import threading
 from contextlib import suppress
-from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
-# Third-party Modules:
-from knickknacks.platforms import get_directory_path
 
+if TYPE_CHECKING:  # pragma: no cover
+	from pathlib import Path
 
-SYSTEM_ARCHITECTURE: str = platform.architecture()[0]
-LIB_DIRECTORY: Path = Path(get_directory_path("speech_libs"))
+	from .base import BaseSpeech
 
+	if sys.platform == "win32":
+		from .windows import Speech
+	elif sys.platform == "darwin":
+		from .darwin import Speech
+	elif sys.platform == "linux":
+		from .speech_dispatcher import Speech
+	else:
+		from .dummy import Speech
 
-if sys.platform == "win32":  # pragma: no cover
-	from .windows import Speech
-elif sys.platform == "darwin":  # pragma: no cover
-	from .darwin import Speech
-elif sys.platform == "linux":  # pragma: no cover
-	from .speech_dispatcher import Speech
-else:  # pragma: no cover
-	from .dummy import Speech
-speech: Speech = Speech()
+	SYSTEM_ARCHITECTURE: str
+	LIB_DIRECTORY: Path
+	speech: Speech
+
+
+_lazy_lock: threading.RLock = threading.RLock()  # Reentrant, as backends access LIB_DIRECTORY on import.
+
+
+def _get_speech_class() -> type[BaseSpeech]:  # pragma: no cover
+	"""
+	Imports the Speech class of the selected backend.
+
+	Only the selected backend's module is imported.
+	The class doesn't receive the arguments a backend was registered with, so calling it
+	for a pinned backend such as 'nvda' still probes for a screen reader.
+	Use registry.create, or the speech attribute, to create a configured instance.
+
+	Returns:
+		The Speech class.
+	"""
+	from .registry import load, selected_backend  # NOQA: PLC0415
+
+	return cast("type[BaseSpeech]", load(selected_backend()))
+
+
+def __getattr__(name: str) -> Any:  # pragma: no cover
+	"""
+	Lazily creates module attributes which are expensive to initialize.
+
+	Importing Speechlight doesn't load a backend, open a connection to a speech server, or load DLLs.
+	That work is done on first access to one of these attributes.
+
+	Args:
+		name: The attribute name.
+
+	Returns:
+		The attribute value.
+	"""
+	with _lazy_lock:
+		if name in globals():  # Another thread created it while this one was waiting.
+			return globals()[name]
+		value: Any = _create_lazy_attribute(name)
+		globals()[name] = value
+		return value
+
+
+def _create_lazy_attribute(name: str) -> Any:  # pragma: no cover
+	"""
+	Creates the value of a lazy module attribute.
+
+	Args:
+		name: The attribute name.
+
+	Returns:
+		The attribute value.
+
+	Raises:
+		AttributeError: The module has no attribute with the given name.
+	"""
+	value: Any
+	if name == "SYSTEM_ARCHITECTURE":
+		import platform  # NOQA: PLC0415
+
+		value = platform.architecture()[0]
+	elif name == "LIB_DIRECTORY":
+		from pathlib import Path  # NOQA: PLC0415
+
+		from knickknacks.platforms import get_directory_path  # NOQA: PLC0415
+
+		value = Path(get_directory_path("speech_libs"))
+	elif name == "Speech":
+		value = _get_speech_class()
+	elif name == "speech":
+		from .registry import create  # NOQA: PLC0415
+
+		# Created through the registry, so that a pinned backend receives its registered arguments.
+		value = create()
+	else:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	return value
 
 
 __version__: str = "0.0.0"
@@ -0,0 +1,330 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asyncio speech."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from typing import TypeVar, cast
+
+# Local Modules:
+from .base import BaseSpeech, MessageTrackerType, Priority, SpeechEventSourceType
+
+
+# Constants:
+POLL_INTERVAL: float = 0.05  # Seconds between checks for the end of speech, when no event arrives sooner.
+
+_T = TypeVar("_T")
+
+
+class AsyncSpeech:
+	"""
+	Provides an asyncio interface to a Speech instance.
+
+	Blocking backend calls are run in an executor, one at a time, in the order they were made.
+	If the backend tracks messages by ID (I.E. Speech Dispatcher), the future of each message sent by
+	this instance completes when the backend reports that the message ended or was cancelled,
+	or once the backend's deadline for the message passes if no such event arrives.
+	Messages sent by other callers don't affect completion, as they aren't tracked.
+	Otherwise, completion is determined by polling the backend's speaking method.
+
+	Note:
+		A message's ID is read from the backend right after the call which sent it,
+		so other threads shouldn't send messages through the same backend at the same time.
+	"""
+
+	def __init__(
+		self,
+		speech: BaseSpeech,
+		*,
+		executor: Executor | None = None,
+		poll_interval: float = POLL_INTERVAL,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to wrap.
+			executor: The executor for backend calls, or None to use a dedicated single thread.
+			poll_interval: Seconds between checks for the end of speech, when no event arrives sooner.
+				Only used if the backend doesn't track messages.
+		"""
+		self.speech: BaseSpeech = speech
+		self.poll_interval: float = poll_interval
+		self._owns_executor: bool = executor is None
+		self._executor: Executor = executor or ThreadPoolExecutor(
+			max_workers=1, thread_name_prefix="speechlight-async"
+		)
+		self._loop: asyncio.AbstractEventLoop | None = None
+		self._waiters: list[asyncio.Future[None]] = []
+		self._poll_task: asyncio.Task[None] | None = None
+		self._wake: asyncio.Event | None = None
+		self._tracker: MessageTrackerType | None = speech if isinstance(speech, MessageTrackerType) else None
+		# Futures for the messages sent by this instance which haven't finished.
+		self._messages: set[asyncio.Future[None]] = set()
+		self._event_source: SpeechEventSourceType | None = None
+		if self._tracker is None and isinstance(speech, SpeechEventSourceType):
+			self._event_source = speech
+			speech.add_event_listener(self._on_event)
+
+	async def _run(self, func: Callable[[], _T]) -> _T:
+		"""
+		Runs a blocking function in the executor.
+
+		Args:
+			func: The function to run.
+
+		Returns:
+			The result of the function.
+		"""
+		self._loop = asyncio.get_running_loop()
+		return await self._loop.run_in_executor(self._executor, func)
+
+	def _on_event(self, event_type: str) -> None:
+		"""
+		Receives events from the backend's callback thread.
+
+		Args:
+			event_type: The event type.
+		"""
+		loop = self._loop
+		if loop is not None and not loop.is_closed():
+			loop.call_soon_threadsafe(self._handle_event)
+
+	def _handle_event(self) -> None:
+		"""Wakes the polling task, in the event loop, so that the end of speech is noticed promptly."""
+		if self._wake is None:
+			self._wake = asyncio.Event()
+		self._wake.set()
+
+	def _resolve_waiters(self) -> None:
+		"""Completes all futures which are waiting for speech to finish."""
+		waiters, self._waiters = self._waiters, []
+		for waiter in waiters:
+			if not waiter.done():
+				waiter.set_result(None)
+
+	def _send(self, func: Callable[[], object], future: asyncio.Future[None]) -> float | None:
+		"""
+		Calls the backend, in the executor, and listens for the end of the message which was sent.
+
+		Args:
+			func: The backend call.
+			future: The future to complete when the message finishes.
+
+		Returns:
+			When the backend assumes the message finished if no event says so,
+			or None if the message can't be tracked or already finished.
+		"""
+		func()
+		tracker: MessageTrackerType = cast("MessageTrackerType", self._tracker)
+		message_id: int | None = tracker.last_message_id
+		if message_id is None:
+			# The message couldn't be tracked, for example because it was buffered while disconnected.
+			return None
+		return tracker.add_message_listener(message_id, partial(self._on_message_finished, future))
+
+	def _on_message_finished(self, future: asyncio.Future[None]) -> None:
+		"""
+		Receives the end of a message from the backend's callback thread.
+
+		Args:
+			future: The future of the message.
+		"""
+		loop = future.get_loop()
+		if not loop.is_closed():
+			loop.call_soon_threadsafe(self._finish_message, future)
+
+	def _finish_message(self, future: asyncio.Future[None]) -> None:
+		"""
+		Completes the future of a message, in the event loop.
+
+		Args:
+			future: The future of the message.
+		"""
+		if not future.done():
+			future.set_result(None)
+		self._messages.discard(future)
+		if not self._messages:
+			self._resolve_waiters()
+
+	async def _poll(self) -> None:
+		"""Checks the backend until speech finishes."""
+		try:
+			while self._waiters:
+				if not await self._run(self.speech.speaking):
+					self._resolve_waiters()
+					break
+				await self._sleep()
+		finally:
+			self._poll_task = None
+
+	async def _sleep(self) -> None:
+		"""Waits for the poll interval, or until the backend reports an event."""
+		if self._wake is None:
+			self._wake = asyncio.Event()
+		with suppress(asyncio.TimeoutError):
+			await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+		self._wake.clear()
+
+	def _start_polling(self) -> None:
+		"""Starts the polling task, if it isn't running."""
+		loop = asyncio.get_running_loop()
+		self._loop = loop
+		if self._poll_task is None:
+			self._poll_task = loop.create_task(self._poll())
+
+	def completion(self) -> asyncio.Future[None]:
+		"""
+		Creates a future which completes when speech started by this instance finishes.
+
+		If the backend doesn't track messages, the future completes when the backend stops speaking.
+
+		Returns:
+			The future.
+		"""
+		future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+		if self._tracker is None:
+			self._waiters.append(future)
+			self._start_polling()
+		elif self._messages:
+			self._waiters.append(future)
+		else:
+			future.set_result(None)
+		return future
+
+	async def braille(self, text: str) -> None:
+		"""
+		Brailles text.
+
+		Args:
+			text: The text to be brailled.
+		"""
+		await self._run(partial(self.speech.braille, text))
+
+	async def output(
+		self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> asyncio.Future[None]:
+		"""
+		Speaks and brailles text.
+
+		Args:
+			text: The output text.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the message.
+
+		Returns:
+			A future which completes when the message finishes speaking.
+		"""
+		call = partial(self.speech.output, text, interrupt=interrupt, priority=priority)
+		return await self._speak(call)
+
+	async def say(
+		self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> asyncio.Future[None]:
+		"""
+		Speaks text.
+
+		Args:
+			text: The text to be spoken.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the message.
+
+		Returns:
+			A future which completes when the message finishes speaking.
+		"""
+		call = partial(self.speech.say, text, interrupt=interrupt, priority=priority)
+		return await self._speak(call)
+
+	async def _speak(self, func: Callable[[], object]) -> asyncio.Future[None]:
+		"""
+		Passes a speech call to the backend.
+
+		Args:
+			func: The backend call.
+
+		Returns:
+			A future which completes when the message finishes. If the backend doesn't track messages,
+			it completes when the backend stops speaking.
+		"""
+		if self._tracker is None:
+			await self._run(func)
+			return self.completion()
+		loop = asyncio.get_running_loop()
+		future: asyncio.Future[None] = loop.create_future()
+		deadline: float | None = await self._run(partial(self._send, func, future))
+		if deadline is None:
+			future.set_result(None)
+		elif not future.done():  # The message may have finished before the backend call returned.
+			self._messages.add(future)
+			# In case the backend never reports the end of the message.
+			fallback = loop.call_later(max(0.0, deadline - time.monotonic()), self._finish_message, future)
+			future.add_done_callback(lambda _: fallback.cancel())
+		return future
+
+	async def silence(self) -> None:
+		"""
+		Cancels speech and flushes the speech buffer.
+
+		The futures of the silenced messages complete when the backend reports that they were cancelled.
+		"""
+		await self._run(self.speech.silence)
+
+	async def speaking(self) -> bool:
+		"""
+		Determines if text is currently being spoken.
+
+		Returns:
+			True if text is currently being spoken, False otherwise.
+		"""
+		return await self._run(self.speech.speaking)
+
+	async def wait_idle(self, timeout: float | None = None) -> bool:
+		"""
+		Waits until speech started by this instance finishes.
+
+		Args:
+			timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+		Returns:
+			True if speech finished, False if the timeout expired.
+		"""
+		try:
+			await asyncio.wait_for(asyncio.shield(self.completion()), timeout)
+		except asyncio.TimeoutError:
+			return False
+		return True
+
+	def close(self) -> None:
+		"""Stops listening for backend events, and shuts down the executor if it was created here."""
+		if self._event_source is not None:
+			self._event_source.remove_event_listener(self._on_event)
+			self._event_source = None
+		if self._owns_executor:
+			self._executor.shutdown(wait=False)
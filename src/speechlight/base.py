@@ -26,10 +26,112 @@ from __future__ import annotations
 
 # Built-in Modules:
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, Callable, Coroutine, Iterable
+from enum import Enum
+from typing import Any, ClassVar, Protocol, overload, runtime_checkable
+
+# Local Modules:
+from .instrumentation import Instrumentation
+from .text import TextAccumulator
+
+
+# Constants:
+# Event types passed to the listeners of a SpeechEventSourceType.
+# The values match Speech Dispatcher's callback types (speechd.CallbackType).
+CALLBACK_BEGIN: str = "begin"
+CALLBACK_CANCEL: str = "cancel"
+CALLBACK_END: str = "end"
+
+
+class Priority(str, Enum):
+	"""
+	Message priorities, from most to least urgent.
+
+	The values match the Speech Dispatcher (SSIP) priority names.
+	"""
+
+	IMPORTANT = "important"
+	MESSAGE = "message"
+	TEXT = "text"
+	NOTIFICATION = "notification"
+	PROGRESS = "progress"
+
+	@property
+	def rank(self) -> int:
+		"""The urgency of the priority, where lower values are more urgent."""
+		return tuple(Priority).index(self)
+
+
+@runtime_checkable
+class SpeechEventSourceType(Protocol):
+	"""Protocol for a Speech instance which reports speech events to listeners."""
+
+	def add_event_listener(self, listener: Callable[[str], object]) -> None: ...  # NOQA: D102
+
+	def remove_event_listener(self, listener: Callable[[str], object]) -> None: ...  # NOQA: D102
+
+
+@runtime_checkable
+class MessageTrackerType(Protocol):
+	"""Protocol for a Speech instance which tracks the messages it sends by ID."""
+
+	last_message_id: int | None
+
+	def wait_message(self, message_id: int, timeout: float | None = None) -> bool: ...  # NOQA: D102
+
+	def add_message_listener(  # NOQA: D102
+		self, message_id: int, listener: Callable[[], object]
+	) -> float | None: ...
 
 
 class BaseSpeech(ABC):
-	"""The base interface that Speech inherits from."""
+	"""
+	The base interface that Speech inherits from.
+
+	Note:
+		Backends may be called from any thread. A backend's lock only guards its own state,
+		and is never held while speech is produced, so callers don't wait behind each other's speech.
+		Platform APIs which must be used from a single thread are owned by a dedicated thread.
+		Wrap a backend in QueuedSpeech to return as soon as a call is queued.
+	"""
+
+	instrumented_methods: ClassVar[tuple[str, ...]] = (
+		"braille",
+		"output",
+		"output_many",
+		"say",
+		"say_many",
+		"silence",
+		"speaking",
+	)
+	instrumentation: Instrumentation | None = None
+
+	def enable_instrumentation(self, instrumentation: Instrumentation | None = None) -> Instrumentation:
+		"""
+		Records statistics for the methods named in instrumented_methods.
+
+		Args:
+			instrumentation: The instance to record into, or None to create one.
+
+		Returns:
+			The instance statistics are recorded into.
+		"""
+		if self.instrumentation is not None:
+			if instrumentation is None or instrumentation is self.instrumentation:
+				return self.instrumentation
+			self.disable_instrumentation()
+		self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+		for name in self.instrumented_methods:
+			setattr(self, name, self.instrumentation.wrap(name, getattr(self, name)))
+		return self.instrumentation
+
+	def disable_instrumentation(self) -> None:
+		"""Stops recording statistics, restoring the original methods."""
+		if self.instrumentation is None:
+			return
+		for name in self.instrumented_methods:
+			vars(self).pop(name, None)
+		self.instrumentation = None
 
 	@abstractmethod
 	def braille(self, text: str) -> None:
@@ -41,24 +143,134 @@ class BaseSpeech(ABC):
 		"""
 
 	@abstractmethod
-	def output(self, text: str, *, interrupt: bool = False) -> None:
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:
 		"""
 		Speaks and brailles text.
 
 		Args:
 			text: The output text.
 			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the message.
+		"""
+
+	def output_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
 		"""
+		Speaks and brailles several texts in order.
+
+		Backends which can send several messages as a single unit override this.
+
+		Args:
+			texts: The output texts.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		for i, text in enumerate(texts):
+			self.output(text, interrupt=interrupt and not i, priority=priority)
 
 	@abstractmethod
-	def say(self, text: str, *, interrupt: bool = False) -> None:
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:
 		"""
 		Speaks text.
 
 		Args:
 			text: The text to be spoken.
 			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the message.
+		"""
+
+	def say_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks several texts in order.
+
+		Backends which can send several messages as a single unit override this.
+
+		Args:
+			texts: The texts to be spoken.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		for i, text in enumerate(texts):
+			self.say(text, interrupt=interrupt and not i, priority=priority)
+
+	@overload
+	def say_stream(
+		self, fragments: AsyncIterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> Coroutine[Any, Any, None]: ...
+
+	@overload
+	def say_stream(
+		self, fragments: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None: ...
+
+	def say_stream(
+		self,
+		fragments: AsyncIterable[str] | Iterable[str],
+		*,
+		interrupt: bool = False,
+		priority: Priority = Priority.TEXT,
+	) -> Coroutine[Any, Any, None] | None:
+		"""
+		Speaks text which arrives in fragments.
+
+		Fragments are accumulated, and text is spoken as soon as a sentence boundary is reached,
+		so words are never cut in half. The remaining text is spoken when the fragments run out.
+
+		Note:
+			If fragments is an async iterable, a coroutine is returned which must be awaited.
+			Backend calls are made directly from the event loop.
+
+		Args:
+			fragments: An iterable or async iterable of text fragments.
+			interrupt: True if the speech should be silenced before speaking the first text.
+			priority: The priority of the messages.
+
+		Returns:
+			A coroutine if fragments is an async iterable, otherwise None.
+		"""
+		if isinstance(fragments, AsyncIterable):
+			return self._say_stream_async(fragments, interrupt=interrupt, priority=priority)
+		accumulator: TextAccumulator = TextAccumulator()
+		for fragment in fragments:
+			interrupt = self._say_chunks(accumulator.feed(fragment), interrupt=interrupt, priority=priority)
+		self._say_chunks(accumulator.flush(), interrupt=interrupt, priority=priority)
+		return None
+
+	async def _say_stream_async(
+		self, fragments: AsyncIterable[str], *, interrupt: bool, priority: Priority
+	) -> None:
+		"""
+		Speaks text which arrives in fragments from an async iterable.
+
+		Args:
+			fragments: The text fragments.
+			interrupt: True if the speech should be silenced before speaking the first text.
+			priority: The priority of the messages.
+		"""
+		accumulator: TextAccumulator = TextAccumulator()
+		async for fragment in fragments:
+			interrupt = self._say_chunks(accumulator.feed(fragment), interrupt=interrupt, priority=priority)
+		self._say_chunks(accumulator.flush(), interrupt=interrupt, priority=priority)
+
+	def _say_chunks(self, chunks: list[str], *, interrupt: bool, priority: Priority) -> bool:
+		"""
+		Speaks chunks of streamed text.
+
+		Args:
+			chunks: The chunks.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+
+		Returns:
+			The interrupt value for the next chunks, which is False once any text has been spoken.
 		"""
+		if not chunks:
+			return interrupt
+		self.say_many(chunks, interrupt=interrupt, priority=priority)
+		return False
 
 	@abstractmethod
 	def silence(self) -> None:
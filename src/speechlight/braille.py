@@ -0,0 +1,211 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Braille display scheduling."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+
+# Constants:
+DEFAULT_REFRESH_INTERVAL: float = 0.1  # The minimum number of seconds between display updates.
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class BrailleScheduler:
+	"""
+	Limits how often a braille display is updated.
+
+	A braille display only shows one message, so there is no point sending every message during a flood.
+	Text is sent immediately if the display hasn't been updated within the refresh interval.
+	Otherwise, it is held until the interval expires, and replaced by any text which arrives in the meantime,
+	so that the display always ends up showing the latest text.
+	Text which matches what is on the display, or is being sent to it, is not sent again.
+	The lock is never held while sending, so callers don't wait behind a slow display.
+	"""
+
+	def __init__(self, send: Callable[[str], None], *, interval: float = DEFAULT_REFRESH_INTERVAL) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			send: A function which shows text on the display.
+			interval: The minimum number of seconds between display updates.
+
+		Raises:
+			ValueError: Interval is negative.
+		"""
+		if interval < 0:
+			raise ValueError("interval must not be negative.")
+		self.send: Callable[[str], None] = send
+		self.interval: float = interval
+		self.sent: int = 0
+		self.skipped: int = 0
+		self.coalesced: int = 0
+		self._shown: str | None = None
+		self._in_flight: str | None = None  # The text being sent.
+		self._pending: str | None = None
+		self._send_time: float | None = None
+		self._timer: threading.Timer | None = None
+		self._sending: bool = False  # True while a thread is sending.
+		self._flush_requested: bool = False
+		self._lock: threading.RLock = threading.RLock()
+
+	@property
+	def shown(self) -> str | None:
+		"""The text last sent to the display, or None if unknown."""
+		return self._shown
+
+	@property
+	def pending(self) -> str | None:
+		"""The text waiting for the refresh interval to expire, or None."""
+		return self._pending
+
+	def _cancel_timer(self) -> None:
+		"""Cancels a scheduled update."""
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+
+	def _delay(self) -> float:
+		"""
+		Calculates the time until the display may be updated.
+
+		Returns:
+			The number of seconds, which is not positive if the display may be updated now.
+		"""
+		if self._send_time is None:
+			return 0.0
+		return self._send_time + self.interval - time.monotonic()
+
+	def _schedule(self, delay: float) -> None:
+		"""
+		Schedules the pending text to be sent, unless an update is already scheduled.
+
+		Args:
+			delay: The number of seconds to wait.
+		"""
+		if self._timer is None:
+			self._timer = threading.Timer(delay, self._on_timer)
+			self._timer.daemon = True
+			self._timer.start()
+
+	def _on_timer(self) -> None:
+		"""Sends the pending text when the refresh interval expires."""
+		with self._lock:
+			self._timer = None
+		try:
+			self.flush()
+		except Exception:
+			logger.exception("Updating the braille display failed.")
+
+	def show(self, text: str) -> None:
+		"""
+		Shows text on the display, subject to the refresh interval.
+
+		Args:
+			text: The text to show.
+		"""
+		with self._lock:
+			if self._pending is not None:
+				# The pending text will never be shown.
+				self.coalesced += 1
+				self._pending = None
+			# Compare with the text which the display will show once the current send finishes.
+			if text == (self._shown if self._in_flight is None else self._in_flight):
+				self._cancel_timer()
+				self.skipped += 1
+				return
+			self._pending = text
+			delay: float = self._delay()
+			if delay > 0:
+				self._schedule(delay)
+				return
+		self.flush()
+
+	def flush(self) -> None:
+		"""
+		Sends the pending text now, ignoring the refresh interval.
+
+		If another thread is sending, that thread sends the pending text once it finishes,
+		rather than this thread waiting for it.
+		"""
+		with self._lock:
+			self._cancel_timer()
+			self._flush_requested = True
+			if self._sending:
+				return
+			self._sending = True
+		self._drain()
+
+	def _drain(self) -> None:
+		"""
+		Sends pending text until there is none, or the next update must wait for the refresh interval.
+
+		Only the thread which set the sending flag calls this.
+		"""
+		while True:
+			with self._lock:
+				text: str | None = self._pending
+				if text is None or (not self._flush_requested and self._delay() > 0):
+					if text is not None:
+						self._schedule(self._delay())
+					self._sending = self._flush_requested = False
+					return
+				self._flush_requested = False
+				self._pending = None
+				self._in_flight = text
+				self._send_time = time.monotonic()
+			try:
+				self.send(text)
+			except BaseException:
+				with self._lock:
+					self._in_flight = None
+					self._sending = self._flush_requested = False
+				raise
+			with self._lock:
+				self._in_flight = None
+				self._shown = text
+				self.sent += 1
+
+	def reset(self) -> None:
+		"""
+		Forgets the text on the display, so that the next text is sent even if it matches.
+
+		This should be called when something other than the scheduler may have changed the display,
+		such as when a different screen reader becomes active.
+		"""
+		with self._lock:
+			self._shown = None
+
+	def cancel(self) -> None:
+		"""Discards the pending text."""
+		with self._lock:
+			self._cancel_timer()
+			self._pending = None
@@ -0,0 +1,213 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Chunking speech."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import logging
+import threading
+from collections import deque
+
+# Local Modules:
+from .base import CALLBACK_BEGIN, CALLBACK_CANCEL, BaseSpeech, Priority, SpeechEventSourceType
+from .text import DEFAULT_MAX_LENGTH, split_text
+
+
+# Constants:
+POLL_INTERVAL: float = 0.05  # Seconds between speaking checks for backends which don't report events.
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ChunkingSpeech(BaseSpeech):
+	"""
+	Wraps a Speech instance so that long text is spoken as a stream of short chunks.
+
+	Text longer than max_length is split at sentence, then clause, then word boundaries.
+	The first chunk is sent immediately, so it can be heard while the rest are held back.
+	If the backend reports speech events (I.E. Speech Dispatcher), the next chunk is sent
+	as soon as the previous one begins, keeping one chunk ready in the backend.
+	Otherwise, the next chunk is sent when the backend stops speaking.
+	Silencing discards the chunks which haven't been sent.
+	"""
+
+	def __init__(
+		self,
+		speech: BaseSpeech,
+		*,
+		max_length: int = DEFAULT_MAX_LENGTH,
+		poll_interval: float = POLL_INTERVAL,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to wrap.
+			max_length: The maximum number of characters sent in a single call.
+			poll_interval: Seconds between speaking checks for backends which don't report events.
+
+		Raises:
+			ValueError: Max_length is less than 1.
+		"""
+		if max_length < 1:
+			raise ValueError("max_length must be at least 1.")
+		self.speech: BaseSpeech = speech
+		self.max_length: int = max_length
+		self.poll_interval: float = poll_interval
+		self._chunks: deque[tuple[str, Priority]] = deque()
+		self._ready: bool = False
+		self._closed: bool = False
+		self._condition: threading.Condition = threading.Condition(threading.RLock())
+		# Serializes calls to the wrapped Speech instance, so chunks are sent in order.
+		self._send_lock: threading.Lock = threading.Lock()
+		self._event_source: SpeechEventSourceType | None = None
+		if isinstance(speech, SpeechEventSourceType):
+			self._event_source = speech
+			speech.add_event_listener(self._on_event)
+		self._thread: threading.Thread = threading.Thread(
+			target=self._run, name="speechlight-chunking", daemon=True
+		)
+		self._thread.start()
+
+	def _on_event(self, event_type: str) -> None:
+		"""
+		Sends the next chunk when a message begins or is cancelled.
+
+		Note:
+			Speech Dispatcher delivers events on the thread which also receives its replies,
+			so the condition is never held while calling the wrapped Speech instance.
+
+		Args:
+			event_type: The event type.
+		"""
+		if event_type in {CALLBACK_BEGIN, CALLBACK_CANCEL}:
+			with self._condition:
+				self._ready = True
+				self._condition.notify_all()
+
+	def _run(self) -> None:
+		"""Sends held back chunks to the wrapped Speech instance until closed."""
+		polling: bool = self._event_source is None
+		while True:
+			with self._condition:
+				self._condition.wait_for(
+					lambda: self._closed or (bool(self._chunks) and (self._ready or polling))
+				)
+				if self._closed:
+					return
+				if polling:
+					# Give the backend time to start speaking the previous chunk.
+					self._condition.wait(self.poll_interval)
+			self._send_next(polling=polling)
+
+	def _send_next(self, *, polling: bool) -> None:
+		"""
+		Sends the next held back chunk, if the wrapped Speech instance is ready for it.
+
+		Args:
+			polling: True if readiness is determined by polling the wrapped Speech instance.
+		"""
+		with self._send_lock:
+			if polling and self.speech.speaking():
+				return
+			with self._condition:
+				if self._closed or not self._chunks or not (polling or self._ready):
+					return
+				self._ready = False
+				text, priority = self._chunks.popleft()
+			try:
+				self.speech.say(text, priority=priority)
+			except Exception:
+				logger.exception("Sending chunk failed.")
+
+	def _speak(self, text: str, *, interrupt: bool, priority: Priority, braille: bool) -> None:
+		"""
+		Splits text into chunks, sending the first and holding back the rest.
+
+		If earlier chunks are still held back, all chunks are held back so they are spoken in order.
+
+		Args:
+			text: The text to be spoken.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the message.
+			braille: True if the text should also be brailled.
+		"""
+		chunks: list[str] = split_text(text, self.max_length) if len(text) > self.max_length else [text]
+		with self._send_lock:
+			with self._condition:
+				if interrupt:
+					self._chunks.clear()
+				first: str | None = None
+				if self._chunks:
+					self._chunks.extend((chunk, priority) for chunk in chunks)
+				elif chunks:
+					first = chunks[0]
+					self._chunks.extend((chunk, priority) for chunk in chunks[1:])
+					self._ready = False
+				self._condition.notify_all()
+			if first is not None and braille and len(chunks) == 1:
+				self.speech.output(text, interrupt=interrupt, priority=priority)
+				return
+			if first is not None:
+				self.speech.say(first, interrupt=interrupt, priority=priority)
+		if braille:
+			self.speech.braille(text)
+
+	def close(self, timeout: float | None = None) -> None:
+		"""
+		Stops the worker thread, discarding held back chunks.
+
+		Args:
+			timeout: The maximum number of seconds to wait for the worker thread.
+		"""
+		with self._condition:
+			self._closed = True
+			self._chunks.clear()
+			self._condition.notify_all()
+			event_source, self._event_source = self._event_source, None
+		if event_source is not None:
+			event_source.remove_event_listener(self._on_event)
+		self._thread.join(timeout)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self.speech.braille(text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._speak(text, interrupt=interrupt, priority=priority, braille=True)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._speak(text, interrupt=interrupt, priority=priority, braille=False)
+
+	def silence(self) -> None:  # NOQA: D102
+		with self._send_lock:
+			with self._condition:
+				self._chunks.clear()
+			self.speech.silence()
+
+	def speaking(self) -> bool:  # NOQA: D102
+		with self._condition:
+			if self._chunks:
+				return True
+		return self.speech.speaking()
@@ -0,0 +1,266 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Coalescing speech."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from typing import cast
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+BRAILLE: str = "braille"
+OUTPUT: str = "output"
+SAY: str = "say"
+DEFAULT_WINDOW: float = 0.05  # Seconds to buffer text before it is sent.
+DEFAULT_MAX_PENDING: int = 256  # The maximum number of buffered messages before the oldest is dropped.
+DEFAULT_SEPARATOR: str = "\n"  # Inserted between merged messages.
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CoalescingSpeech(BaseSpeech):
+	"""
+	Wraps a Speech instance so that messages arriving close together are sent as a single call.
+
+	Messages are buffered for a short window, then adjacent messages of the same kind and priority are merged.
+	An optional budget limits the number of calls per second passed to the wrapped instance;
+	while the budget is exhausted, messages keep accumulating and are merged into the next call.
+	Interrupting calls bypass the window, discarding buffered messages.
+	The wrapped instance is never called with the buffer's lock held, so buffering a message
+	doesn't wait behind a slow call.
+	"""
+
+	def __init__(
+		self,
+		speech: BaseSpeech,
+		*,
+		window: float = DEFAULT_WINDOW,
+		max_rate: float | None = None,
+		max_pending: int = DEFAULT_MAX_PENDING,
+		separator: str = DEFAULT_SEPARATOR,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to wrap.
+			window: The number of seconds to buffer messages before sending them.
+			max_rate: The maximum calls per second passed to the wrapped instance, or None for no limit.
+			max_pending: The maximum number of buffered messages before the oldest is dropped.
+			separator: The text inserted between merged messages.
+
+		Raises:
+			ValueError: Max_rate is not positive, or max_pending is less than 1.
+		"""
+		if max_rate is not None and max_rate <= 0:
+			raise ValueError("max_rate must be positive.")
+		if max_pending < 1:
+			raise ValueError("max_pending must be at least 1.")
+		self.speech: BaseSpeech = speech
+		self.window: float = window
+		self.max_rate: float | None = max_rate
+		self.separator: str = separator
+		self.sent: int = 0
+		self.merged: int = 0
+		self.dropped: int = 0
+		# Kind, priority, and text. The oldest message is dropped when a message is added to a full buffer.
+		self._buffer: deque[tuple[str, Priority, str]] = deque(maxlen=max_pending)
+		self._tokens: float = max(1.0, max_rate or 0.0)
+		self._refill_time: float = time.monotonic()
+		self._timer: threading.Timer | None = None
+		self._lock: threading.RLock = threading.RLock()
+		# Serializes calls to the wrapped Speech instance, so messages are sent in order.
+		self._send_lock: threading.Lock = threading.Lock()
+
+	def _schedule(self, delay: float) -> None:
+		"""
+		Schedules a flush, unless one is already scheduled.
+
+		Args:
+			delay: The number of seconds until the flush.
+		"""
+		if self._timer is None:
+			self._timer = threading.Timer(delay, self._on_timer)
+			self._timer.daemon = True
+			self._timer.start()
+
+	def _cancel_timer(self) -> None:
+		"""Cancels a scheduled flush."""
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+
+	def _on_timer(self) -> None:
+		"""Flushes the buffer when the window expires."""
+		try:
+			with self._lock:
+				self._timer = None
+			self._send()
+		except Exception:
+			logger.exception("Sending coalesced speech failed.")
+
+	def _take_token(self) -> float:
+		"""
+		Takes a token from the rate budget.
+
+		Returns:
+			Zero if a token was taken, otherwise the number of seconds until one is available.
+		"""
+		if self.max_rate is None:
+			return 0.0
+		now: float = time.monotonic()
+		capacity: float = max(1.0, self.max_rate)
+		self._tokens = min(capacity, self._tokens + (now - self._refill_time) * self.max_rate)
+		self._refill_time = now
+		if self._tokens >= 1.0:
+			self._tokens -= 1.0
+			return 0.0
+		return (1.0 - self._tokens) / self.max_rate
+
+	def _add(self, kind: str, text: str, priority: Priority = Priority.TEXT) -> None:
+		"""
+		Buffers a message.
+
+		Args:
+			kind: The kind of message (BRAILLE, OUTPUT, or SAY).
+			text: The message text.
+			priority: The priority of the message.
+		"""
+		with self._lock:
+			if len(self._buffer) == self.max_pending:
+				self.dropped += 1
+			self._buffer.append((kind, priority, text))
+			self._schedule(self.window)
+
+	def _discard(self) -> None:
+		"""Discards buffered messages."""
+		self._cancel_timer()
+		self.dropped += len(self._buffer)
+		self._buffer.clear()
+
+	def _take(self, *, budget: bool) -> list[Callable[[], object]]:
+		"""
+		Removes the buffered messages which may be sent now, merging adjacent messages.
+
+		The lock must be held by the caller.
+
+		Args:
+			budget: True if sending is subject to the rate budget, False to send everything now.
+
+		Returns:
+			The calls to make to the wrapped Speech instance.
+		"""
+		calls: list[Callable[[], object]] = []
+		while self._buffer:
+			delay: float = self._take_token() if budget else 0.0
+			if delay:
+				self._schedule(delay)
+				break
+			kind, priority, text = self._buffer.popleft()
+			texts: list[str] = [text]
+			while self._buffer and self._buffer[0][:2] == (kind, priority):
+				texts.append(self._buffer.popleft()[2])
+			self.merged += len(texts) - 1
+			self.sent += 1
+			if kind == BRAILLE:
+				# Braille displays only show one message, so the latest wins.
+				calls.append(partial(self.speech.braille, texts[-1]))
+			elif kind == OUTPUT:
+				calls.append(partial(self.speech.output, self.separator.join(texts), priority=priority))
+			else:
+				calls.append(partial(self.speech.say, self.separator.join(texts), priority=priority))
+		return calls
+
+	def _send(self, *, budget: bool = True) -> None:
+		"""
+		Sends buffered messages.
+
+		Args:
+			budget: True if sending is subject to the rate budget, False to send everything now.
+		"""
+		with self._send_lock:
+			with self._lock:
+				calls: list[Callable[[], object]] = self._take(budget=budget)
+			for call in calls:
+				call()
+
+	@property
+	def max_pending(self) -> int:
+		"""The maximum number of buffered messages before the oldest is dropped."""
+		return cast("int", self._buffer.maxlen)
+
+	def flush(self) -> None:
+		"""Sends buffered messages now, subject to the rate budget."""
+		self._send()
+
+	def close(self) -> None:
+		"""Cancels the scheduled flush and sends buffered messages, ignoring the rate budget."""
+		with self._lock:
+			self._cancel_timer()
+		self._send(budget=False)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self._add(BRAILLE, text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		if interrupt:
+			with self._send_lock:
+				with self._lock:
+					self._discard()
+					self.sent += 1
+				self.speech.output(text, interrupt=True, priority=priority)
+		else:
+			self._add(OUTPUT, text, priority)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		if interrupt:
+			with self._send_lock:
+				with self._lock:
+					self._discard()
+					self.sent += 1
+				self.speech.say(text, interrupt=True, priority=priority)
+		else:
+			self._add(SAY, text, priority)
+
+	def silence(self) -> None:  # NOQA: D102
+		with self._send_lock:
+			with self._lock:
+				self._discard()
+			self.speech.silence()
+
+	def speaking(self) -> bool:  # NOQA: D102
+		with self._lock:
+			if self._buffer:
+				return True
+		return self.speech.speaking()
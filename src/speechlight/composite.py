@@ -0,0 +1,320 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Composite speech."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Callable, Collection, Iterable
+from functools import partial
+from typing import Any
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+BRAILLE: str = "braille"
+SPEECH: str = "speech"
+CHANNELS: frozenset[str] = frozenset((BRAILLE, SPEECH))
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _Child:
+	"""A Speech instance managed by a composite, with the worker thread which calls it."""
+
+	__slots__ = ("channels", "executor", "pending", "speech")
+
+	def __init__(self, speech: BaseSpeech, channels: frozenset[str]) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance.
+			channels: The channels routed to the Speech instance.
+		"""
+		self.speech: BaseSpeech = speech
+		self.channels: frozenset[str] = channels
+		self.executor: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(
+			max_workers=1, thread_name_prefix="speechlight-composite"
+		)
+		self.pending: set[concurrent.futures.Future[None]] = set()
+
+
+class CompositeSpeech(BaseSpeech):
+	"""
+	Routes calls to several Speech instances by channel.
+
+	Each child receives the speech channel, the braille channel, or both.
+	Say calls go to speech children, braille calls go to braille children, and output calls go to both,
+	with each child receiving only the part of the output for its channels.
+	Every child has its own worker thread, which makes its calls in order,
+	so a slow child doesn't delay the others. Calls return once they are queued;
+	use wait to block until the children have finished.
+	Interrupting calls discard the calls still waiting for each speech child.
+	A call is queued for all of its children at once, so calls reach every child in the same order,
+	and a child which is being added or removed receives all of a call or none of it.
+	Calls made after close are ignored.
+	"""
+
+	def __init__(self, children: Iterable[tuple[BaseSpeech, Collection[str]]] = ()) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			children: Pairs of a Speech instance and the channels routed to it.
+		"""
+		self.dropped: int = 0
+		self.errors: int = 0
+		self._children: list[_Child] = []
+		self._closed: bool = False
+		self._lock: threading.RLock = threading.RLock()  # Reentrant, as cancelling a call runs its callbacks.
+		for speech, channels in children:
+			self.add(speech, channels)
+
+	@property
+	def children(self) -> list[tuple[BaseSpeech, frozenset[str]]]:
+		"""The child Speech instances and the channels routed to them."""
+		with self._lock:
+			return [(child.speech, child.channels) for child in self._children]
+
+	def add(self, speech: BaseSpeech, channels: Collection[str] = CHANNELS) -> None:
+		"""
+		Adds a child.
+
+		Args:
+			speech: The Speech instance.
+			channels: The channels routed to it (BRAILLE, SPEECH, or both).
+
+		Raises:
+			ValueError: No channels were given, or a channel is unknown.
+			RuntimeError: The composite is closed.
+		"""
+		channel_set: frozenset[str] = frozenset(channels)
+		if not channel_set or not channel_set <= CHANNELS:
+			raise ValueError(f"channels must be a non-empty subset of {sorted(CHANNELS)}.")
+		with self._lock:
+			if self._closed:
+				raise RuntimeError("The composite is closed.")
+			self._children.append(_Child(speech, channel_set))
+
+	def remove(self, speech: BaseSpeech) -> None:
+		"""
+		Removes a child, after its queued calls have been made.
+
+		Args:
+			speech: The Speech instance.
+
+		Raises:
+			ValueError: The Speech instance isn't a child.
+		"""
+		with self._lock:
+			for child in self._children:
+				if child.speech is speech:
+					self._children.remove(child)
+					break
+			else:
+				raise ValueError("The Speech instance is not a child.")
+		child.executor.shutdown(wait=True)
+
+	def _children_for(self, channel: str) -> list[_Child]:
+		"""
+		Retrieves the children which receive a channel.
+
+		Args:
+			channel: The channel.
+
+		Returns:
+			The children.
+		"""
+		with self._lock:
+			return [child for child in self._children if channel in child.channels]
+
+	def _call(self, child: _Child, call: Callable[[], object]) -> None:
+		"""
+		Makes a call on a child's worker thread, logging its failure.
+
+		Args:
+			child: The child which the call is made to.
+			call: The call.
+		"""
+		try:
+			call()
+		except Exception:
+			with self._lock:
+				self.errors += 1
+			logger.exception(f"Composite speech call to {child.speech!r} failed.")
+
+	def _on_done(self, child: _Child, future: concurrent.futures.Future[None]) -> None:
+		"""
+		Forgets a finished or cancelled call.
+
+		Args:
+			child: The child which the call was made to.
+			future: The call.
+		"""
+		with self._lock:
+			child.pending.discard(future)
+
+	def _submit(self, child: _Child, call: Callable[[], object], *, interrupt: bool = False) -> None:
+		"""
+		Queues a call for a child's worker thread.
+
+		The lock must be held by the caller, so that a call is queued for all of its children at once.
+
+		Args:
+			child: The child.
+			call: The call.
+			interrupt: True if the child's queued calls should be discarded first.
+		"""
+		with self._lock:
+			if self._closed:
+				return
+			if interrupt:
+				for pending in list(child.pending):
+					if pending.cancel():
+						self.dropped += 1
+			future: concurrent.futures.Future[None] = child.executor.submit(self._call, child, call)
+			child.pending.add(future)
+		future.add_done_callback(partial(self._on_done, child))
+
+	def wait(self, timeout: float | None = None) -> bool:
+		"""
+		Waits until the calls queued so far have been made.
+
+		Args:
+			timeout: The most seconds to wait, or None to wait indefinitely.
+
+		Returns:
+			True if all calls were made, False if the timeout expired first.
+		"""
+		with self._lock:
+			futures: list[concurrent.futures.Future[None]] = [
+				future for child in self._children for future in child.pending
+			]
+		return not concurrent.futures.wait(futures, timeout).not_done
+
+	def close(self) -> None:
+		"""Makes the queued calls, then stops the worker threads."""
+		with self._lock:
+			self._closed = True
+			children: list[_Child] = list(self._children)
+		for child in children:
+			child.executor.shutdown(wait=True)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		with self._lock:
+			for child in self._children_for(BRAILLE):
+				self._submit(child, partial(child.speech.braille, text))
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		with self._lock:
+			for child in self._children:
+				speech: BaseSpeech = child.speech
+				if child.channels == CHANNELS:
+					call: Callable[[], Any] = partial(
+						speech.output, text, interrupt=interrupt, priority=priority
+					)
+				elif SPEECH in child.channels:
+					call = partial(speech.say, text, interrupt=interrupt, priority=priority)
+				else:
+					call = partial(speech.braille, text)
+				self._submit(child, call, interrupt=interrupt and SPEECH in child.channels)
+
+	def output_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks and brailles several texts in order.
+
+		Children which receive both channels get a single output_many call,
+		so that backends which batch messages can do so.
+
+		Args:
+			texts: The output texts.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		texts = list(texts)
+		with self._lock:
+			for child in self._children:
+				speech: BaseSpeech = child.speech
+				if child.channels == CHANNELS:
+					call: Callable[[], Any] = partial(
+						speech.output_many, texts, interrupt=interrupt, priority=priority
+					)
+				elif SPEECH in child.channels:
+					call = partial(speech.say_many, texts, interrupt=interrupt, priority=priority)
+				else:
+					call = partial(self._braille_many, speech, texts)
+				self._submit(child, call, interrupt=interrupt and SPEECH in child.channels)
+
+	@staticmethod
+	def _braille_many(speech: BaseSpeech, texts: Iterable[str]) -> None:
+		"""
+		Brailles several texts in order.
+
+		Args:
+			speech: The Speech instance.
+			texts: The texts to braille.
+		"""
+		for text in texts:
+			speech.braille(text)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		with self._lock:
+			for child in self._children_for(SPEECH):
+				call = partial(child.speech.say, text, interrupt=interrupt, priority=priority)
+				self._submit(child, call, interrupt=interrupt)
+
+	def say_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		texts = list(texts)
+		with self._lock:
+			for child in self._children_for(SPEECH):
+				call = partial(child.speech.say_many, texts, interrupt=interrupt, priority=priority)
+				self._submit(child, call, interrupt=interrupt)
+
+	def silence(self) -> None:  # NOQA: D102
+		with self._lock:
+			for child in self._children_for(SPEECH):
+				self._submit(child, child.speech.silence, interrupt=True)
+
+	def speaking(self) -> bool:
+		"""
+		Determines if any speech child is speaking.
+
+		Returns:
+			True if a speech child has queued calls or is speaking, False otherwise.
+		"""
+		children: list[_Child] = self._children_for(SPEECH)
+		with self._lock:
+			if any(child.pending for child in children):
+				return True
+		return any(child.speech.speaking() for child in children)
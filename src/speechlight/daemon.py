@@ -0,0 +1,711 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+A speech daemon which lets several processes share one Speech instance over a local socket.
+
+The server listens on a UNIX domain socket where available, or on the loopback interface otherwise.
+The socket file is created in a directory which only the current user can access.
+On the loopback interface, which any local user can connect to, the first line a client sends must be
+a JSON object containing the token which the server writes to a file in that directory.
+Requests are JSON objects, one per line, containing a method name and its arguments.
+A request which contains an id receives a response with the same id, containing either a result or an error.
+All other requests are pipelined without waiting for a response.
+
+Usage:
+	python -m speechlight.daemon [--address ADDRESS]
+"""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import argparse
+import concurrent.futures
+import contextlib
+import errno
+import hmac
+import itertools
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeAlias
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+AddressType: TypeAlias = "str | tuple[str, int]"  # A UNIX domain socket path, or a host and port.
+LOOPBACK: str = "127.0.0.1"
+DEFAULT_PORT: int = 47474  # The port used when UNIX domain sockets aren't available.
+DEFAULT_TIMEOUT: float = 2.0  # Seconds to wait when connecting, or for a response.
+DEFAULT_MAXSIZE: int = 1024  # The maximum number of unsent requests before the oldest is dropped.
+PRIVATE_MODE: int = 0o700  # The mode of the directory which holds the socket file and token.
+POLL_INTERVAL: float = 0.1  # Seconds between the server's checks for a shutdown request.
+ENCODING: str = "utf-8"
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def runtime_directory() -> Path:
+	"""
+	Determines the directory which holds the daemon's socket file and token.
+
+	Returns:
+		A directory for the current user, in the user's runtime directory.
+	"""
+	directory: str = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+	if hasattr(os, "getuid"):
+		return Path(directory) / f"speechlight-{os.getuid()}"
+	return Path(directory) / "speechlight"  # pragma: no cover
+
+
+def make_private_directory(path: Path) -> None:
+	"""
+	Creates a directory which only the current user can access, if it doesn't exist.
+
+	Args:
+		path: The directory.
+
+	Raises:
+		PermissionError: The directory exists, and another user owns it or can access it.
+	"""
+	path.mkdir(mode=PRIVATE_MODE, parents=True, exist_ok=True)
+	if hasattr(os, "getuid"):
+		status: os.stat_result = path.stat()
+		if status.st_uid != os.getuid() or status.st_mode & 0o077:
+			raise PermissionError(errno.EACCES, "The directory is accessible by other users", str(path))
+
+
+def token_path(address: tuple[str, int]) -> Path:
+	"""
+	Determines the file which holds the token of a daemon listening on the loopback interface.
+
+	Args:
+		address: The daemon's host and port.
+
+	Returns:
+		The path of the token file.
+	"""
+	return runtime_directory() / f"token-{address[1]}"
+
+
+def default_address() -> AddressType:
+	"""
+	Determines the address the daemon listens on by default.
+
+	Returns:
+		A socket path in the runtime directory, or a loopback address if
+		UNIX domain sockets aren't available.
+	"""
+	if hasattr(socket, "AF_UNIX"):
+		return str(runtime_directory() / "daemon.sock")
+	return (LOOPBACK, DEFAULT_PORT)  # pragma: no cover
+
+
+def parse_address(value: str) -> AddressType:
+	"""
+	Converts an address from the command line.
+
+	Args:
+		value: A socket path, or a 'host:port' pair.
+
+	Returns:
+		The address.
+	"""
+	host, separator, port = value.rpartition(":")
+	if separator and port.isdigit():
+		return (host or LOOPBACK, int(port))
+	return value
+
+
+def encode(message: dict[str, Any]) -> bytes:
+	"""
+	Encodes a protocol message.
+
+	Args:
+		message: The message.
+
+	Returns:
+		The message as a line of JSON.
+	"""
+	return json.dumps(message, separators=(",", ":")).encode(ENCODING) + b"\n"
+
+
+def dispatch(speech: BaseSpeech, request: Any) -> Any:
+	"""
+	Calls the method of a Speech instance named in a request.
+
+	Args:
+		speech: The Speech instance.
+		request: The decoded request.
+
+	Returns:
+		The result of the method.
+
+	Raises:
+		TypeError: The request isn't a JSON object.
+		ValueError: The method is unknown.
+	"""
+	if not isinstance(request, dict):
+		raise TypeError("Requests must be JSON objects.")
+	method: str = request["method"]
+	interrupt: bool = bool(request.get("interrupt"))
+	priority: Priority = Priority(request.get("priority", Priority.TEXT))
+	if method == "braille":
+		speech.braille(request["text"])
+	elif method in {"output", "say"}:
+		getattr(speech, method)(request["text"], interrupt=interrupt, priority=priority)
+	elif method in {"output_many", "say_many"}:
+		getattr(speech, method)(request["texts"], interrupt=interrupt, priority=priority)
+	elif method == "silence":
+		speech.silence()
+	elif method == "speaking":
+		return speech.speaking()
+	else:
+		raise ValueError(f"Unknown method: {method!r}")
+	return None
+
+
+def connect(address: AddressType, timeout: float | None = DEFAULT_TIMEOUT) -> socket.socket:
+	"""
+	Connects to a speech daemon.
+
+	Args:
+		address: The daemon's address.
+		timeout: The number of seconds to wait for the connection, or None to wait indefinitely.
+
+	Returns:
+		The connected socket, in blocking mode.
+
+	Raises:
+		OSError: The connection failed.
+	"""
+	if isinstance(address, str):
+		sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		try:
+			sock.settimeout(timeout)
+			sock.connect(address)
+		except OSError:
+			sock.close()
+			raise
+	else:
+		sock = socket.create_connection(address, timeout=timeout)
+	sock.settimeout(None)
+	return sock
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+	"""Passes the requests received over one connection to the speech server."""
+
+	def __init__(self, *args: Any, speech_server: SpeechServer) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			*args: Positional arguments to be passed to the base class.
+			speech_server: The speech server which handles requests.
+		"""
+		self.speech_server: SpeechServer = speech_server
+		super().__init__(*args)
+
+	def handle(self) -> None:
+		"""Handles requests until the client disconnects."""
+		try:
+			if not self.speech_server.authenticate(self.rfile):
+				logger.warning("Speech daemon client sent an invalid token.")
+				return
+			for line in self.rfile:
+				response: bytes | None = self.speech_server.handle(line)
+				if response is not None:
+					self.wfile.write(response)
+		except OSError as e:
+			logger.debug(f"Speech daemon client disconnected: {e}")
+
+
+if hasattr(socket, "AF_UNIX"):
+
+	class _UnixServer(socketserver.ThreadingUnixStreamServer):
+		daemon_threads: bool = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+	daemon_threads: bool = True
+	allow_reuse_address: bool = True
+
+
+class SpeechServer:
+	"""
+	Serves a Speech instance to clients over a local socket.
+
+	Each connection is handled by its own thread, but requests are passed to the Speech instance
+	one at a time, so messages from all clients share one ordered queue.
+	A socket path's directory is created if it doesn't exist, and must only be accessible by the current user.
+	When listening on the loopback interface, clients must send the token written to token_path.
+	"""
+
+	def __init__(self, speech: BaseSpeech, address: AddressType | None = None) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to serve.
+			address: A socket path, or a host and port, or None for the default address.
+				A port of 0 selects a free port.
+
+		Raises:
+			OSError: Another daemon is listening, the token couldn't be written, or the socket path's
+				directory or the runtime directory is accessible by other users.
+		"""
+		self.speech: BaseSpeech = speech
+		self.address: AddressType = default_address() if address is None else address
+		self.requests: int = 0
+		self.errors: int = 0
+		self._lock: threading.Lock = threading.Lock()
+		self._thread: threading.Thread | None = None
+		self.token: str | None = None
+		handler = partial(_RequestHandler, speech_server=self)
+		self._server: socketserver.BaseServer
+		if isinstance(self.address, str):
+			# No other user can reach the socket file inside a private directory.
+			make_private_directory(Path(self.address).parent)
+			self._remove_stale_socket(self.address)
+			self._server = _UnixServer(self.address, handler)
+		else:
+			make_private_directory(runtime_directory())
+			self._server = _TCPServer(self.address, handler)
+			self.address = (self.address[0], int(self._server.server_address[1]))
+			self.token = secrets.token_hex(16)
+			try:
+				self._write_token(token_path(self.address), self.token)
+			except OSError:
+				self._server.server_close()
+				raise
+
+	@staticmethod
+	def _write_token(path: Path, token: str) -> None:
+		"""
+		Writes the token to a file which only the current user can read.
+
+		Args:
+			path: The path of the token file.
+			token: The token.
+		"""
+		descriptor: int = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+		try:
+			os.write(descriptor, token.encode(ENCODING))
+		finally:
+			os.close(descriptor)
+
+	def authenticate(self, reader: Iterable[bytes]) -> bool:
+		"""
+		Checks the token a client sends before its requests.
+
+		Args:
+			reader: The lines received from the client.
+
+		Returns:
+			True if the client sent the token, or no token is required, False otherwise.
+		"""
+		if self.token is None:
+			return True
+		line: bytes = next(iter(reader), b"")
+		try:
+			message: Any = json.loads(line)
+		except ValueError:
+			return False
+		token: Any = message.get("token") if isinstance(message, dict) else None
+		return isinstance(token, str) and hmac.compare_digest(token, self.token)
+
+	@staticmethod
+	def _remove_stale_socket(path: str) -> None:
+		"""
+		Removes a socket file left behind by a daemon which didn't shut down cleanly.
+
+		Args:
+			path: The socket path.
+
+		Raises:
+			OSError: Another daemon is listening on the socket.
+		"""
+		if not Path(path).exists():
+			return
+		try:
+			connect(path).close()
+		except OSError:
+			Path(path).unlink(missing_ok=True)
+		else:
+			raise OSError(errno.EADDRINUSE, "A speech daemon is already listening", path)
+
+	def handle(self, line: bytes) -> bytes | None:
+		"""
+		Handles a request.
+
+		Args:
+			line: The request, as a line of JSON.
+
+		Returns:
+			The encoded response, or None if the request has no id.
+		"""
+		request_id: Any = None
+		with self._lock:
+			self.requests += 1
+			try:
+				request: Any = json.loads(line)
+				if isinstance(request, dict):
+					request_id = request.get("id")
+				result: Any = dispatch(self.speech, request)
+			except Exception as e:
+				self.errors += 1
+				logger.exception("Speech daemon request failed.")
+				response: dict[str, Any] = {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+			else:
+				response = {"id": request_id, "result": result}
+		return None if request_id is None else encode(response)
+
+	def serve_forever(self) -> None:
+		"""Handles connections until closed."""
+		self._server.serve_forever(POLL_INTERVAL)
+
+	def start(self) -> None:
+		"""Handles connections in a background thread."""
+		if self._thread is None:
+			self._thread = threading.Thread(target=self.serve_forever, name="speechlight-daemon", daemon=True)
+			self._thread.start()
+
+	def close(self) -> None:
+		"""Stops handling connections, and removes the socket file."""
+		if self._thread is not None:
+			self._server.shutdown()
+			self._thread.join()
+			self._thread = None
+		self._server.server_close()
+		if isinstance(self.address, str):
+			Path(self.address).unlink(missing_ok=True)
+		else:
+			token_path(self.address).unlink(missing_ok=True)
+
+
+class SpeechClient(BaseSpeech):
+	"""
+	Sends speech to a speech daemon.
+
+	Calls to braille, output, say, and silence return immediately after being queued.
+	A writer thread sends queued requests to the daemon, several at a time when they build up,
+	without waiting for responses. If the daemon is unavailable, queued requests are dropped,
+	and the connection is retried with the next request. Requests which wait for a response
+	are never discarded by an interrupt, and fail as soon as they are dropped.
+	"""
+
+	def __init__(
+		self,
+		address: AddressType | None = None,
+		*,
+		timeout: float = DEFAULT_TIMEOUT,
+		maxsize: int = DEFAULT_MAXSIZE,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			address: The daemon's address, or None for the default address.
+			timeout: The number of seconds to wait when connecting, or for a response.
+			maxsize: The maximum number of unsent requests before the oldest is dropped.
+
+		Raises:
+			ValueError: Maxsize is less than 1.
+		"""
+		if maxsize < 1:
+			raise ValueError("maxsize must be at least 1.")
+		self.address: AddressType = default_address() if address is None else address
+		self.timeout: float = timeout
+		self.maxsize: int = maxsize
+		self.sent: int = 0
+		self.dropped: int = 0
+		self._outgoing: deque[tuple[bytes, int | None]] = deque()  # Encoded requests, and their IDs.
+		self._responses: dict[int, concurrent.futures.Future[Any]] = {}
+		self._ids: itertools.count[int] = itertools.count(1)
+		self._socket: socket.socket | None = None
+		self._closed: bool = False
+		self._condition: threading.Condition = threading.Condition()
+		self._thread: threading.Thread = threading.Thread(
+			target=self._run, name="speechlight-client", daemon=True
+		)
+		self._thread.start()
+
+	def _connect(self) -> socket.socket:
+		"""
+		Connects to the daemon, and starts a thread which reads its responses.
+
+		When connecting over the loopback interface, the daemon's token is sent first.
+
+		Returns:
+			The connected socket.
+
+		Raises:
+			OSError: The connection failed, or the token couldn't be read or sent.
+		"""
+		sock: socket.socket = connect(self.address, self.timeout)
+		if not isinstance(self.address, str):
+			try:
+				token: str = token_path(self.address).read_text(encoding=ENCODING)
+				sock.sendall(encode({"token": token}))
+			except OSError:
+				sock.close()
+				raise
+		with self._condition:
+			self._socket = sock
+		threading.Thread(
+			target=self._read, args=(sock,), name="speechlight-client-reader", daemon=True
+		).start()
+		return sock
+
+	def _disconnect(self, sock: socket.socket | None) -> None:
+		"""
+		Closes a connection, failing requests which are waiting for a response.
+
+		Args:
+			sock: The socket to close, or None if the connection couldn't be opened.
+		"""
+		with self._condition:
+			if self._socket is sock:
+				self._socket = None
+			responses: list[concurrent.futures.Future[Any]] = list(self._responses.values())
+			self._responses.clear()
+		if sock is not None:
+			sock.close()
+		for future in responses:
+			future.set_exception(ConnectionError("Disconnected from the speech daemon."))
+
+	def _resolve(self, response: dict[str, Any]) -> None:
+		"""
+		Passes a response to the request waiting for it.
+
+		Args:
+			response: The decoded response.
+		"""
+		with self._condition:
+			future: concurrent.futures.Future[Any] | None = self._responses.pop(response["id"], None)
+		if future is None:
+			return
+		if "error" in response:
+			future.set_exception(RuntimeError(response["error"]))
+		else:
+			future.set_result(response["result"])
+
+	def _read(self, sock: socket.socket) -> None:
+		"""
+		Reads responses from the daemon until disconnected.
+
+		Args:
+			sock: The connected socket.
+		"""
+		try:
+			with sock.makefile("rb") as reader:
+				for line in reader:
+					self._resolve(json.loads(line))
+		except (OSError, ValueError) as e:
+			logger.debug(f"Reading from the speech daemon failed: {e}")
+		finally:
+			self._disconnect(sock)
+
+	def _run(self) -> None:
+		"""Sends queued requests until closed."""
+		while True:
+			with self._condition:
+				while not self._outgoing and not self._closed:
+					self._condition.wait()
+				if not self._outgoing:
+					return
+				batch: list[bytes] = [line for line, _ in self._outgoing]
+				self._outgoing.clear()
+				sock: socket.socket | None = self._socket
+			try:
+				if sock is None:
+					sock = self._connect()
+				sock.sendall(b"".join(batch))
+			except OSError as e:
+				logger.debug(f"Sending to the speech daemon failed: {e}")
+				with self._condition:
+					self.dropped += len(batch)
+				self._disconnect(sock)
+			else:
+				with self._condition:
+					self.sent += len(batch)
+
+	def _send(self, method: str, *, interrupt: bool = False, **kwargs: Any) -> None:
+		"""
+		Queues a request.
+
+		Args:
+			method: The name of the method to call on the daemon's Speech instance.
+			interrupt: True if the speech should be silenced before speaking.
+			**kwargs: The method's arguments.
+		"""
+		if interrupt:
+			kwargs["interrupt"] = True
+		self._enqueue(encode({"method": method, **kwargs}), interrupt=interrupt)
+
+	def _enqueue(self, line: bytes, *, interrupt: bool = False, request_id: int | None = None) -> None:
+		"""
+		Adds an encoded request to the outgoing queue.
+
+		Args:
+			line: The encoded request.
+			interrupt: True if unsent requests should be discarded first.
+				Requests which wait for a response are kept.
+			request_id: The ID of the request, or None if it doesn't wait for a response.
+		"""
+		with self._condition:
+			if self._closed:
+				return
+			if interrupt:
+				kept: deque[tuple[bytes, int | None]] = deque(
+					item for item in self._outgoing if item[1] is not None
+				)
+				self.dropped += len(self._outgoing) - len(kept)
+				self._outgoing = kept
+			elif len(self._outgoing) >= self.maxsize:
+				_, dropped_id = self._outgoing.popleft()
+				self.dropped += 1
+				future: concurrent.futures.Future[Any] | None = (
+					None if dropped_id is None else self._responses.pop(dropped_id, None)
+				)
+				if future is not None:
+					future.set_exception(RuntimeError("The request was dropped, as the queue was full."))
+			self._outgoing.append((line, request_id))
+			self._condition.notify_all()
+
+	def request(self, method: str, **kwargs: Any) -> Any:
+		"""
+		Calls a method on the daemon's Speech instance, and waits for the result.
+
+		Args:
+			method: The method name.
+			**kwargs: The method's arguments.
+
+		Returns:
+			The result of the method.
+
+		Raises:
+			RuntimeError: The client is closed.
+			TimeoutError: The daemon didn't respond in time.
+		"""
+		future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+		with self._condition:
+			if self._closed:
+				raise RuntimeError("The speech daemon client is closed.")
+			request_id: int = next(self._ids)
+			self._responses[request_id] = future
+			self._enqueue(encode({"method": method, "id": request_id, **kwargs}), request_id=request_id)
+		try:
+			return future.result(self.timeout)
+		except concurrent.futures.TimeoutError:
+			with self._condition:
+				self._responses.pop(request_id, None)
+			raise TimeoutError(f"The speech daemon didn't respond to {method!r} in time.") from None
+
+	def close(self) -> None:
+		"""Sends queued requests, then disconnects from the daemon."""
+		with self._condition:
+			self._closed = True
+			self._condition.notify_all()
+		self._thread.join()
+		with self._condition:
+			sock: socket.socket | None = self._socket
+		if sock is not None:
+			# The reader thread closes the socket once the daemon sees the end of the stream.
+			with contextlib.suppress(OSError):
+				sock.shutdown(socket.SHUT_WR)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self._send("braille", text=text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._send("output", text=text, interrupt=interrupt, priority=priority.value)
+
+	def output_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		self._send("output_many", texts=list(texts), interrupt=interrupt, priority=priority.value)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._send("say", text=text, interrupt=interrupt, priority=priority.value)
+
+	def say_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		self._send("say_many", texts=list(texts), interrupt=interrupt, priority=priority.value)
+
+	def silence(self) -> None:  # NOQA: D102
+		self._send("silence", interrupt=True)
+
+	def speaking(self) -> bool:  # NOQA: D102
+		try:
+			return bool(self.request("speaking"))
+		except (ConnectionError, RuntimeError, TimeoutError) as e:
+			logger.debug(f"Querying the speech daemon failed: {e}")
+			return False
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+	"""
+	Runs a speech daemon for the selected backend.
+
+	Args:
+		argv: The command line arguments, or None to use sys.argv.
+	"""
+	parser = argparse.ArgumentParser(
+		description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+	)
+	parser.add_argument(
+		"--address",
+		type=parse_address,
+		default=None,
+		help="A socket path, or 'host:port' to listen on the network.",
+	)
+	args = parser.parse_args(argv)
+	from .registry import create  # NOQA: PLC0415
+
+	# Created through the registry, so that a pinned backend receives its registered arguments.
+	server: SpeechServer = SpeechServer(create(), args.address)
+	logger.info(f"Speech daemon listening on {server.address}.")
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.close()
+
+
+if __name__ == "__main__":
+	main()
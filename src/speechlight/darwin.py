@@ -26,10 +26,12 @@ from __future__ import annotations
 
 # Built-in Modules:
 import sys
+import threading
+from collections.abc import Iterable
 from typing import Any
 
 # Local Modules:
-from .base import BaseSpeech
+from .base import BaseSpeech, Priority
 
 
 if sys.platform == "darwin":  # pragma: no cover
@@ -37,12 +39,19 @@ if sys.platform == "darwin":  # pragma: no cover
 
 
 class Speech(BaseSpeech):
-	"""Implements Speech for Darwin."""
+	"""
+	Implements Speech for Darwin.
+
+	Calls to NSSpeechSynthesizer are serialized by a reentrant lock.
+	The lock is only held while a call starts or stops speech, as NSSpeechSynthesizer speaks asynchronously.
+	Braille isn't supported.
+	"""
 
 	_darwin: Any | None = None
 
 	def __init__(self) -> None:  # pragma: no cover
 		"""Defines the constructor."""
+		self._lock: threading.RLock = threading.RLock()
 		# Allocate and initialize the default TTS.
 		if sys.platform == "darwin":
 			self._darwin = NSSpeechSynthesizer.alloc().init()
@@ -50,22 +59,60 @@ class Speech(BaseSpeech):
 	def braille(self, text: str) -> None:  # NOQA: D102
 		pass
 
-	def output(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
-		self.say(text, interrupt=interrupt)
-		self.braille(text)
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		with self._lock:
+			self.say(text, interrupt=interrupt, priority=priority)
+			self.braille(text)
+
+	def output_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks and brailles several texts in order.
+
+		The texts are joined by line breaks, as NSSpeechSynthesizer stops speaking when given new text.
+
+		Args:
+			texts: The output texts.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		text: str = "\n".join(texts)
+		if text:
+			self.output(text, interrupt=interrupt, priority=priority)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		with self._lock:
+			if self._darwin is not None:
+				if interrupt:
+					self.silence()
+				self._darwin.startSpeakingString_(text)
+
+	def say_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks several texts in order.
+
+		The texts are joined by line breaks, as NSSpeechSynthesizer stops speaking when given new text.
 
-	def say(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
-		if self._darwin is not None:
-			if interrupt:
-				self.silence()
-			self._darwin.startSpeakingString_(text)
+		Args:
+			texts: The texts to be spoken.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		text: str = "\n".join(texts)
+		if text:
+			self.say(text, interrupt=interrupt, priority=priority)
 
 	def silence(self) -> None:  # NOQA: D102
-		if self._darwin is not None:
-			self._darwin.stopSpeaking()
+		with self._lock:
+			if self._darwin is not None:
+				self._darwin.stopSpeaking()
 
 	def speaking(self) -> bool:  # NOQA: D102
 		status = False
-		if self._darwin is not None:
-			status = bool(self._darwin.isSpeaking())
+		with self._lock:
+			if self._darwin is not None:
+				status = bool(self._darwin.isSpeaking())
 		return status
@@ -0,0 +1,324 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Deduplicating speech."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TypeAlias
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+OUTPUT: str = "output"
+SAY: str = "say"
+DEFAULT_WINDOW: float = 5.0  # Seconds during which repeats of a message are suppressed.
+DEFAULT_MAXSIZE: int = 256  # The maximum number of recent messages remembered.
+DEFAULT_COLLAPSE_FORMAT: str = "{text} (x{count})"  # The summary spoken for collapsed repeats.
+MessageType: TypeAlias = "tuple[str, str, Priority, bool]"  # Kind, text, priority, interrupt.
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+	"""A recently spoken message."""
+
+	__slots__ = ("kind", "priority", "repeats", "spoken")
+
+	def __init__(self, kind: str, priority: Priority, spoken: float) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			kind: The kind of the latest repeat (OUTPUT or SAY).
+			priority: The priority of the latest repeat.
+			spoken: The time the message was last spoken.
+		"""
+		self.kind: str = kind
+		self.priority: Priority = priority
+		self.spoken: float = spoken
+		self.repeats: int = 0  # Repeats suppressed since the message was last spoken.
+
+
+class DeduplicatingSpeech(BaseSpeech):
+	"""
+	Wraps a Speech instance so that repeats of recently spoken messages are suppressed.
+
+	A message which was spoken less than window seconds ago is not passed on.
+	If collapse is True, suppressed repeats are summarized when the window expires,
+	for example "You are hungry. (x3)".
+	Recently spoken messages are kept in a cache of limited size,
+	and the least recently seen are evicted first. The summary of an evicted message's
+	suppressed repeats is spoken when it is evicted.
+	Interrupting calls are always passed on.
+	The wrapped instance is never called with the cache's lock held, so a caller doesn't wait behind
+	a slow call in order to check the cache.
+	"""
+
+	def __init__(
+		self,
+		speech: BaseSpeech,
+		*,
+		window: float = DEFAULT_WINDOW,
+		maxsize: int = DEFAULT_MAXSIZE,
+		collapse: bool = False,
+		collapse_format: str = DEFAULT_COLLAPSE_FORMAT,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to wrap.
+			window: The number of seconds during which repeats of a message are suppressed.
+			maxsize: The maximum number of recently spoken messages to remember.
+			collapse: True if suppressed repeats should be summarized when the window expires.
+			collapse_format: The format of summaries, with text and count fields.
+
+		Raises:
+			ValueError: Window is negative, or maxsize is less than 1.
+		"""
+		if window < 0:
+			raise ValueError("window must not be negative.")
+		if maxsize < 1:
+			raise ValueError("maxsize must be at least 1.")
+		self.speech: BaseSpeech = speech
+		self.window: float = window
+		self.maxsize: int = maxsize
+		self.collapse: bool = collapse
+		self.collapse_format: str = collapse_format
+		self.hits: int = 0
+		self.misses: int = 0
+		self.evictions: int = 0
+		self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+		self._timer: threading.Timer | None = None
+		self._lock: threading.RLock = threading.RLock()
+
+	@property
+	def hit_rate(self) -> float:
+		"""The fraction of messages which were suppressed."""
+		total: int = self.hits + self.misses
+		return self.hits / total if total else 0.0
+
+	def _filter(self, kind: str, text: str, priority: Priority, *, interrupt: bool) -> list[MessageType]:
+		"""
+		Determines what should be spoken for a message.
+
+		The lock must be held by the caller.
+
+		Args:
+			kind: The kind of message (OUTPUT or SAY).
+			text: The message text.
+			priority: The priority of the message.
+			interrupt: True if the message interrupts speech.
+
+		Returns:
+			The messages to speak, which are empty if the message is a repeat which should be suppressed.
+		"""
+		now: float = time.monotonic()
+		entry: _CacheEntry | None = self._cache.get(text)
+		if entry is None:
+			self.misses += 1
+			self._cache[text] = _CacheEntry(kind, priority, now)
+			messages: list[MessageType] = []
+			if len(self._cache) > self.maxsize:
+				messages.extend(self._evict())
+			messages.append((kind, text, priority, interrupt))
+			return messages
+		self._cache.move_to_end(text)
+		if not interrupt and now - entry.spoken < self.window:
+			self.hits += 1
+			entry.kind = kind
+			entry.priority = priority
+			entry.repeats += 1
+			if self.collapse:
+				self._schedule(entry.spoken + self.window - now)
+			return []
+		self.misses += 1
+		count: int = entry.repeats + 1
+		entry.repeats = 0
+		entry.spoken = now
+		if self.collapse and count > 1:
+			return [(kind, self.collapse_format.format(text=text, count=count), priority, interrupt)]
+		return [(kind, text, priority, interrupt)]
+
+	def _evict(self) -> list[MessageType]:
+		"""
+		Removes the least recently seen message.
+
+		Returns:
+			The summary of the message's suppressed repeats, if there is one to speak.
+		"""
+		text, entry = self._cache.popitem(last=False)
+		self.evictions += 1
+		if self.collapse and entry.repeats:
+			return [(entry.kind, self._summary(text, entry), entry.priority, False)]
+		return []
+
+	def _summary(self, text: str, entry: _CacheEntry) -> str:
+		"""
+		Formats the summary of a message's suppressed repeats.
+
+		Args:
+			text: The message text.
+			entry: The message's cache entry.
+
+		Returns:
+			The summary.
+		"""
+		return self.collapse_format.format(text=text, count=entry.repeats + 1)
+
+	def _schedule(self, delay: float) -> None:
+		"""
+		Schedules summaries of collapsed repeats, unless already scheduled.
+
+		Args:
+			delay: The number of seconds until the summaries are due.
+		"""
+		if self._timer is None:
+			self._timer = threading.Timer(max(0.0, delay), self._on_timer)
+			self._timer.daemon = True
+			self._timer.start()
+
+	def _cancel_timer(self) -> None:
+		"""Cancels scheduled summaries."""
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+
+	def _on_timer(self) -> None:
+		"""Speaks summaries of repeats whose window has expired."""
+		try:
+			with self._lock:
+				self._timer = None
+				messages: list[MessageType] = self._summarize(force=False)
+			self._send(messages)
+		except Exception:
+			logger.exception("Speaking collapsed repeats failed.")
+
+	def _summarize(self, *, force: bool) -> list[MessageType]:
+		"""
+		Determines the summaries of collapsed repeats to speak.
+
+		The lock must be held by the caller.
+
+		Args:
+			force: True if summaries should be spoken before their window has expired.
+
+		Returns:
+			The summaries.
+		"""
+		now: float = time.monotonic()
+		messages: list[MessageType] = []
+		next_due: float | None = None
+		for text, entry in self._cache.items():
+			if not entry.repeats:
+				continue
+			due: float = entry.spoken + self.window
+			if force or due <= now:
+				summary: str = self._summary(text, entry)
+				entry.repeats = 0
+				entry.spoken = now
+				messages.append((entry.kind, summary, entry.priority, False))
+			elif next_due is None or due < next_due:
+				next_due = due
+		if next_due is not None:
+			self._schedule(next_due - now)
+		return messages
+
+	def _send(self, messages: list[MessageType]) -> None:
+		"""
+		Passes messages to the wrapped Speech instance.
+
+		The lock must not be held by the caller.
+
+		Args:
+			messages: The messages.
+		"""
+		for kind, text, priority, interrupt in messages:
+			if kind == OUTPUT:
+				self.speech.output(text, interrupt=interrupt, priority=priority)
+			else:
+				self.speech.say(text, interrupt=interrupt, priority=priority)
+
+	def _speak(self, kind: str, text: str, priority: Priority, *, interrupt: bool) -> None:
+		"""
+		Passes a message to the wrapped Speech instance, unless it is a repeat.
+
+		Args:
+			kind: The kind of message (OUTPUT or SAY).
+			text: The message text.
+			priority: The priority of the message.
+			interrupt: True if the speech should be silenced before speaking.
+		"""
+		with self._lock:
+			messages: list[MessageType] = self._filter(kind, text, priority, interrupt=interrupt)
+		self._send(messages)
+
+	def flush(self) -> None:
+		"""Speaks summaries of collapsed repeats now, without waiting for their window to expire."""
+		with self._lock:
+			self._cancel_timer()
+			messages: list[MessageType] = self._summarize(force=True)
+		self._send(messages)
+
+	def clear(self) -> None:
+		"""Forgets recently spoken messages, so the next occurrence of each is spoken."""
+		with self._lock:
+			self._cancel_timer()
+			self._cache.clear()
+
+	def close(self) -> None:
+		"""Cancels scheduled summaries."""
+		with self._lock:
+			self._cancel_timer()
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self.speech.braille(text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._speak(OUTPUT, text, priority, interrupt=interrupt)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._speak(SAY, text, priority, interrupt=interrupt)
+
+	def silence(self) -> None:
+		"""
+		Cancels speech and flushes the speech buffer.
+
+		Pending summaries of collapsed repeats are discarded.
+		"""
+		with self._lock:
+			self._cancel_timer()
+			for entry in self._cache.values():
+				entry.repeats = 0
+		self.speech.silence()
+
+	def speaking(self) -> bool:  # NOQA: D102
+		return self.speech.speaking()
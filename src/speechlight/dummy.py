@@ -19,31 +19,122 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Dummy speech."""
+"""
+Dummy speech.
+
+By default, calls return immediately and nothing is ever spoken.
+The backend can also simulate a real one, with call latency, speaking time, and failures,
+so that code which depends on speech timing can be exercised on any platform.
+"""
 
 # Future Modules:
 from __future__ import annotations
 
+# Built-in Modules:
+import random
+import threading
+import time
+
 # Local Modules:
-from .base import BaseSpeech
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+TYPICAL_RATE: float = 15.0  # Characters spoken per second by a typical synthesizer, about 180 words a minute.
+
+
+class SimulatedFailureError(OSError):
+	"""Raised by a call which the dummy backend was configured to fail."""
 
 
 class Speech(BaseSpeech):
-	"""Implements Speech for the dummy platform."""
+	"""
+	Implements Speech for the dummy platform.
+
+	The lock only guards the counters and the simulated speaking time.
+	Simulated latency is spent without holding it,
+	so concurrent calls overlap as they would with a real backend.
+	"""
+
+	def __init__(
+		self,
+		*,
+		latency: float = 0.0,
+		jitter: float = 0.0,
+		rate: float | None = None,
+		failure_rate: float = 0.0,
+		seed: int | None = None,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			latency: The number of seconds each call blocks for.
+			jitter: The most seconds added at random to the latency of each call.
+			rate: The number of characters spoken per second, or None if speech finishes instantly.
+				TYPICAL_RATE approximates a real synthesizer.
+			failure_rate: The probability that a call raises SimulatedFailureError, from 0 to 1.
+			seed: The seed for the random jitter and failures, or None for an unpredictable seed.
+
+		Raises:
+			ValueError: An argument is out of range.
+		"""
+		if latency < 0 or jitter < 0:
+			raise ValueError("latency and jitter must not be negative.")
+		if rate is not None and rate <= 0:
+			raise ValueError("rate must be positive.")
+		if not 0.0 <= failure_rate <= 1.0:
+			raise ValueError("failure_rate must be between 0 and 1.")
+		self.latency: float = latency
+		self.jitter: float = jitter
+		self.rate: float | None = rate
+		self.failure_rate: float = failure_rate
+		self.calls: int = 0
+		self.failures: int = 0
+		self._random: random.Random = random.Random(seed)  # NOQA: S311
+		self._speaking_until: float = 0.0
+		self._lock: threading.Lock = threading.Lock()
+
+	def _simulate_call(self) -> None:
+		"""
+		Simulates the cost of a call to a real backend.
+
+		Raises:
+			SimulatedFailureError: The call was chosen to fail.
+		"""
+		with self._lock:
+			self.calls += 1
+			delay: float = self.latency + (self._random.uniform(0.0, self.jitter) if self.jitter else 0.0)
+			failed: bool = bool(self.failure_rate) and self._random.random() < self.failure_rate
+			if failed:
+				self.failures += 1
+		if delay:
+			time.sleep(delay)
+		if failed:
+			raise SimulatedFailureError("Simulated speech failure.")
 
 	def braille(self, text: str) -> None:  # NOQA: D102
-		pass
+		self._simulate_call()
 
-	def output(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
-		self.say(text, interrupt=interrupt)
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self.say(text, interrupt=interrupt, priority=priority)
 		self.braille(text)
 
-	def say(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
 		if interrupt:
 			self.silence()
+		self._simulate_call()
+		if self.rate is not None:
+			with self._lock:
+				# Queued speech starts once the current utterance finishes.
+				start: float = max(time.monotonic(), self._speaking_until)
+				self._speaking_until = start + len(text) / self.rate
 
 	def silence(self) -> None:  # NOQA: D102
-		pass
+		self._simulate_call()
+		with self._lock:
+			self._speaking_until = 0.0
 
-	def speaking(self) -> bool:  # NOQA: D102, PLR6301
-		return False
+	def speaking(self) -> bool:  # NOQA: D102
+		with self._lock:
+			return time.monotonic() < self._speaking_until
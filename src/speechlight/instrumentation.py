@@ -0,0 +1,214 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Call statistics for Speech instances."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import bisect
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable, Collection
+from typing import Any, NamedTuple, ParamSpec, TypeVar
+
+
+# Constants:
+LATENCY_BUCKETS: tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)  # Seconds.
+
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class CallRecord(NamedTuple):
+	"""A single instrumented call, as passed to listeners."""
+
+	method: str
+	elapsed: float  # Seconds.
+	characters: int
+	error: BaseException | None
+
+
+class MethodStats:
+	"""Accumulated statistics for one method."""
+
+	__slots__ = ("calls", "characters", "errors", "histogram", "max_time", "total_time")
+
+	def __init__(self) -> None:
+		"""Defines the constructor."""
+		self.calls: int = 0
+		self.errors: int = 0
+		self.characters: int = 0
+		self.total_time: float = 0.0
+		self.max_time: float = 0.0
+		# One count per bucket in LATENCY_BUCKETS, plus one for calls slower than the last bucket.
+		self.histogram: list[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+
+	def add(self, record: CallRecord) -> None:
+		"""
+		Adds a call to the statistics.
+
+		Args:
+			record: The call.
+		"""
+		self.calls += 1
+		self.errors += record.error is not None
+		self.characters += record.characters
+		self.total_time += record.elapsed
+		self.max_time = max(self.max_time, record.elapsed)
+		self.histogram[bisect.bisect_left(LATENCY_BUCKETS, record.elapsed)] += 1
+
+	def as_dict(self) -> dict[str, Any]:
+		"""
+		Converts the statistics to a dict.
+
+		Returns:
+			The statistics. The histogram maps the upper bound of each bucket, in seconds, to a call count.
+		"""
+		return {
+			"calls": self.calls,
+			"errors": self.errors,
+			"characters": self.characters,
+			"total_time": self.total_time,
+			"max_time": self.max_time,
+			"mean_time": self.total_time / self.calls if self.calls else 0.0,
+			"histogram": dict(zip((*LATENCY_BUCKETS, float("inf")), self.histogram, strict=True)),
+		}
+
+
+def _characters(args: tuple[Any, ...], kwargs: dict[str, Any]) -> int:
+	"""
+	Counts the characters of the text passed to a Speech method.
+
+	Args:
+		args: The positional arguments of the call.
+		kwargs: The keyword arguments of the call.
+
+	Returns:
+		The number of characters, or 0 if the call wasn't passed text which can be counted.
+	"""
+	text: object = kwargs.get("text", kwargs.get("texts", args[0] if args else ""))
+	if isinstance(text, str):
+		return len(text)
+	if isinstance(text, Collection):
+		# Counting the items of an iterator would exhaust it before the call.
+		return sum(len(item) for item in text if isinstance(item, str))
+	return 0
+
+
+class Instrumentation:
+	"""
+	Records call counts, latencies, characters sent, and errors for the methods of a Speech instance.
+
+	Instrumentation is enabled with `BaseSpeech.enable_instrumentation`.
+	When it is not enabled, the methods of a Speech instance are not wrapped and have no added cost.
+	"""
+
+	def __init__(self) -> None:
+		"""Defines the constructor."""
+		self._stats: dict[str, MethodStats] = {}
+		self._listeners: list[Callable[[CallRecord], object]] = []
+		self._lock: threading.Lock = threading.Lock()
+
+	def add_listener(self, listener: Callable[[CallRecord], object]) -> None:
+		"""
+		Adds a function to be called after every instrumented call.
+
+		Args:
+			listener: A function which takes the call record.
+		"""
+		self._listeners.append(listener)
+
+	def remove_listener(self, listener: Callable[[CallRecord], object]) -> None:
+		"""
+		Removes a listener previously added with add_listener.
+
+		Args:
+			listener: The listener to remove.
+		"""
+		self._listeners.remove(listener)
+
+	def record(self, record: CallRecord) -> None:
+		"""
+		Adds a call to the statistics and notifies listeners.
+
+		Args:
+			record: The call.
+		"""
+		with self._lock:
+			stats: MethodStats | None = self._stats.get(record.method)
+			if stats is None:
+				stats = self._stats[record.method] = MethodStats()
+			stats.add(record)
+		for listener in tuple(self._listeners):
+			try:
+				listener(record)
+			except Exception:  # NOQA: PERF203
+				logger.exception(f"Instrumentation listener {listener!r} failed.")
+
+	def reset(self) -> None:
+		"""Clears the statistics."""
+		with self._lock:
+			self._stats.clear()
+
+	def snapshot(self) -> dict[str, dict[str, Any]]:
+		"""
+		Retrieves the statistics.
+
+		Returns:
+			A mapping of method names to their statistics.
+		"""
+		with self._lock:
+			return {method: stats.as_dict() for method, stats in self._stats.items()}
+
+	def wrap(self, method: str, func: Callable[_P, _T]) -> Callable[_P, _T]:
+		"""
+		Wraps a bound method so that its calls are recorded.
+
+		Args:
+			method: The name the calls are recorded under.
+			func: The bound method.
+
+		Returns:
+			The wrapped method.
+		"""
+
+		@functools.wraps(func)
+		def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+			characters: int = _characters(args, kwargs)
+			start: float = time.perf_counter()
+			try:
+				result: _T = func(*args, **kwargs)
+			except BaseException as e:
+				self.record(CallRecord(method, time.perf_counter() - start, characters, e))
+				raise
+			self.record(CallRecord(method, time.perf_counter() - start, characters, None))
+			return result
+
+		return wrapper
@@ -0,0 +1,241 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Text normalization."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import functools
+import re
+from collections.abc import Mapping
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+DEFAULT_CACHE_SIZE: int = 1024  # The number of normalized lines to remember.
+# Control sequences, such as colors and cursor movement.
+CSI_PATTERN: str = r"\x1b\[[0-?]*[ -/]*[@-~]"
+# Operating system commands, such as window titles.
+OSC_PATTERN: str = r"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)?"
+# Other escape sequences, such as character set selection.
+ESCAPE_PATTERN: str = r"\x1b[ -/]*[0-~]?"
+# Control characters, apart from tabs and line breaks.
+CONTROL_PATTERN: str = r"[\x00-\x08\x0b-\x1f\x7f]"
+ANSI_PATTERN: str = f"{CSI_PATTERN}|{OSC_PATTERN}|{ESCAPE_PATTERN}|{CONTROL_PATTERN}"
+# Runs of whitespace which contain line breaks.
+LINES_PATTERN: str = r"[ \t]*(?:\r?\n[ \t]*)+"
+# Runs of horizontal whitespace, other than single spaces which need no replacement.
+SPACE_PATTERN: str = r" [ \t]+|\t[ \t]*"
+# Runs of four or more of the same punctuation character, leaving ellipses intact.
+PUNCTUATION_PATTERN: str = r"(?P<punctuation_character>[^\w\s])(?P=punctuation_character){3,}"
+WORD_REGEX: re.Pattern[str] = re.compile(r"\w")
+
+
+class TextNormalizer:
+	"""
+	Cleans text before it is sent to a backend.
+
+	All enabled rules are compiled into a single regular expression, so text is normalized in one pass.
+	If whitespace is collapsed, it is collapsed again after escape sequences are removed and symbols
+	are replaced, as either can leave runs of whitespace behind.
+	Results are cached, as the same lines tend to be repeated.
+	"""
+
+	def __init__(
+		self,
+		*,
+		strip_ansi: bool = True,
+		collapse_whitespace: bool = True,
+		collapse_punctuation: bool = True,
+		symbols: Mapping[str, str] | None = None,
+		cache_size: int = DEFAULT_CACHE_SIZE,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			strip_ansi: True if ANSI/VT escape sequences and control characters should be removed.
+			collapse_whitespace: True if runs of spaces should be replaced by a single space,
+				and runs of line breaks by a single line break.
+			collapse_punctuation: True if runs of four or more of the same punctuation character
+				should be replaced by a single character.
+			symbols: A mapping of symbols to their replacements, for example {"&": "and"}.
+			cache_size: The number of normalized lines to remember.
+		"""
+		self.symbols: dict[str, str] = {symbol: value for symbol, value in (symbols or {}).items() if symbol}
+		patterns: list[str] = []
+		if strip_ansi:
+			patterns.append(f"(?P<ansi>{ANSI_PATTERN})")
+		if collapse_whitespace:
+			patterns.extend((f"(?P<lines>{LINES_PATTERN})", f"(?P<space>{SPACE_PATTERN})"))
+		if collapse_punctuation:
+			patterns.append(f"(?P<punctuation>{PUNCTUATION_PATTERN})")
+		if self.symbols:
+			# Longer symbols are tried first, so that they take precedence over their prefixes.
+			alternatives: str = "|".join(
+				re.escape(symbol) for symbol in sorted(self.symbols, key=len, reverse=True)
+			)
+			patterns.append(f"(?P<symbol>{alternatives})")
+		# Only symbols can start with a letter or digit. Guarding the alternatives with a lookahead means
+		# that the rest of the characters, which make up most text, are rejected with a single test.
+		word_starts: str = "".join(sorted({symbol[0] for symbol in self.symbols if WORD_REGEX.match(symbol)}))
+		guard: str = f"(?=\\W|[{word_starts}])" if word_starts else r"(?=\W)"
+		self._collapse_whitespace: bool = collapse_whitespace
+		self._whitespace_regex: re.Pattern[str] | None = None
+		if collapse_whitespace and (strip_ansi or self.symbols):
+			self._whitespace_regex = re.compile(f"(?P<lines>{LINES_PATTERN})|(?P<space>{SPACE_PATTERN})")
+		self._regex: re.Pattern[str] | None = (
+			re.compile(f"{guard}(?:{'|'.join(patterns)})") if patterns else None
+		)
+		self._cached_normalize: functools._lru_cache_wrapper[str] = functools.lru_cache(maxsize=cache_size)(
+			self._normalize
+		)
+
+	def _replace(self, match: re.Match[str]) -> str:
+		"""
+		Determines the replacement for a match.
+
+		Args:
+			match: The match.
+
+		Returns:
+			The replacement.
+		"""
+		group: str | None = match.lastgroup
+		if group == "lines":
+			return "\n"
+		if group == "space":
+			return " "
+		if group == "punctuation":
+			return match.group("punctuation_character")
+		if group == "symbol":
+			return self.symbols[match.group()]
+		return ""
+
+	def _normalize(self, text: str) -> str:
+		"""
+		Normalizes text, without caching.
+
+		Args:
+			text: The text to normalize.
+
+		Returns:
+			The normalized text.
+		"""
+		if self._regex is not None:
+			text = self._regex.sub(self._replace, text)
+		if self._whitespace_regex is not None:
+			text = self._whitespace_regex.sub(self._replace, text)
+		return text.strip() if self._collapse_whitespace else text
+
+	def normalize(self, text: str) -> str:
+		"""
+		Normalizes text.
+
+		Args:
+			text: The text to normalize.
+
+		Returns:
+			The normalized text.
+		"""
+		return self._cached_normalize(text)
+
+	__call__ = normalize
+
+	def cache_info(self) -> functools._CacheInfo:
+		"""
+		Retrieves statistics for the cache of normalized lines.
+
+		Returns:
+			The hits, misses, maximum size, and current size of the cache.
+		"""
+		return self._cached_normalize.cache_info()
+
+	def cache_clear(self) -> None:
+		"""Forgets normalized lines."""
+		self._cached_normalize.cache_clear()
+
+
+class NormalizingSpeech(BaseSpeech):
+	"""
+	Wraps a Speech instance so that text is normalized before it is passed on.
+
+	Text which is empty after normalization, such as a line of escape sequences, is not passed on,
+	though speech is still silenced if the call was meant to interrupt it.
+	"""
+
+	def __init__(
+		self,
+		speech: BaseSpeech,
+		normalizer: TextNormalizer | None = None,
+		*,
+		braille_normalizer: TextNormalizer | None = None,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to wrap.
+			normalizer: The normalizer for spoken text, or None to use the default rules.
+			braille_normalizer: The normalizer for brailled text, or None to strip escape sequences
+				and collapse whitespace only, as symbol replacements are meant for speech.
+		"""
+		self.speech: BaseSpeech = speech
+		self.normalizer: TextNormalizer = normalizer or TextNormalizer()
+		self.braille_normalizer: TextNormalizer = braille_normalizer or TextNormalizer(
+			collapse_punctuation=False
+		)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		text = self.braille_normalizer(text)
+		if text:
+			self.speech.braille(text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		spoken: str = self.normalizer(text)
+		brailled: str = self.braille_normalizer(text)
+		if not spoken:
+			if interrupt:
+				self.speech.silence()
+		elif spoken == brailled:
+			self.speech.output(spoken, interrupt=interrupt, priority=priority)
+			return
+		else:
+			self.speech.say(spoken, interrupt=interrupt, priority=priority)
+		if brailled:
+			self.speech.braille(brailled)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		text = self.normalizer(text)
+		if text:
+			self.speech.say(text, interrupt=interrupt, priority=priority)
+		elif interrupt:
+			self.speech.silence()
+
+	def silence(self) -> None:  # NOQA: D102
+		self.speech.silence()
+
+	def speaking(self) -> bool:  # NOQA: D102
+		return self.speech.speaking()
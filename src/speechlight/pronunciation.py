@@ -0,0 +1,435 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pronunciation dictionaries."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+COMMENT_PREFIX: str = "#"
+SEPARATOR: str = "="
+DEFAULT_RELOAD_INTERVAL: float = 2.0  # Seconds between checks for modified dictionary files.
+
+
+class _Entry(NamedTuple):
+	"""A pronunciation dictionary entry."""
+
+	pattern: str
+	replacement: str
+	whole_word: bool
+	case_sensitive: bool
+
+
+def _lower(text: str) -> str:
+	"""
+	Converts text to lower case, without changing its length.
+
+	Args:
+		text: The text to convert.
+
+	Returns:
+		The converted text. Characters whose lower case form has a different length are left unchanged.
+	"""
+	lowered: str = text.lower()
+	if len(lowered) == len(text):
+		return lowered
+	return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def _is_word_character(char: str) -> bool:
+	"""
+	Determines if a character is part of a word.
+
+	Args:
+		char: The character.
+
+	Returns:
+		True if the character is alphanumeric or an underscore, False otherwise.
+	"""
+	return char.isalnum() or char == "_"
+
+
+class PronunciationDictionary:
+	"""
+	Replaces words and phrases with text which the speech synthesizer pronounces correctly.
+
+	Entries are compiled into an Aho-Corasick automaton, so text is rewritten in a single pass
+	regardless of the number of entries. Where matches overlap, the leftmost is used,
+	and of those starting at the same position, the longest.
+	Adding or removing entries updates the automaton in place, rather than rebuilding it from scratch.
+	"""
+
+	def __init__(
+		self,
+		entries: Mapping[str, str] | None = None,
+		*,
+		whole_word: bool = True,
+		case_sensitive: bool = False,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			entries: A mapping of patterns to their replacements.
+			whole_word: The default for whether patterns only match whole words.
+			case_sensitive: The default for whether patterns match case sensitively.
+		"""
+		self.whole_word: bool = whole_word
+		self.case_sensitive: bool = case_sensitive
+		self._entries: dict[str, _Entry] = {}
+		# The automaton. Node 0 is the root.
+		self._goto: list[dict[str, int]] = [{}]
+		self._fail: list[int] = [0]
+		self._outputs: list[list[_Entry]] = [[]]
+		self._output_link: list[int] = [0]  # The nearest node along the failure chain with outputs.
+		self._dirty: bool = False
+		self._files: dict[Path, tuple[int, dict[str, str]]] = {}  # Path: (modification time, entries).
+		self._lock: threading.RLock = threading.RLock()
+		if entries:
+			self.update(entries)
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def __contains__(self, pattern: object) -> bool:
+		return pattern in self._entries
+
+	def add(
+		self,
+		pattern: str,
+		replacement: str,
+		*,
+		whole_word: bool | None = None,
+		case_sensitive: bool | None = None,
+	) -> None:
+		"""
+		Adds an entry, replacing any existing entry for the pattern.
+
+		Args:
+			pattern: The text to be replaced.
+			replacement: The text to replace it with.
+			whole_word: True if the pattern only matches whole words, or None to use the dictionary default.
+			case_sensitive: True if the pattern matches case sensitively,
+				or None to use the dictionary default.
+
+		Raises:
+			ValueError: The pattern is empty.
+		"""
+		if not pattern:
+			raise ValueError("pattern must not be empty.")
+		entry: _Entry = _Entry(
+			pattern,
+			replacement,
+			self.whole_word if whole_word is None else whole_word,
+			self.case_sensitive if case_sensitive is None else case_sensitive,
+		)
+		with self._lock:
+			self.remove(pattern)
+			node: int = 0
+			for char in _lower(pattern):
+				child: int | None = self._goto[node].get(char)
+				if child is None:
+					child = len(self._goto)
+					self._goto[node][char] = child
+					self._goto.append({})
+					self._fail.append(0)
+					self._outputs.append([])
+					self._output_link.append(0)
+					self._dirty = True
+				node = child
+			# Case sensitive entries are more specific, so take precedence over others with the same pattern.
+			if entry.case_sensitive:
+				self._outputs[node].insert(0, entry)
+			else:
+				self._outputs[node].append(entry)
+			self._entries[pattern] = entry
+			self._dirty = True
+
+	def update(self, entries: Mapping[str, str]) -> None:
+		"""
+		Adds several entries, using the dictionary defaults.
+
+		Args:
+			entries: A mapping of patterns to their replacements.
+		"""
+		with self._lock:
+			for pattern, replacement in entries.items():
+				self.add(pattern, replacement)
+
+	def remove(self, pattern: str) -> None:
+		"""
+		Removes an entry, if it exists.
+
+		Args:
+			pattern: The pattern of the entry.
+		"""
+		with self._lock:
+			entry: _Entry | None = self._entries.pop(pattern, None)
+			if entry is None:
+				return
+			node: int = 0
+			for char in _lower(pattern):
+				node = self._goto[node][char]
+			self._outputs[node].remove(entry)
+			self._dirty = True
+
+	def clear(self) -> None:
+		"""Removes all entries, and forgets loaded files."""
+		with self._lock:
+			self._entries.clear()
+			self._files.clear()
+			self._goto = [{}]
+			self._fail = [0]
+			self._outputs = [[]]
+			self._output_link = [0]
+			self._dirty = False
+
+	def _link(self) -> None:
+		"""Computes the failure and output links of the automaton, after entries have changed."""
+		queue: deque[int] = deque()
+		for child in self._goto[0].values():
+			self._fail[child] = 0
+			self._output_link[child] = 0
+			queue.append(child)
+		while queue:
+			node: int = queue.popleft()
+			for char, child in self._goto[node].items():
+				fail: int = self._fail[node]
+				while fail and char not in self._goto[fail]:
+					fail = self._fail[fail]
+				self._fail[child] = self._goto[fail].get(char, 0)
+				fail = self._fail[child]
+				self._output_link[child] = fail if self._outputs[fail] else self._output_link[fail]
+				queue.append(child)
+		self._dirty = False
+
+	@staticmethod
+	def _accepts(entry: _Entry, text: str, start: int, end: int) -> bool:
+		"""
+		Determines if an entry matches text, taking its case and whole word options into account.
+
+		Args:
+			entry: The entry.
+			text: The text.
+			start: The start of the match.
+			end: The end of the match.
+
+		Returns:
+			True if the entry matches, False otherwise.
+		"""
+		if entry.case_sensitive and text[start:end] != entry.pattern:
+			return False
+		return not entry.whole_word or (
+			(start == 0 or not _is_word_character(text[start - 1]))
+			and (end == len(text) or not _is_word_character(text[end]))
+		)
+
+	def apply(self, text: str) -> str:
+		"""
+		Replaces the patterns in text.
+
+		Args:
+			text: The text.
+
+		Returns:
+			The text with patterns replaced.
+		"""
+		with self._lock:
+			if not self._entries:
+				return text
+			if self._dirty:
+				self._link()
+			goto, fail, outputs, output_link = self._goto, self._fail, self._outputs, self._output_link
+			# The longest match starting at each position: the start, mapped to the end and entry.
+			matches: dict[int, tuple[int, _Entry]] = {}
+			node: int = 0
+			for end, char in enumerate(_lower(text), 1):
+				while node and char not in goto[node]:
+					node = fail[node]
+				node = goto[node].get(char, 0)
+				match: int = node if outputs[node] else output_link[node]
+				while match:
+					for entry in outputs[match]:
+						start: int = end - len(entry.pattern)
+						current: tuple[int, _Entry] | None = matches.get(start)
+						if (current is None or current[0] < end) and self._accepts(entry, text, start, end):
+							matches[start] = (end, entry)
+					match = output_link[match]
+		result: list[str] = []
+		position: int = 0
+		# Starting from the left, use the longest match which doesn't overlap the previous one.
+		for start in sorted(matches):
+			if start >= position:
+				end, entry = matches[start]
+				result.extend((text[position:start], entry.replacement))
+				position = end
+		result.append(text[position:])
+		return "".join(result)
+
+	__call__ = apply
+
+	@staticmethod
+	def _read(path: Path) -> dict[str, str]:
+		"""
+		Reads entries from a dictionary file.
+
+		Args:
+			path: The path of the file.
+
+		Returns:
+			A mapping of patterns to their replacements.
+
+		Raises:
+			ValueError: A line isn't a comment and doesn't contain a separator.
+		"""
+		entries: dict[str, str] = {}
+		with path.open(encoding="utf-8") as file_obj:
+			for line_number, line in enumerate(file_obj, 1):
+				line = line.strip()  # NOQA: PLW2901
+				if not line or line.startswith(COMMENT_PREFIX):
+					continue
+				pattern, separator, replacement = line.partition(SEPARATOR)
+				if not separator or not pattern.strip():
+					raise ValueError(f"{path}, line {line_number}: expected pattern{SEPARATOR}replacement.")
+				entries[pattern.strip()] = replacement.strip()
+		return entries
+
+	def load(self, path: str | os.PathLike[str]) -> None:
+		"""
+		Loads entries from a dictionary file.
+
+		Each line of the file contains a pattern and its replacement, separated by an equals sign.
+		Blank lines and lines starting with a hash sign are ignored. Entries use the dictionary defaults.
+		When a file is loaded again, only the entries which changed since the last load are updated.
+
+		Args:
+			path: The path of the file.
+		"""
+		file_path: Path = Path(path).resolve()
+		mtime: int = file_path.stat().st_mtime_ns
+		entries: dict[str, str] = self._read(file_path)
+		with self._lock:
+			previous: dict[str, str] = self._files.get(file_path, (0, {}))[1]
+			for pattern in previous.keys() - entries.keys():
+				self.remove(pattern)
+			for pattern, replacement in entries.items():
+				if previous.get(pattern) != replacement:
+					self.add(pattern, replacement)
+			self._files[file_path] = (mtime, entries)
+
+	def reload(self) -> bool:
+		"""
+		Loads dictionary files which were modified since they were last loaded.
+
+		Returns:
+			True if any files were loaded, False otherwise.
+		"""
+		reloaded: bool = False
+		with self._lock:
+			for path, (mtime, _) in tuple(self._files.items()):
+				try:
+					modified: bool = path.stat().st_mtime_ns != mtime
+				except FileNotFoundError:
+					continue
+				if modified:
+					self.load(path)
+					reloaded = True
+		return reloaded
+
+
+class PronunciationSpeech(BaseSpeech):
+	"""
+	Wraps a Speech instance so that spoken text is passed through a pronunciation dictionary.
+
+	Brailled text is left unchanged.
+	Dictionary files are checked for modifications at most every reload_interval seconds, when text is spoken.
+	"""
+
+	def __init__(
+		self,
+		speech: BaseSpeech,
+		dictionary: PronunciationDictionary,
+		*,
+		reload_interval: float | None = DEFAULT_RELOAD_INTERVAL,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance to wrap.
+			dictionary: The pronunciation dictionary.
+			reload_interval: Seconds between checks for modified dictionary files, or None to disable checks.
+		"""
+		self.speech: BaseSpeech = speech
+		self.dictionary: PronunciationDictionary = dictionary
+		self.reload_interval: float | None = reload_interval
+		self._last_reload: float = time.monotonic()
+
+	def _apply(self, text: str) -> str:
+		"""
+		Passes text through the dictionary, reloading modified dictionary files first if due.
+
+		Args:
+			text: The text.
+
+		Returns:
+			The text with patterns replaced.
+		"""
+		if self.reload_interval is not None:
+			now: float = time.monotonic()
+			if now - self._last_reload >= self.reload_interval:
+				self._last_reload = now
+				self.dictionary.reload()
+		return self.dictionary.apply(text)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self.speech.braille(text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		spoken: str = self._apply(text)
+		if spoken == text:
+			self.speech.output(text, interrupt=interrupt, priority=priority)
+		else:
+			self.speech.say(spoken, interrupt=interrupt, priority=priority)
+			self.speech.braille(text)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self.speech.say(self._apply(text), interrupt=interrupt, priority=priority)
+
+	def silence(self) -> None:  # NOQA: D102
+		self.speech.silence()
+
+	def speaking(self) -> bool:  # NOQA: D102
+		return self.speech.speaking()
@@ -0,0 +1,220 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Queued speech."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from functools import partial
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+
+
+# Constants:
+DEFAULT_MAXSIZE: int = 1024  # The maximum number of pending calls before one is dropped.
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class QueuedSpeech(BaseSpeech):
+	"""
+	Wraps a Speech instance so that calls are passed to it by a worker thread.
+
+	Calls to braille, output, say, and silence return immediately after being queued.
+	Pending calls are passed on in priority order, and in the order they were made within a priority,
+	so urgent messages jump the queue without interrupting speech.
+	When the queue is full, a call which is more urgent than a pending call replaces the oldest
+	of the least urgent pending calls. Otherwise, the new call is dropped.
+	Callers only hold the queue's lock while adding a call, so they never wait behind a slow backend call.
+	"""
+
+	def __init__(self, speech: BaseSpeech, *, maxsize: int = DEFAULT_MAXSIZE) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			speech: The Speech instance which will receive the queued calls.
+			maxsize: The maximum number of pending calls.
+
+		Raises:
+			ValueError: Maxsize is less than 1.
+		"""
+		if maxsize < 1:
+			raise ValueError("maxsize must be at least 1.")
+		self.speech: BaseSpeech = speech
+		self.maxsize: int = maxsize
+		self.dropped: int = 0
+		# Pending calls in the order they were made, by priority from most to least urgent.
+		self._pending: dict[Priority, deque[Callable[[], object]]] = {
+			priority: deque() for priority in Priority
+		}
+		self._size: int = 0  # The number of pending calls.
+		self._busy: bool = False
+		self._closed: bool = False
+		self._condition: threading.Condition = threading.Condition()
+		self._thread: threading.Thread = threading.Thread(
+			target=self._run, name="speechlight-queue", daemon=True
+		)
+		self._thread.start()
+
+	def _run(self) -> None:
+		"""Passes queued calls to the wrapped Speech instance until closed."""
+		while True:
+			with self._condition:
+				while not self._size and not self._closed:
+					self._condition.wait()
+				if not self._size:
+					return
+				urgent: deque[Callable[[], object]] = next(calls for calls in self._pending.values() if calls)
+				call: Callable[[], object] = urgent.popleft()
+				self._size -= 1
+				self._busy = True
+			try:
+				call()
+			except Exception:
+				logger.exception("Queued speech call failed.")
+			finally:
+				with self._condition:
+					self._busy = False
+					self._condition.notify_all()
+
+	def _put(
+		self, call: Callable[[], object], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Adds a call to the queue.
+
+		Args:
+			call: The call to be queued.
+			interrupt: True if pending calls should be discarded first.
+			priority: The priority of the call.
+		"""
+		with self._condition:
+			if self._closed:
+				return
+			if interrupt:
+				self.dropped += self._clear()
+			elif self._size >= self.maxsize:
+				self.dropped += 1
+				least_urgent: Priority = next(
+					level for level, calls in reversed(self._pending.items()) if calls
+				)
+				if priority.rank >= least_urgent.rank:
+					# The new call is no more urgent than any pending call.
+					return
+				# Drop the oldest of the least urgent calls.
+				self._pending[least_urgent].popleft()
+				self._size -= 1
+			self._pending[priority].append(call)
+			self._size += 1
+			self._condition.notify_all()
+
+	def _clear(self) -> int:
+		"""
+		Discards pending calls.
+
+		The condition must be held by the caller.
+
+		Returns:
+			The number of discarded calls.
+		"""
+		count: int = self._size
+		for calls in self._pending.values():
+			calls.clear()
+		self._size = 0
+		return count
+
+	def flush(self) -> int:
+		"""
+		Discards pending calls which haven't been passed to the wrapped Speech instance.
+
+		Returns:
+			The number of discarded calls.
+		"""
+		with self._condition:
+			count: int = self._clear()
+			self._condition.notify_all()
+			return count
+
+	def join(self, timeout: float | None = None) -> bool:
+		"""
+		Waits until all pending calls have been passed to the wrapped Speech instance.
+
+		Args:
+			timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+		Returns:
+			True if the queue is empty, False if the timeout expired.
+		"""
+		with self._condition:
+			return self._condition.wait_for(lambda: not self._size and not self._busy, timeout)
+
+	def close(self, timeout: float | None = None) -> None:
+		"""
+		Stops the worker thread after pending calls have been processed.
+
+		Args:
+			timeout: The maximum number of seconds to wait for the worker thread.
+		"""
+		with self._condition:
+			self._closed = True
+			self._condition.notify_all()
+		self._thread.join(timeout)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self._put(partial(self.speech.braille, text))
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		call = partial(self.speech.output, text, interrupt=interrupt, priority=priority)
+		self._put(call, interrupt=interrupt, priority=priority)
+
+	def output_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		call = partial(self.speech.output_many, tuple(texts), interrupt=interrupt, priority=priority)
+		self._put(call, interrupt=interrupt, priority=priority)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		call = partial(self.speech.say, text, interrupt=interrupt, priority=priority)
+		self._put(call, interrupt=interrupt, priority=priority)
+
+	def say_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		call = partial(self.speech.say_many, tuple(texts), interrupt=interrupt, priority=priority)
+		self._put(call, interrupt=interrupt, priority=priority)
+
+	def silence(self) -> None:  # NOQA: D102
+		self._put(self.speech.silence, interrupt=True, priority=Priority.IMPORTANT)
+
+	def speaking(self) -> bool:  # NOQA: D102
+		with self._condition:
+			if self._size or self._busy:
+				return True
+		return self.speech.speaking()
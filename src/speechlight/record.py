@@ -0,0 +1,287 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Recording and replaying speech.
+
+A journal holds one JSON object per line, in the speech daemon's request format,
+with the time of the call in seconds since the epoch added under the key 't'.
+
+Usage:
+	python -m speechlight.record JOURNAL [--speed SPEED] [--max-delay SECONDS]
+"""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import argparse
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+# Local Modules:
+from .base import BaseSpeech, Priority
+from .daemon import dispatch, encode
+
+
+class ReplayResult(NamedTuple):
+	"""The outcome of replaying a journal."""
+
+	calls: int  # The number of calls replayed.
+	elapsed: float  # Seconds taken to replay the journal.
+	max_lag: float  # The most seconds a call was made later than its scheduled time.
+
+	@property
+	def throughput(self) -> float:
+		"""Calls replayed per second."""
+		return self.calls / self.elapsed if self.elapsed else 0.0
+
+
+class RecordingSpeech(BaseSpeech):
+	"""
+	Records calls to a journal, optionally passing them on to a wrapped Speech instance.
+
+	Entries are appended to the journal as calls are made, so a session which ends abruptly
+	loses at most the call being recorded.
+	"""
+
+	def __init__(self, journal: str | Path | IO[str], speech: BaseSpeech | None = None) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			journal: The path of the journal to append to, or a text stream.
+			speech: The Speech instance which receives the calls, or None to only record them.
+		"""
+		self.speech: BaseSpeech | None = speech
+		self.recorded: int = 0
+		self._owns_stream: bool = isinstance(journal, (str, Path))
+		self._stream: IO[str] = (
+			Path(journal).open("a", encoding="utf-8", buffering=1)  # NOQA: SIM115
+			if isinstance(journal, (str, Path))
+			else journal
+		)
+		self._lock: threading.Lock = threading.Lock()
+
+	def _record(
+		self, method: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT, **kwargs: Any
+	) -> None:
+		"""
+		Appends a call to the journal.
+
+		Arguments with their default values are left out, to keep the journal compact.
+
+		Args:
+			method: The method name.
+			interrupt: The interrupt argument of the call.
+			priority: The priority argument of the call.
+			**kwargs: The other arguments of the call.
+		"""
+		entry: dict[str, Any] = {"t": round(time.time(), 6), "method": method, **kwargs}
+		if interrupt:
+			entry["interrupt"] = True
+		if priority is not Priority.TEXT:
+			entry["priority"] = priority.value
+		with self._lock:
+			self._stream.write(encode(entry).decode("utf-8"))
+			self.recorded += 1
+
+	def flush(self) -> None:
+		"""Writes buffered entries to the journal."""
+		with self._lock:
+			self._stream.flush()
+
+	def close(self) -> None:
+		"""Closes the journal, if it was opened by this instance."""
+		with self._lock:
+			if self._owns_stream:
+				self._stream.close()
+			else:
+				self._stream.flush()
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		self._record("braille", text=text)
+		if self.speech is not None:
+			self.speech.braille(text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._record("output", text=text, interrupt=interrupt, priority=priority)
+		if self.speech is not None:
+			self.speech.output(text, interrupt=interrupt, priority=priority)
+
+	def output_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		texts = list(texts)
+		self._record("output_many", texts=texts, interrupt=interrupt, priority=priority)
+		if self.speech is not None:
+			self.speech.output_many(texts, interrupt=interrupt, priority=priority)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self._record("say", text=text, interrupt=interrupt, priority=priority)
+		if self.speech is not None:
+			self.speech.say(text, interrupt=interrupt, priority=priority)
+
+	def say_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		texts = list(texts)
+		self._record("say_many", texts=texts, interrupt=interrupt, priority=priority)
+		if self.speech is not None:
+			self.speech.say_many(texts, interrupt=interrupt, priority=priority)
+
+	def silence(self) -> None:  # NOQA: D102
+		self._record("silence")
+		if self.speech is not None:
+			self.speech.silence()
+
+	def speaking(self) -> bool:  # NOQA: D102
+		return self.speech is not None and self.speech.speaking()
+
+
+def _read_entries(stream: IO[str]) -> Iterator[dict[str, Any]]:
+	"""
+	Reads the entries of a journal from a text stream.
+
+	Args:
+		stream: The text stream.
+
+	Yields:
+		The journal entries, in the order they were recorded.
+
+	Raises:
+		ValueError: An entry is invalid.
+	"""
+	for line_number, line in enumerate(stream, 1):
+		if not line.strip():
+			continue
+		try:
+			entry: Any = json.loads(line)
+		except ValueError as e:
+			raise ValueError(f"Invalid journal entry on line {line_number}: {e}") from e
+		if not isinstance(entry, dict) or not isinstance(entry.get("t"), (int, float)):
+			raise ValueError(f"Invalid journal entry on line {line_number}: {line.strip()!r}")  # NOQA: TRY004
+		yield entry
+
+
+def read_journal(journal: str | Path | IO[str]) -> Iterator[dict[str, Any]]:
+	"""
+	Reads the entries of a journal.
+
+	Args:
+		journal: The path of the journal, or a text stream.
+
+	Yields:
+		The journal entries, in the order they were recorded.
+	"""
+	if isinstance(journal, (str, Path)):
+		with Path(journal).open(encoding="utf-8") as stream:
+			yield from _read_entries(stream)
+	else:
+		yield from _read_entries(journal)
+
+
+def replay(
+	journal: str | Path | Iterable[dict[str, Any]],
+	speech: BaseSpeech,
+	*,
+	speed: float | None = 1.0,
+	max_delay: float | None = None,
+) -> ReplayResult:
+	"""
+	Passes the calls recorded in a journal to a Speech instance.
+
+	Enable instrumentation on the Speech instance to measure the latency of each call.
+
+	Args:
+		journal: The path of the journal, or entries from read_journal.
+		speech: The Speech instance which receives the calls.
+		speed: A multiplier for the original pace, or None to make calls as fast as possible.
+		max_delay: The most seconds to wait between calls, or None for no limit.
+			This skips long idle periods, such as between sessions appended to the same journal.
+
+	Returns:
+		The outcome of the replay.
+
+	Raises:
+		ValueError: Speed is not positive.
+	"""
+	if speed is not None and speed <= 0:
+		raise ValueError("speed must be positive.")
+	entries: Iterable[dict[str, Any]] = read_journal(journal) if isinstance(journal, (str, Path)) else journal
+	calls: int = 0
+	max_lag: float = 0.0
+	start: float = time.monotonic()
+	scheduled: float = start
+	previous: float | None = None
+	for entry in entries:
+		if speed is not None:
+			if previous is not None:
+				delay: float = max(0.0, entry["t"] - previous) / speed
+				scheduled += delay if max_delay is None else min(delay, max_delay)
+			previous = entry["t"]
+			now: float = time.monotonic()
+			if scheduled > now:
+				time.sleep(scheduled - now)
+			else:
+				max_lag = max(max_lag, now - scheduled)
+		dispatch(speech, entry)
+		calls += 1
+	return ReplayResult(calls, time.monotonic() - start, max_lag)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+	"""
+	Replays a journal through the selected backend.
+
+	Args:
+		argv: The command line arguments, or None to use sys.argv.
+	"""
+	parser = argparse.ArgumentParser(
+		description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+	)
+	parser.add_argument("journal", type=Path, help="The journal to replay.")
+	parser.add_argument(
+		"--speed",
+		type=float,
+		default=None,
+		help="A multiplier for the original pace (default: as fast as possible).",
+	)
+	parser.add_argument(
+		"--max-delay", type=float, default=None, help="The most seconds to wait between calls."
+	)
+	args = parser.parse_args(argv)
+	from .registry import create  # NOQA: PLC0415
+
+	# Created through the registry, so that a pinned backend receives its registered arguments.
+	result: ReplayResult = replay(args.journal, create(), speed=args.speed, max_delay=args.max_delay)
+	print(
+		f"Replayed {result.calls} calls in {result.elapsed:.3f} seconds ({result.throughput:.1f} per second)."
+	)
+	print(f"The most a call lagged behind schedule was {result.max_lag:.3f} seconds.")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,263 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+A registry of speech backends.
+
+Backends are registered by name, with a target which is either a callable that returns a Speech instance,
+or a 'module:attribute' string naming one. String targets are imported when the backend is first used,
+so only the chosen backend's module is loaded.
+Third-party packages can provide backends by declaring entry points in the 'speechlight.backends' group.
+
+The backend used by default is chosen from, in order:
+	The SPEECHLIGHT_BACKEND environment variable.
+	The 'backend' option in the [speechlight] section of the configuration file.
+	The default backend for the current platform.
+"""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import configparser
+import importlib
+import logging
+import os
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, TypeAlias, cast
+
+# Local Modules:
+from .base import BaseSpeech
+
+
+# Constants:
+ENTRY_POINT_GROUP: str = "speechlight.backends"
+ENVIRONMENT_VARIABLE: str = "SPEECHLIGHT_BACKEND"
+CONFIG_ENVIRONMENT_VARIABLE: str = "SPEECHLIGHT_CONFIG"  # Overrides the path of the configuration file.
+CONFIG_SECTION: str = "speechlight"
+CONFIG_OPTION: str = "backend"
+BackendTargetType: TypeAlias = "str | Callable[..., BaseSpeech]"
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Backend(NamedTuple):
+	"""A registered backend."""
+
+	target: BackendTargetType  # A callable which returns a Speech instance, or a 'module:attribute' string.
+	kwargs: dict[str, Any]  # Keyword arguments passed to the target.
+
+
+_backends: dict[str, Backend] = {
+	"darwin": Backend("speechlight.darwin:Speech", {}),
+	"dummy": Backend("speechlight.dummy:Speech", {}),
+	"speech_dispatcher": Backend("speechlight.speech_dispatcher:Speech", {}),
+	"windows": Backend("speechlight.windows:Speech", {}),
+	# Windows screen readers, pinned so that no probing is done.
+	"jfw": Backend("speechlight.windows:Speech", {"screen_reader": "jfw"}),
+	"nvda": Backend("speechlight.windows:Speech", {"screen_reader": "nvda"}),
+	"sa": Backend("speechlight.windows:Speech", {"screen_reader": "sa"}),
+	"sapi": Backend("speechlight.windows:Speech", {"screen_reader": "sapi"}),
+}
+_entry_points_loaded: bool = False
+_lock: threading.RLock = threading.RLock()
+
+
+def platform_backend() -> str:
+	"""
+	Determines the default backend for the current platform.
+
+	Returns:
+		The backend name.
+	"""
+	if sys.platform == "win32":  # pragma: no cover
+		name: str = "windows"
+	elif sys.platform == "darwin":  # pragma: no cover
+		name = "darwin"
+	elif sys.platform == "linux":  # pragma: no cover
+		name = "speech_dispatcher"
+	else:  # pragma: no cover
+		name = "dummy"
+	return name
+
+
+def config_path() -> Path:
+	"""
+	Determines the path of the configuration file.
+
+	Returns:
+		The path of the file named in SPEECHLIGHT_CONFIG if set, otherwise
+		'speechlight/config.ini' in the user's configuration directory.
+	"""
+	if os.environ.get(CONFIG_ENVIRONMENT_VARIABLE):
+		return Path(os.environ[CONFIG_ENVIRONMENT_VARIABLE])
+	if sys.platform == "win32":  # pragma: no cover
+		directory: str = os.environ.get("APPDATA") or str(Path.home() / "AppData" / "Roaming")
+	else:
+		directory = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+	return Path(directory) / "speechlight" / "config.ini"
+
+
+def register(name: str, target: BackendTargetType, **kwargs: Any) -> None:
+	"""
+	Registers a backend, replacing any backend with the same name.
+
+	Args:
+		name: The backend name.
+		target: A callable which returns a Speech instance, or a 'module:attribute' string naming one.
+		**kwargs: Keyword arguments passed to the target when the backend is created.
+	"""
+	with _lock:
+		_backends[name] = Backend(target, kwargs)
+
+
+def unregister(name: str) -> None:
+	"""
+	Removes a backend.
+
+	Args:
+		name: The backend name.
+
+	Raises:
+		ValueError: No backend has the given name.
+	"""
+	with _lock:
+		if name not in _backends:
+			raise ValueError(f"Unknown speech backend: {name!r}")
+		del _backends[name]
+
+
+def _load_entry_points() -> None:
+	"""Registers the backends declared by installed packages, without importing them."""
+	global _entry_points_loaded  # NOQA: PLW0603
+	with _lock:
+		if _entry_points_loaded:
+			return
+		_entry_points_loaded = True
+		from importlib.metadata import entry_points  # NOQA: PLC0415
+
+		for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+			# Backends registered in code take precedence.
+			_backends.setdefault(entry_point.name, Backend(entry_point.value, {}))
+
+
+def backends() -> list[str]:
+	"""
+	Lists the registered backends, including those declared by installed packages.
+
+	Returns:
+		The backend names, sorted.
+	"""
+	with _lock:
+		_load_entry_points()
+		return sorted(_backends)
+
+
+def get_backend(name: str) -> Backend:
+	"""
+	Retrieves a registered backend.
+
+	Args:
+		name: The backend name.
+
+	Returns:
+		The backend.
+
+	Raises:
+		ValueError: No backend has the given name.
+	"""
+	with _lock:
+		if name not in _backends:
+			_load_entry_points()
+		if name not in _backends:
+			raise ValueError(f"Unknown speech backend: {name!r}")
+		return _backends[name]
+
+
+def selected_backend() -> str:
+	"""
+	Determines the name of the backend to use when none is given.
+
+	Returns:
+		The backend name.
+	"""
+	name: str | None = os.environ.get(ENVIRONMENT_VARIABLE)
+	if name:
+		return name
+	path: Path = config_path()
+	if path.is_file():
+		parser: configparser.ConfigParser = configparser.ConfigParser()
+		try:
+			parser.read(path, encoding="utf-8")
+		except configparser.Error as e:
+			logger.warning(f"Ignoring invalid configuration file {path}: {e}")
+		else:
+			name = parser.get(CONFIG_SECTION, CONFIG_OPTION, fallback=None)
+			if name:
+				return name
+	return platform_backend()
+
+
+def load(name: str) -> Callable[..., BaseSpeech]:
+	"""
+	Imports a backend's target, without creating an instance.
+
+	Args:
+		name: The backend name.
+
+	Returns:
+		The callable which creates the backend's Speech instances.
+
+	Raises:
+		ValueError: The target isn't in 'module:attribute' form.
+	"""
+	target: BackendTargetType = get_backend(name).target
+	if not isinstance(target, str):
+		return target
+	module_name, separator, attribute = target.partition(":")
+	if not separator:
+		raise ValueError(f"Backend {name!r} target must be in 'module:attribute' form, not {target!r}.")
+	value: Any = importlib.import_module(module_name)
+	for part in attribute.split("."):
+		value = getattr(value, part)
+	return cast("Callable[..., BaseSpeech]", value)
+
+
+def create(name: str | None = None, **kwargs: Any) -> BaseSpeech:
+	"""
+	Creates a Speech instance.
+
+	Args:
+		name: The backend name, or None to use the selected backend.
+		**kwargs: Keyword arguments passed to the backend, in addition to those it was registered with.
+
+	Returns:
+		The Speech instance.
+	"""
+	if name is None:
+		name = selected_backend()
+	backend: Backend = get_backend(name)
+	logger.debug(f"Creating speech backend {name!r}.")
+	return load(name)(**{**backend.kwargs, **kwargs})
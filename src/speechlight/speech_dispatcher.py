@@ -27,20 +27,36 @@ from __future__ import annotations
 # Built-in Modules:
 import logging
 import sys
+import threading
+import time
 import warnings
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextlib import suppress
 from typing import Protocol, TypeAlias
 
 # Local Modules:
-from .base import BaseSpeech
+from .base import CALLBACK_BEGIN, CALLBACK_CANCEL, CALLBACK_END, BaseSpeech, Priority
 
 
 if sys.platform == "linux":  # pragma: no cover
 	import speechd
+	from speechd.client import SSIPCommunicationError as SSIPCommunicationError  # NOQA: PLC0414
+else:  # pragma: no cover
+
+	class SSIPCommunicationError(Exception):
+		"""Stands in for speechd.client.SSIPCommunicationError on platforms without Speech Dispatcher."""
 
 
 # Constants:
 SDListVoicesType: TypeAlias = tuple[tuple[str, str | None, str | None], ...]
+DEFAULT_MAX_PENDING: int = 64  # Messages buffered while disconnected before the oldest is dropped.
+RECONNECT_DELAY: float = 0.5  # Seconds before the first reconnection attempt.
+MAX_RECONNECT_DELAY: float = 30.0  # The upper limit of the exponential backoff between attempts.
+# Speech Dispatcher drops events which arrive before a message's callback is registered, so a message
+# is assumed finished if its END or CANCEL hasn't arrived by a generous estimate of when it should.
+MIN_SPEAKING_RATE: float = 4.0  # Characters spoken per second by a very slow synthesizer.
+MESSAGE_TIMEOUT: float = 10.0  # Seconds added to the estimated speaking time of each message.
 
 # Globals:
 logger: logging.Logger = logging.getLogger(__name__)
@@ -146,34 +162,235 @@ class SSIPClientType(Protocol):  # NOQA: PLR0904
 	def close(self) -> None: ...  # NOQA: D102
 
 
+def _notify(listeners: Iterable[Callable[[], object]]) -> None:
+	"""
+	Calls the listeners of finished messages, logging any exception they raise.
+
+	Args:
+		listeners: The listeners.
+	"""
+	for listener in listeners:
+		try:
+			listener()
+		except Exception:  # NOQA: PERF203
+			logger.exception("Message listener failed.")
+
+
+class _Message:
+	"""A message, or block of messages, sent to Speech Dispatcher."""
+
+	__slots__ = ("deadline", "finished", "length", "listeners", "message_id")
+
+	def __init__(self, length: int) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			length: The number of characters in the message.
+		"""
+		self.message_id: int | None = None
+		self.finished: bool = False
+		self.length: int = length
+		self.deadline: float = 0.0  # When the message is assumed finished if no event says so.
+		self.listeners: list[Callable[[], object]] = []  # Called once when the message finishes.
+
+	def finish(self) -> list[Callable[[], object]]:
+		"""
+		Marks the message as finished.
+
+		The caller must hold the condition which guards in-flight messages, and call the returned
+		listeners after releasing it.
+
+		Returns:
+			The listeners waiting for the message to finish.
+		"""
+		self.finished = True
+		listeners, self.listeners = self.listeners, []
+		return listeners
+
+
+def _get_message_id(result: object) -> int | None:
+	"""
+	Retrieves the message ID from the result of SSIPClient.speak.
+
+	Args:
+		result: The result, a tuple of the response code, message, and data.
+
+	Returns:
+		The message ID, or None if the result doesn't contain one.
+	"""
+	try:
+		return int(result[2][0])  # type: ignore[index]
+	except (IndexError, TypeError, ValueError):
+		return None
+
+
 class Speech(BaseSpeech):
-	"""Implements Speech for Speech Dispatcher."""
+	"""
+	Implements Speech for Speech Dispatcher.
+
+	The lock guards the connection, as SSIPClient can't be used by several threads at once.
+	It is only held while a command is sent and acknowledged, never while a message is spoken.
+	Event listeners are called from Speech Dispatcher's callback thread, which never takes the lock.
+	"""
 
 	_sd: SSIPClientType | None = None
 
-	def __init__(self) -> None:  # pragma: no cover
-		"""Defines the constructor."""
-		self._event_types: tuple[str, ...] = ()
-		self._is_speaking: bool = False
-		if sys.platform == "linux":  # pragma: no cover
-			self._event_types = (
-				speechd.CallbackType.BEGIN,
-				speechd.CallbackType.CANCEL,
-				speechd.CallbackType.END,
-			)
-			with warnings.catch_warnings():
-				warnings.simplefilter("ignore", ResourceWarning)
-				try:
-					self._sd = speechd.SSIPClient("speechlight")
-				except speechd.client.SSIPCommunicationError as e:
-					logger.debug(f"Unable to communicate with Speech Dispatcher: {e}")
-				else:
-					self._sd.set_data_mode(speechd.DataMode.TEXT)
+	def __init__(
+		self,
+		*,
+		max_pending: int = DEFAULT_MAX_PENDING,
+		reconnect_delay: float = RECONNECT_DELAY,
+		max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+	) -> None:
+		"""
+		Defines the constructor.
+
+		If Speech Dispatcher can't be reached, or the connection is later lost,
+		reconnection is attempted with exponential backoff.
+		Messages sent while disconnected are buffered and replayed once the connection returns.
+
+		Args:
+			max_pending: The maximum number of messages buffered while disconnected.
+			reconnect_delay: The number of seconds before the first reconnection attempt.
+			max_reconnect_delay: The maximum number of seconds between reconnection attempts.
+		"""
+		self._event_types: tuple[str, ...] = (CALLBACK_BEGIN, CALLBACK_CANCEL, CALLBACK_END)
+		self._event_listeners: list[Callable[[str], object]] = []
+		# Messages which haven't finished speaking, by message ID.
+		self._in_flight: dict[int, _Message] = {}
+		self._in_flight_condition: threading.Condition = threading.Condition()
+		self.last_message_id: int | None = None
+		self._priority: Priority = Priority.TEXT  # The default priority of a new connection.
+		self.reconnect_delay: float = reconnect_delay
+		self.max_reconnect_delay: float = max_reconnect_delay
+		self.reconnects: int = 0
+		self._connected_before: bool = False
+		self._delay: float = reconnect_delay
+		self._next_attempt: float = 0.0
+		self._pending: deque[tuple[tuple[str, ...], Priority]] = deque(maxlen=max_pending)
+		self._timer: threading.Timer | None = None
+		self._lock: threading.RLock = threading.RLock()
+		self._connect()
 
 	def __del__(self) -> None:  # pragma: no cover
+		if self._timer is not None:
+			self._timer.cancel()
 		if self._sd is not None:
 			self._sd.close()
 
+	def _open_client(self) -> SSIPClientType:  # pragma: no cover  # NOQA: PLR6301
+		"""
+		Opens a connection to Speech Dispatcher.
+
+		Returns:
+			The client.
+
+		Raises:
+			SSIPCommunicationError: Unable to communicate with Speech Dispatcher.
+		"""
+		if sys.platform != "linux":
+			raise SSIPCommunicationError("Speech Dispatcher is only supported on Linux.")
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore", ResourceWarning)
+			client: SSIPClientType = speechd.SSIPClient("speechlight")
+		client.set_data_mode(speechd.DataMode.TEXT)
+		return client
+
+	def _connect(self) -> SSIPClientType | None:
+		"""
+		Connects to Speech Dispatcher if not connected, and the backoff delay has elapsed.
+
+		Messages buffered while disconnected are replayed after connecting.
+
+		Returns:
+			The client, or None if not connected.
+		"""
+		with self._lock:
+			if self._sd is not None or time.monotonic() < self._next_attempt:
+				return self._sd
+			try:
+				self._sd = self._open_client()
+			except SSIPCommunicationError as e:
+				logger.debug(f"Unable to communicate with Speech Dispatcher: {e}")
+				self._back_off()
+				return None
+			if self._timer is not None:
+				self._timer.cancel()
+				self._timer = None
+			self._priority = Priority.TEXT
+			if self._connected_before:
+				self.reconnects += 1
+			self._connected_before = True
+			self._clear_in_flight()
+			if self._replay():
+				self._delay = self.reconnect_delay
+			return self._sd
+
+	def _back_off(self) -> None:
+		"""Delays the next connection attempt, doubling the delay each time."""
+		self._next_attempt = time.monotonic() + self._delay
+		self._delay = min(self._delay * 2, self.max_reconnect_delay)
+		self._schedule_reconnect()
+
+	def _disconnect(self, error: Exception) -> None:
+		"""
+		Discards a failed connection.
+
+		The next call reconnects immediately, as Speech Dispatcher may have already restarted.
+
+		Args:
+			error: The error which caused the disconnection.
+		"""
+		logger.debug(f"Lost communication with Speech Dispatcher: {error}")
+		if self._sd is not None:
+			with suppress(Exception):
+				self._sd.close()
+			self._sd = None
+		self._clear_in_flight()
+		self._next_attempt = 0.0
+
+	def _clear_in_flight(self) -> None:
+		"""Forgets the messages sent on a previous connection, as their events will never arrive."""
+		listeners: list[Callable[[], object]] = []
+		with self._in_flight_condition:
+			for message in self._in_flight.values():
+				listeners.extend(message.finish())
+			self._in_flight.clear()
+			self._in_flight_condition.notify_all()
+		_notify(listeners)
+
+	def _schedule_reconnect(self) -> None:
+		"""Schedules a reconnection attempt, if messages are waiting to be replayed."""
+		if self._pending and self._timer is None:
+			self._timer = threading.Timer(max(0.0, self._next_attempt - time.monotonic()), self._on_timer)
+			self._timer.daemon = True
+			self._timer.start()
+
+	def _on_timer(self) -> None:
+		"""Attempts to reconnect when the backoff delay expires."""
+		with self._lock:
+			self._timer = None
+			self._connect()
+
+	def _replay(self) -> bool:
+		"""
+		Sends messages buffered while disconnected.
+
+		Returns:
+			True if all buffered messages were sent, False if the connection failed again.
+		"""
+		while self._pending:
+			texts, priority = self._pending[0]
+			try:
+				self.last_message_id = self._send(texts, priority)
+			except SSIPCommunicationError as e:
+				self._disconnect(e)
+				self._back_off()
+				return False
+			self._pending.popleft()
+		return True
+
 	def _speak_callback(self, event_type: str, *, index_mark: str | None = None) -> None:
 		"""
 		Handle callbacks from Speech Dispatcher.
@@ -182,28 +399,296 @@ class Speech(BaseSpeech):
 			event_type: Event type from speechd.CallbackType.
 			index_mark: Index mark for INDEX_MARK events.
 		"""
-		if sys.platform == "linux":  # pragma: no cover
-			if event_type == speechd.CallbackType.BEGIN:
-				self._is_speaking = True
-			elif event_type in {speechd.CallbackType.END, speechd.CallbackType.CANCEL}:
-				self._is_speaking = False
+		for listener in tuple(self._event_listeners):
+			listener(event_type)
+
+	def _message_callback(self, message: _Message) -> SDEventCallbackType:
+		"""
+		Creates a callback which tracks the progress of a message.
+
+		Args:
+			message: The message.
+
+		Returns:
+			The callback.
+		"""
+
+		def callback(event_type: str, *, index_mark: str | None = None) -> None:
+			if event_type in {CALLBACK_END, CALLBACK_CANCEL}:
+				with self._in_flight_condition:
+					if message.finished:
+						# Both messages of a block report CANCEL, or the message was assumed finished.
+						return
+					listeners: list[Callable[[], object]] = message.finish()
+					if message.message_id is not None:
+						self._in_flight.pop(message.message_id, None)
+					self._in_flight_condition.notify_all()
+				_notify(listeners)
+			self._speak_callback(event_type, index_mark=index_mark)
+
+		return callback
+
+	def _track(self, message: _Message, result: object) -> int | None:
+		"""
+		Adds a sent message to the in-flight table.
+
+		Args:
+			message: The message.
+			result: The result of SSIPClient.speak.
+
+		Returns:
+			The message ID, or None if Speech Dispatcher didn't return one.
+		"""
+		message_id: int | None = _get_message_id(result)
+		with self._in_flight_condition:
+			message.message_id = message_id
+			# The message may have already finished, if its events arrived before speak returned.
+			if message_id is not None and not message.finished:
+				# Queued messages start speaking after the ones before them finish.
+				start: float = max([time.monotonic(), *(m.deadline for m in self._in_flight.values())])
+				message.deadline = start + MESSAGE_TIMEOUT + message.length / MIN_SPEAKING_RATE
+				self._in_flight[message_id] = message
+		return message_id
+
+	def _expire(self) -> list[Callable[[], object]]:
+		"""
+		Forgets in-flight messages whose deadline has passed.
+
+		The condition must be held by the caller, and the returned listeners called after releasing it.
+
+		Returns:
+			The listeners of the forgotten messages.
+		"""
+		listeners: list[Callable[[], object]] = []
+		now: float = time.monotonic()
+		for message_id, message in tuple(self._in_flight.items()):
+			if now >= message.deadline:
+				logger.debug(f"No END or CANCEL event for message {message_id}, assuming it finished.")
+				listeners.extend(message.finish())
+				del self._in_flight[message_id]
+				self._in_flight_condition.notify_all()
+		return listeners
+
+	def wait_message(self, message_id: int, timeout: float | None = None) -> bool:
+		"""
+		Waits for a message to finish speaking or be cancelled.
+
+		Args:
+			message_id: The message ID, for example last_message_id after calling say.
+				The messages sent by say_many share the ID of the first message.
+			timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+		Returns:
+			True if the message finished, False if the timeout expired.
+			A message whose events never arrive is assumed finished once its deadline passes.
+		"""
+		with self._in_flight_condition:
+			message: _Message | None = self._in_flight.get(message_id)
+			if message is None:
+				return True
+			remaining: float = message.deadline - time.monotonic()
+			if self._in_flight_condition.wait_for(
+				lambda: message_id not in self._in_flight,
+				remaining if timeout is None else min(timeout, remaining),
+			):
+				return True
+			if timeout is not None and timeout < remaining:
+				return False
+			listeners: list[Callable[[], object]] = self._expire()
+		_notify(listeners)
+		return True
+
+	def add_message_listener(self, message_id: int, listener: Callable[[], object]) -> float | None:
+		"""
+		Adds a function to be called once when a message finishes speaking or is cancelled.
+
+		The listener is called from the thread which delivers Speech Dispatcher's events, or from the
+		thread which finds the message finished, so it must not block.
+
+		Args:
+			message_id: The message ID, for example last_message_id after calling say.
+			listener: The function to call.
+
+		Returns:
+			The time, as returned by time.monotonic, when the message is assumed finished if no event
+			says so, or None if the message already finished, in which case the listener isn't added.
+		"""
+		with self._in_flight_condition:
+			message: _Message | None = self._in_flight.get(message_id)
+			if message is None:
+				return None
+			message.listeners.append(listener)
+			return message.deadline
+
+	def add_event_listener(self, listener: Callable[[str], object]) -> None:
+		"""
+		Adds a function to be called with each event type received from Speech Dispatcher.
+
+		Note:
+			Listeners are called from Speech Dispatcher's callback thread.
+
+		Args:
+			listener: The function to add.
+		"""
+		self._event_listeners.append(listener)
+
+	def remove_event_listener(self, listener: Callable[[str], object]) -> None:
+		"""
+		Removes a previously added event listener.
+
+		Args:
+			listener: The function to remove.
+		"""
+		self._event_listeners.remove(listener)
 
 	def braille(self, text: str) -> None:  # NOQA: D102
 		pass
 
-	def output(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
-		self.say(text, interrupt=interrupt)
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		self.say(text, interrupt=interrupt, priority=priority)
 		self.braille(text)
 
-	def say(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
-		if self._sd is not None:
+	def output_many(  # NOQA: D102
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		texts = tuple(texts)
+		self.say_many(texts, interrupt=interrupt, priority=priority)
+		for text in texts:
+			self.braille(text)
+
+	def _set_priority(self, priority: Priority) -> None:
+		"""
+		Sets the SSIP priority of subsequent messages, if it differs from the current priority.
+
+		Args:
+			priority: The new priority.
+		"""
+		if self._sd is not None and priority != self._priority:
+			self._sd.set_priority(priority.value)
+			self._priority = priority
+
+	def _send(self, texts: tuple[str, ...], priority: Priority) -> int | None:
+		"""
+		Sends messages to Speech Dispatcher.
+
+		Several messages are sent as a single block, tracked as one message. Callbacks are only registered
+		for the events which delimit the block: BEGIN of the first message, END of the last message,
+		and CANCEL of either.
+
+		Args:
+			texts: The messages.
+			priority: The priority of the messages.
+
+		Returns:
+			The message ID, or None if Speech Dispatcher didn't return one.
+		"""
+		if self._sd is None:
+			return None
+		message: _Message = _Message(sum(len(text) for text in texts))
+		callback: SDEventCallbackType = self._message_callback(message)
+		if len(texts) == 1:
+			self._set_priority(priority)
+			return self._track(
+				message, self._sd.speak(texts[0], callback=callback, event_types=self._event_types)
+			)
+		last: int = len(texts) - 1
+		message_id: int | None = None
+		# The priority can't be changed inside a block.
+		self._set_priority(priority)
+		self._sd.block_begin()
+		try:
+			for i, text in enumerate(texts):
+				event_types: tuple[str, ...] = tuple(
+					event_type
+					for event_type in self._event_types
+					if event_type == CALLBACK_CANCEL
+					or (event_type == CALLBACK_BEGIN and i == 0)
+					or (event_type == CALLBACK_END and i == last)
+				)
+				if i == 0:
+					message_id = self._track(
+						message, self._sd.speak(text, callback=callback, event_types=event_types)
+					)
+				elif i == last:
+					self._sd.speak(text, callback=callback, event_types=event_types)
+				else:
+					self._sd.speak(text)
+		finally:
+			self._sd.block_end()
+		return message_id
+
+	def _speak(self, texts: tuple[str, ...], priority: Priority) -> None:
+		"""
+		Sends messages to Speech Dispatcher, or buffers them while disconnected.
+
+		Args:
+			texts: The messages.
+			priority: The priority of the messages.
+		"""
+		with self._lock:
+			if self._connect() is not None:
+				try:
+					self.last_message_id = self._send(texts, priority)
+				except SSIPCommunicationError as e:
+					self._disconnect(e)
+				else:
+					return
+			self._pending.append((texts, priority))
+			self.last_message_id = None
+			if self._connect() is None:
+				self._schedule_reconnect()
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		with self._lock:
 			if interrupt:
 				self.silence()
-			self._sd.speak(text, callback=self._speak_callback, event_types=self._event_types)
+			self._speak((text,), priority)
 
-	def silence(self) -> None:  # NOQA: D102
-		if self._sd is not None:
-			self._sd.cancel()
+	def say_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks several texts in order, as a single Speech Dispatcher block.
+
+		Callbacks are only registered for the events which delimit the block:
+		BEGIN of the first message, END of the last message, and CANCEL of either.
+
+		Args:
+			texts: The texts to be spoken.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		texts = tuple(texts)
+		if not texts:
+			return
+		with self._lock:
+			if interrupt:
+				self.silence()
+			self._speak(texts, priority)
 
-	def speaking(self) -> bool:  # NOQA: D102
-		return self._is_speaking
+	def silence(self) -> None:
+		"""
+		Cancels speech and flushes the speech buffer.
+
+		Messages buffered while disconnected are also discarded.
+		"""
+		with self._lock:
+			self._pending.clear()
+			if self._sd is not None:
+				try:
+					self._sd.cancel()
+				except SSIPCommunicationError as e:
+					self._disconnect(e)
+
+	def speaking(self) -> bool:
+		"""
+		Determines if text is currently being spoken.
+
+		Returns:
+			True if any message sent to Speech Dispatcher hasn't finished speaking, False otherwise.
+		"""
+		with self._in_flight_condition:
+			listeners: list[Callable[[], object]] = self._expire()
+			result: bool = bool(self._in_flight)
+		_notify(listeners)
+		return result
@@ -0,0 +1,190 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Text splitting."""
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import re
+
+
+# Constants:
+DEFAULT_MAX_LENGTH: int = 300  # The maximum number of characters in a chunk.
+# Whitespace after sentence-ending punctuation (and an optional closing quote or bracket), or a line break.
+SENTENCE_BOUNDARY_REGEX: re.Pattern[str] = re.compile(r"(?<=[.!?])\s+|(?<=[.!?][\"')\]])\s+|\s*\n\s*")
+# Whitespace after clause punctuation.
+CLAUSE_BOUNDARY_REGEX: re.Pattern[str] = re.compile(r"(?<=[,;:])\s+")
+WORD_BOUNDARY_REGEX: re.Pattern[str] = re.compile(r"\s+")
+# Tried in order on pieces of text which are still too long.
+BOUNDARY_REGEXES: tuple[re.Pattern[str], ...] = (
+	SENTENCE_BOUNDARY_REGEX,
+	CLAUSE_BOUNDARY_REGEX,
+	WORD_BOUNDARY_REGEX,
+)
+
+
+def _join(pieces: list[str], max_length: int) -> list[str]:
+	"""
+	Joins adjacent pieces of text with spaces, while the result fits within a maximum length.
+
+	Args:
+		pieces: The pieces of text.
+		max_length: The maximum length of each result.
+
+	Returns:
+		The joined pieces.
+	"""
+	chunks: list[str] = []
+	for piece in pieces:
+		if chunks and len(chunks[-1]) + 1 + len(piece) <= max_length:
+			chunks[-1] += " " + piece
+		elif piece:
+			chunks.append(piece)
+	return chunks
+
+
+def _split(text: str, max_length: int, level: int) -> list[str]:
+	"""
+	Splits text at the boundaries of a level, splitting pieces which are still too long at the next level.
+
+	Args:
+		text: The text to split.
+		max_length: The maximum length of each piece.
+		level: The index in BOUNDARY_REGEXES of the boundaries to split at.
+
+	Returns:
+		The pieces of text.
+	"""
+	if len(text) <= max_length:
+		return [text]
+	if level == len(BOUNDARY_REGEXES):
+		# No natural boundary remains, so cut the text.
+		return [text[i : i + max_length] for i in range(0, len(text), max_length)]
+	pieces: list[str] = []
+	for piece in BOUNDARY_REGEXES[level].split(text):
+		pieces.extend(_split(piece, max_length, level + 1))
+	return pieces
+
+
+def split_text(text: str, max_length: int = DEFAULT_MAX_LENGTH) -> list[str]:
+	"""
+	Splits text into chunks at natural boundaries.
+
+	Text is split at sentence boundaries where possible, then at clause boundaries, then between words.
+	Text without any of those boundaries is cut.
+	Adjacent pieces are joined back together while they fit within the maximum length.
+
+	Args:
+		text: The text to split.
+		max_length: The maximum length of each chunk.
+
+	Returns:
+		The chunks.
+
+	Raises:
+		ValueError: Max_length is less than 1.
+	"""
+	if max_length < 1:
+		raise ValueError("max_length must be at least 1.")
+	text = text.strip()
+	if len(text) <= max_length:
+		return [text] if text else []
+	return _join(_split(text, max_length, 0), max_length)
+
+
+def _last_match(regex: re.Pattern[str], text: str) -> re.Match[str] | None:
+	"""
+	Finds the last match of a regex in text.
+
+	Args:
+		regex: The regex.
+		text: The text to search.
+
+	Returns:
+		The last match, or None if there are no matches.
+	"""
+	matches: list[re.Match[str]] = list(regex.finditer(text))
+	return matches[-1] if matches else None
+
+
+class TextAccumulator:
+	"""
+	Accumulates fragments of text, releasing it as soon as a natural boundary is reached.
+
+	Text is released at the last sentence boundary. If more than max_length characters accumulate
+	without a sentence boundary, text is released at the last clause boundary, then the last word boundary,
+	so words are never cut unless a single word exceeds max_length.
+	"""
+
+	def __init__(self, max_length: int = DEFAULT_MAX_LENGTH) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			max_length: The maximum length of each released chunk.
+
+		Raises:
+			ValueError: Max_length is less than 1.
+		"""
+		if max_length < 1:
+			raise ValueError("max_length must be at least 1.")
+		self.max_length: int = max_length
+		self._buffer: str = ""
+
+	def feed(self, fragment: str) -> list[str]:
+		"""
+		Adds a fragment of text.
+
+		Args:
+			fragment: The fragment.
+
+		Returns:
+			The chunks of text which are ready to be released.
+		"""
+		self._buffer += fragment
+		chunks: list[str] = []
+		match: re.Match[str] | None = _last_match(SENTENCE_BOUNDARY_REGEX, self._buffer)
+		if match is not None:
+			chunks.extend(split_text(self._buffer[: match.start()], self.max_length))
+			self._buffer = self._buffer[match.end() :]
+		while len(self._buffer) > self.max_length:
+			match = _last_match(CLAUSE_BOUNDARY_REGEX, self._buffer) or _last_match(
+				WORD_BOUNDARY_REGEX, self._buffer
+			)
+			if match is not None and match.start() > 0:
+				chunks.extend(split_text(self._buffer[: match.start()], self.max_length))
+				self._buffer = self._buffer[match.end() :]
+			else:
+				chunks.append(self._buffer[: self.max_length])
+				self._buffer = self._buffer[self.max_length :]
+		return chunks
+
+	def flush(self) -> list[str]:
+		"""
+		Releases the remaining text.
+
+		Returns:
+			The chunks of remaining text.
+		"""
+		text, self._buffer = self._buffer, ""
+		return split_text(text, self.max_length)
@@ -26,19 +26,50 @@ from __future__ import annotations
 
 # Built-in Modules:
 import ctypes
+import logging
+import queue
 import re
 import shutil
 import sys
-from typing import Any
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, ClassVar, ParamSpec, TypeAlias, TypeVar
 
 # Local Modules:
 from . import LIB_DIRECTORY, SYSTEM_ARCHITECTURE
-from .base import BaseSpeech
+from .base import BaseSpeech, Priority
+from .braille import DEFAULT_REFRESH_INTERVAL, BrailleScheduler
 
 
 if sys.platform == "win32":  # pragma: no cover
+	import pythoncom
 	from pywintypes import com_error as ComError  # NOQA: N812
-
+else:  # pragma: no cover
+
+	class ComError(Exception):
+		"""Stands in for pywintypes.com_error on platforms without COM."""
+
+
+# Constants:
+COM_POLL_INTERVAL: float = 0.05  # Seconds between pumping Windows messages on the COM thread.
+COM_THREAD_NAME: str = "speechlight-com"
+DETECTION_TTL: float = 5.0  # Seconds a detected screen reader is trusted before probing again.
+SCREEN_READER_JFW: str = "jfw"
+SCREEN_READER_NVDA: str = "nvda"
+SCREEN_READER_SA: str = "sa"
+SCREEN_READER_SAPI: str = "sapi"  # SAPI is used as the fallback when no screen reader is running.
+SCREEN_READERS: tuple[str, ...] = (
+	SCREEN_READER_JFW,
+	SCREEN_READER_NVDA,
+	SCREEN_READER_SA,
+	SCREEN_READER_SAPI,
+)
+# Exceptions raised by a screen reader API which indicate that it is no longer available.
+# ScreenReaderError is a subclass of OSError.
+BACKEND_ERRORS: tuple[type[Exception], ...] = (OSError, ComError)
 
 # SAPI constants
 SPF_ASYNC: int = 1  # Specifies that the Speak call should be asynchronous.
@@ -91,8 +122,183 @@ def dispatch(*args: Any, **kwargs: Any) -> Any:  # pragma: no cover
 	return app
 
 
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+ComCallType: TypeAlias = tuple["Future[Any]", Callable[[], Any]]
+
+# Globals:
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ScreenReaderError(OSError):
+	"""Raised when a screen reader API reports that a call failed."""
+
+
+def _check_nvda(result: int, name: str) -> None:
+	"""
+	Checks the error code returned by an NVDA controller client function.
+
+	Args:
+		result: The error code, where 0 indicates success.
+		name: The name of the function.
+
+	Raises:
+		ScreenReaderError: The function failed, for example because NVDA isn't running.
+	"""
+	if result != 0:
+		raise ScreenReaderError(result, f"{name} failed.")
+
+
+def _check_sa(result: int, name: str) -> None:
+	"""
+	Checks the value returned by a System Access API function.
+
+	Args:
+		result: The returned value, where 0 indicates failure.
+		name: The name of the function.
+
+	Raises:
+		ScreenReaderError: The function failed, for example because System Access isn't running.
+	"""
+	if not result:
+		raise ScreenReaderError(f"{name} failed.")
+
+
+def _execute(future: Future[_T], call: Callable[[], _T]) -> None:
+	"""
+	Makes a call, storing the result or exception in a future.
+
+	Args:
+		future: The future.
+		call: The call.
+	"""
+	if not future.set_running_or_notify_cancel():
+		return
+	try:
+		result: _T = call()
+	except Exception as e:  # NOQA: BLE001
+		future.set_exception(e)
+	else:
+		future.set_result(result)
+
+
+class ComThread:
+	"""
+	Makes calls on a single long-lived thread, which owns the COM objects.
+
+	On Windows, the thread initializes a single-threaded apartment (STA), so COM objects are created
+	and used on the same thread regardless of which threads call Speech, and no marshaling is needed.
+	Calls are processed in the order they were submitted, and results are returned as futures.
+	The thread is started on first use.
+	"""
+
+	def __init__(self, *, name: str = COM_THREAD_NAME) -> None:
+		"""
+		Defines the constructor.
+
+		Args:
+			name: The name of the thread.
+		"""
+		self.name: str = name
+		self._queue: queue.SimpleQueue[ComCallType | None] = queue.SimpleQueue()
+		self._thread: threading.Thread | None = None
+		self._closed: bool = False
+		self._lock: threading.Lock = threading.Lock()
+
+	@property
+	def running(self) -> bool:
+		"""True if the thread has been started and not yet stopped."""
+		return self._thread is not None and self._thread.is_alive()
+
+	def _run(self) -> None:
+		"""Processes calls until closed."""
+		if sys.platform == "win32":  # pragma: no cover
+			pythoncom.CoInitialize()
+		# Windows messages must be pumped while idle, so that COM objects in the apartment can process events.
+		timeout: float | None = COM_POLL_INTERVAL if sys.platform == "win32" else None
+		try:
+			while True:
+				try:
+					item: ComCallType | None = self._queue.get(timeout=timeout)
+				except queue.Empty:  # pragma: no cover
+					if sys.platform == "win32":
+						pythoncom.PumpWaitingMessages()
+					continue
+				if item is None:
+					return
+				_execute(*item)
+		finally:
+			if sys.platform == "win32":  # pragma: no cover
+				pythoncom.CoUninitialize()
+
+	def submit(self, func: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> Future[_T]:
+		"""
+		Schedules a function to be called on the COM thread.
+
+		If called from the COM thread, the function is called immediately,
+		as queueing it would deadlock a caller which waits for the result.
+
+		Args:
+			func: The function.
+			*args: Positional arguments to be passed to the function.
+			**kwargs: Key-word only arguments to be passed to the function.
+
+		Returns:
+			A future for the result of the function.
+
+		Raises:
+			RuntimeError: The COM thread is closed.
+		"""
+		future: Future[_T] = Future()
+		call: Callable[[], _T] = partial(func, *args, **kwargs)
+		if threading.current_thread() is self._thread:
+			_execute(future, call)
+			return future
+		with self._lock:
+			if self._closed:
+				raise RuntimeError("The COM thread is closed.")
+			if self._thread is None:
+				self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+				self._thread.start()
+			self._queue.put((future, call))
+		return future
+
+	def call(self, func: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+		"""
+		Calls a function on the COM thread, and waits for the result.
+
+		Args:
+			func: The function.
+			*args: Positional arguments to be passed to the function.
+			**kwargs: Key-word only arguments to be passed to the function.
+
+		Returns:
+			The result of the function.
+		"""
+		return self.submit(func, *args, **kwargs).result()
+
+	def close(self, timeout: float | None = None) -> None:
+		"""
+		Stops the thread after pending calls have been processed.
+
+		Args:
+			timeout: The maximum number of seconds to wait for the thread.
+		"""
+		with self._lock:
+			self._closed = True
+			thread: threading.Thread | None = self._thread
+			self._queue.put(None)
+		if thread is not None and thread is not threading.current_thread():
+			thread.join(timeout)
+
+
 class Speech(BaseSpeech):  # NOQA: PLR0904
-	"""Implements Speech for Windows."""
+	"""
+	Implements Speech for Windows.
+
+	The lock only guards the cached screen reader, and is never held while calling a screen reader.
+	All COM objects are created and used on a dedicated COM thread.
+	"""
 
 	_find_window: Any | None = None
 	_nvda: Any | None = None
@@ -100,34 +306,127 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 	_sapi: Any | None = None
 	_jfw: Any | None = None
 
-	def __init__(self) -> None:  # pragma: no cover
-		"""Defines the constructor."""
+	instrumented_methods: ClassVar[tuple[str, ...]] = (
+		*BaseSpeech.instrumented_methods,
+		"jfw_braille",
+		"jfw_output",
+		"jfw_say",
+		"jfw_silence",
+		"nvda_braille",
+		"nvda_output",
+		"nvda_say",
+		"nvda_silence",
+		"sa_braille",
+		"sa_output",
+		"sa_say",
+		"sa_silence",
+		"sapi_say",
+		"sapi_silence",
+	)
+
+	def __init__(
+		self,
+		*,
+		detection_ttl: float = DETECTION_TTL,
+		braille_interval: float = DEFAULT_REFRESH_INTERVAL,
+		screen_reader: str | None = None,
+	) -> None:  # pragma: no cover
+		"""
+		Defines the constructor.
+
+		Args:
+			detection_ttl: The number of seconds a detected screen reader is cached before probing again.
+			braille_interval: The minimum number of seconds between braille display updates.
+			screen_reader: The screen reader to always use, or None to detect the running screen reader.
+				Only the libraries needed by a pinned screen reader are loaded.
+
+		Raises:
+			ValueError: The screen reader is unknown.
+		"""
+		if screen_reader is not None and screen_reader not in SCREEN_READERS:
+			raise ValueError(f"Unknown screen reader: {screen_reader!r}")
+		self.pinned_screen_reader: str | None = screen_reader
+		self.detection_ttl: float = detection_ttl
+		self._lock: threading.Lock = threading.Lock()
+		self.com_thread: ComThread = ComThread()
+		self.braille_scheduler: BrailleScheduler = BrailleScheduler(
+			self._send_braille, interval=braille_interval
+		)
+		self.detection_hits: int = 0
+		self.detection_misses: int = 0
+		self._screen_reader: str | None = None
+		self._screen_reader_time: float = 0.0
 		if sys.platform == "win32":
 			self._find_window: ctypes._NamedFuncPointer = ctypes.WinDLL("user32").FindWindowW
 			self._find_window.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p]
 			self._find_window.restype = ctypes.c_void_p
 			arch: str = "32" if SYSTEM_ARCHITECTURE == "32bit" else "64"
-			self._nvda: ctypes.WinDLL = ctypes.windll.LoadLibrary(
-				str(LIB_DIRECTORY / f"nvdaControllerClient{arch}.dll")
-			)
-			self._sa: ctypes.WinDLL = ctypes.windll.LoadLibrary(str(LIB_DIRECTORY / f"SAAPI{arch}.dll"))
-			self._nvda.nvdaController_brailleMessage.argtypes = (ctypes.c_wchar_p,)
-			self._nvda.nvdaController_speakText.argtypes = (ctypes.c_wchar_p,)
-			self._sa.SA_BrlShowTextW.argtypes = (ctypes.c_wchar_p,)
-			self._sa.SA_SayW.argtypes = (ctypes.c_wchar_p,)
+			if screen_reader in {None, SCREEN_READER_NVDA}:
+				self._nvda: ctypes.WinDLL = ctypes.windll.LoadLibrary(
+					str(LIB_DIRECTORY / f"nvdaControllerClient{arch}.dll")
+				)
+				self._nvda.nvdaController_brailleMessage.argtypes = (ctypes.c_wchar_p,)
+				self._nvda.nvdaController_speakText.argtypes = (ctypes.c_wchar_p,)
+			if screen_reader in {None, SCREEN_READER_SA}:
+				self._sa: ctypes.WinDLL = ctypes.windll.LoadLibrary(str(LIB_DIRECTORY / f"SAAPI{arch}.dll"))
+				self._sa.SA_BrlShowTextW.argtypes = (ctypes.c_wchar_p,)
+				self._sa.SA_SayW.argtypes = (ctypes.c_wchar_p,)
 
 	@property
 	def sapi(self) -> Any:  # pragma: no cover
-		"""The SAPI COM object."""
-		self._sapi = dispatch("SAPI.SpVoice")
+		"""The SAPI COM object, created on first use. Only accessed on the COM thread."""
+		if self._sapi is None:
+			self._sapi = dispatch("SAPI.SpVoice")
 		return self._sapi
 
 	@property
 	def jfw(self) -> Any:  # pragma: no cover
-		"""The JFW COM object."""
-		self._jfw = dispatch("FreedomSci.JawsApi")
+		"""The JFW COM object, created on first use. Only accessed on the COM thread."""
+		if self._jfw is None:
+			self._jfw = dispatch("FreedomSci.JawsApi")
 		return self._jfw
 
+	def _com_call(self, name: str, func: Callable[[Any], _T]) -> _T | None:
+		"""
+		Calls a function with a cached COM object, on the COM thread.
+
+		If the call raises a COM error, the cached object is discarded and the call is retried once
+		with a newly created object. If the retry fails as well, its COM error is raised.
+
+		Args:
+			name: The name of the COM object property ('sapi' or 'jfw').
+			func: A function which takes the COM object.
+
+		Returns:
+			The result of the function, or None if the COM object is unavailable.
+		"""
+
+		def _call() -> _T | None:
+			for attempt in range(2):
+				com_object: Any = getattr(self, name)
+				if com_object is None:
+					break
+				try:
+					return func(com_object)
+				except ComError as e:
+					logger.debug(f"{name} COM call failed, recreating the COM object: {e}")
+					setattr(self, f"_{name}", None)
+					if attempt:
+						raise
+			return None
+
+		return self.com_thread.call(_call)
+
+	def close(self, timeout: float | None = None) -> None:
+		"""
+		Discards pending braille, and stops the COM thread.
+
+		Args:
+			timeout: The maximum number of seconds to wait for the COM thread.
+		"""
+		self.braille_scheduler.cancel()
+		self.com_thread.close(timeout)
+
 	def jfw_braille(self, text: str) -> None:
 		"""
 		Brailles text using JFW.
@@ -153,13 +452,20 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 			braille: Output text in braille.
 			speak: Output text using speech.
 			interrupt: True if the speech should be silenced before speaking.
+
+		Raises:
+			ScreenReaderError: JFW is unavailable, or rejected the text.
 		"""
-		jfw = self.jfw
-		if jfw is not None:
-			if speak:
-				jfw.SayString(text, int(bool(interrupt)))
-			if braille:
+
+		def _jfw_output(jfw: Any) -> bool:
+			if speak and not jfw.SayString(text, int(bool(interrupt))):
+				return False
+			return not braille or bool(
 				jfw.RunFunction('BrailleString("{text}")'.format(text=text.replace('"', "'")))
+			)
+
+		if not self._com_call("jfw", _jfw_output):
+			raise ScreenReaderError("JFW is unavailable.")
 
 	def jfw_running(self) -> bool:
 		"""
@@ -184,10 +490,19 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 		self.jfw_output(text, speak=True, interrupt=interrupt)
 
 	def jfw_silence(self) -> None:
-		"""Cancels JFW speech and flushes the speech buffer."""
-		jfw = self.jfw
-		if jfw is not None:
+		"""
+		Cancels JFW speech and flushes the speech buffer.
+
+		Raises:
+			ScreenReaderError: JFW is unavailable.
+		"""
+
+		def _jfw_silence(jfw: Any) -> bool:
 			jfw.StopSpeech()
+			return True
+
+		if not self._com_call("jfw", _jfw_silence):
+			raise ScreenReaderError("JFW is unavailable.")
 
 	def nvda_braille(self, text: str) -> None:
 		"""
@@ -197,7 +512,7 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 			text: The text to braille.
 		"""
 		if self._nvda is not None:
-			self._nvda.nvdaController_brailleMessage(text)
+			_check_nvda(self._nvda.nvdaController_brailleMessage(text), "nvdaController_brailleMessage")
 
 	def nvda_output(self, text: str, *, interrupt: bool = False) -> None:
 		"""
@@ -233,12 +548,12 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 		if self._nvda is not None:
 			if interrupt:
 				self.nvda_silence()
-			self._nvda.nvdaController_speakText(text)
+			_check_nvda(self._nvda.nvdaController_speakText(text), "nvdaController_speakText")
 
 	def nvda_silence(self) -> None:
 		"""Cancels NVDA speech and flushes the speech buffer."""
 		if self._nvda is not None:
-			self._nvda.nvdaController_cancelSpeech()
+			_check_nvda(self._nvda.nvdaController_cancelSpeech(), "nvdaController_cancelSpeech")
 
 	def sa_braille(self, text: str) -> None:
 		"""
@@ -248,7 +563,7 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 			text: The text to braille.
 		"""
 		if self._sa is not None:
-			self._sa.SA_BrlShowTextW(text)
+			_check_sa(self._sa.SA_BrlShowTextW(text), "SA_BrlShowTextW")
 
 	def sa_output(self, text: str, *, interrupt: bool = False) -> None:
 		"""
@@ -284,12 +599,12 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 		if self._sa is not None:
 			if interrupt:
 				self.sa_silence()
-			self._sa.SA_SayW(text)
+			_check_sa(self._sa.SA_SayW(text), "SA_SayW")
 
 	def sa_silence(self) -> None:
 		"""Cancels System Access speech and flushes the speech buffer."""
 		if self._sa is not None:
-			self._sa.SA_StopAudio()
+			_check_sa(self._sa.SA_StopAudio(), "SA_StopAudio")
 
 	def sapi_say(self, text: str, *, interrupt: bool = False) -> None:
 		"""
@@ -299,59 +614,180 @@ class Speech(BaseSpeech):  # NOQA: PLR0904
 			text: The text to be spoken.
 			interrupt: True if the speech should be silenced before speaking.
 		"""
-		if self.sapi is not None:
-			if interrupt:
-				self.sapi.Speak(text, SPF_ASYNC | SPF_PURGE_BEFORE_SPEAK | SPF_IS_NOT_XML)
-			else:
-				self.sapi.Speak(text, SPF_ASYNC | SPF_IS_NOT_XML)
+		if interrupt:
+			flags: int = SPF_ASYNC | SPF_PURGE_BEFORE_SPEAK | SPF_IS_NOT_XML
+		else:
+			flags = SPF_ASYNC | SPF_IS_NOT_XML
+		self._com_call("sapi", lambda sapi: sapi.Speak(text, flags))
 
 	def sapi_silence(self) -> None:
 		"""Cancels SAPI speech and flushes the speech buffer."""
-		if self.sapi is not None:
-			self.sapi.Speak("", SPF_ASYNC | SPF_PURGE_BEFORE_SPEAK | SPF_IS_NOT_XML)
+		flags: int = SPF_ASYNC | SPF_PURGE_BEFORE_SPEAK | SPF_IS_NOT_XML
+		self._com_call("sapi", lambda sapi: sapi.Speak("", flags))
 
-	def braille(self, text: str) -> None:  # NOQA: D102
-		if self.nvda_running():
-			self.nvda_braille(text)
-		elif self.sa_running():
-			self.sa_braille(text)
-		elif self.jfw_running():
-			self.jfw_braille(text)
+	def screen_reader(self) -> str:
+		"""
+		Determines the active screen reader, using the cached result if it hasn't expired.
 
-	def output(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
+		Returns:
+			The pinned screen reader if there is one, otherwise the name of the running screen reader,
+			or SCREEN_READER_SAPI if none are running.
+		"""
+		if self.pinned_screen_reader is not None:
+			return self.pinned_screen_reader
+		now: float = time.monotonic()
+		with self._lock:
+			if self._screen_reader is not None and now - self._screen_reader_time < self.detection_ttl:
+				self.detection_hits += 1
+				return self._screen_reader
+			self.detection_misses += 1
+		# Probe without holding the lock, so that other callers can use the cached result meanwhile.
 		if self.nvda_running():
-			self.nvda_output(text, interrupt=interrupt)
+			screen_reader: str = SCREEN_READER_NVDA
 		elif self.sa_running():
-			self.sa_output(text, interrupt=interrupt)
+			screen_reader = SCREEN_READER_SA
 		elif self.jfw_running():
-			self.jfw_output(text, braille=True, speak=True, interrupt=interrupt)
+			screen_reader = SCREEN_READER_JFW
 		else:
-			self.sapi_say(text, interrupt=interrupt)
+			screen_reader = SCREEN_READER_SAPI
+		with self._lock:
+			previous: str | None = self._screen_reader
+			self._screen_reader = screen_reader
+			self._screen_reader_time = now
+		if screen_reader != previous:
+			# The new screen reader's display doesn't show what was sent to the old one.
+			self.braille_scheduler.reset()
+		return screen_reader
+
+	def invalidate_screen_reader(self) -> None:
+		"""Clears the cached screen reader, so that the next call probes again."""
+		with self._lock:
+			self._screen_reader = None
+
+	def _with_screen_reader(self, action: Callable[[str], _T]) -> _T:
+		"""
+		Calls a function with the active screen reader.
 
-	def say(self, text: str, *, interrupt: bool = False) -> None:  # NOQA: D102
-		if self.nvda_running():
-			self.nvda_say(text, interrupt=interrupt)
-		elif self.sa_running():
-			self.sa_say(text, interrupt=interrupt)
-		elif self.jfw_running():
-			self.jfw_say(text, interrupt=interrupt)
-		else:
-			self.sapi_say(text, interrupt=interrupt)
+		If the screen reader API fails, the cache is invalidated and the call is retried once.
+
+		Args:
+			action: A function which takes the name of the active screen reader.
+
+		Returns:
+			The result of the function.
+		"""
+		try:
+			return action(self.screen_reader())
+		except BACKEND_ERRORS as e:
+			logger.debug(f"Screen reader call failed, probing again: {e}")
+			self.invalidate_screen_reader()
+			return action(self.screen_reader())
+
+	def _send_braille(self, text: str) -> None:
+		"""
+		Brailles text using the active screen reader, bypassing the braille scheduler.
+
+		Args:
+			text: The text to braille.
+		"""
+
+		def _braille(screen_reader: str) -> None:
+			if screen_reader == SCREEN_READER_NVDA:
+				self.nvda_braille(text)
+			elif screen_reader == SCREEN_READER_SA:
+				self.sa_braille(text)
+			elif screen_reader == SCREEN_READER_JFW:
+				self.jfw_braille(text)
+
+		self._with_screen_reader(_braille)
+
+	def braille(self, text: str) -> None:  # NOQA: D102
+		# Probe first, so that a change of screen reader is detected before comparing with the display.
+		self.screen_reader()
+		self.braille_scheduler.show(text)
+
+	def output(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		def _output(screen_reader: str) -> bool:
+			if screen_reader == SCREEN_READER_NVDA:
+				self.nvda_say(text, interrupt=interrupt)
+			elif screen_reader == SCREEN_READER_SA:
+				self.sa_say(text, interrupt=interrupt)
+			elif screen_reader == SCREEN_READER_JFW:
+				self.jfw_say(text, interrupt=interrupt)
+			else:
+				self.sapi_say(text, interrupt=interrupt)
+				return False
+			return True
+
+		if self._with_screen_reader(_output):
+			# Braille is sent separately, so that a flood of output doesn't thrash the display.
+			self.braille_scheduler.show(text)
+
+	def output_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks and brailles several texts in order.
+
+		The texts are joined by line breaks and sent in a single call.
+
+		Args:
+			texts: The output texts.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		text: str = "\n".join(texts)
+		if text:
+			self.output(text, interrupt=interrupt, priority=priority)
+
+	def say(self, text: str, *, interrupt: bool = False, priority: Priority = Priority.TEXT) -> None:  # NOQA: D102
+		def _say(screen_reader: str) -> None:
+			if screen_reader == SCREEN_READER_NVDA:
+				self.nvda_say(text, interrupt=interrupt)
+			elif screen_reader == SCREEN_READER_SA:
+				self.sa_say(text, interrupt=interrupt)
+			elif screen_reader == SCREEN_READER_JFW:
+				self.jfw_say(text, interrupt=interrupt)
+			else:
+				self.sapi_say(text, interrupt=interrupt)
+
+		self._with_screen_reader(_say)
+
+	def say_many(
+		self, texts: Iterable[str], *, interrupt: bool = False, priority: Priority = Priority.TEXT
+	) -> None:
+		"""
+		Speaks several texts in order.
+
+		The texts are joined by line breaks and sent in a single call.
+
+		Args:
+			texts: The texts to be spoken.
+			interrupt: True if the speech should be silenced before speaking.
+			priority: The priority of the messages.
+		"""
+		text: str = "\n".join(texts)
+		if text:
+			self.say(text, interrupt=interrupt, priority=priority)
 
 	def silence(self) -> None:  # NOQA: D102
-		if self.nvda_running():
-			self.nvda_silence()
-		elif self.sa_running():
-			self.sa_silence()
-		elif self.jfw_running():
-			self.jfw_silence()
-		else:
-			self.sapi_silence()
+		def _silence(screen_reader: str) -> None:
+			if screen_reader == SCREEN_READER_NVDA:
+				self.nvda_silence()
+			elif screen_reader == SCREEN_READER_SA:
+				self.sa_silence()
+			elif screen_reader == SCREEN_READER_JFW:
+				self.jfw_silence()
+			else:
+				self.sapi_silence()
+
+		self._with_screen_reader(_silence)
 
 	def speaking(self) -> bool:  # NOQA: D102
-		if self.nvda_running() or self.sa_running() or self.jfw_running():
-			# None of the screen reader APIs support retrieving speaking status.
-			return False
-		if self.sapi is not None:
-			return bool(self.sapi.Status.RunningState != 1)
-		return False
+		def _speaking(screen_reader: str) -> bool:
+			if screen_reader != SCREEN_READER_SAPI:
+				# None of the screen reader APIs support retrieving speaking status.
+				return False
+			return bool(self._com_call("sapi", lambda sapi: sapi.Status.RunningState != 1))
+
+		return self._with_screen_reader(_speaking)
@@ -0,0 +1,262 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock, patch
+
+# Speechlight Modules:
+from speechlight.async_speech import AsyncSpeech
+from speechlight.base import CALLBACK_BEGIN, CALLBACK_CANCEL, CALLBACK_END, BaseSpeech, Priority
+from speechlight.speech_dispatcher import Speech as SpeechDispatcher
+
+
+class TestAsyncSpeechPolling(IsolatedAsyncioTestCase):
+	def setUp(self) -> None:
+		self.text: str = "This is a test."
+		self.backend: Mock = Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = False
+		self.speech: AsyncSpeech = AsyncSpeech(self.backend, poll_interval=0.001)
+
+	def tearDown(self) -> None:
+		self.speech.close()
+		del self.speech
+
+	async def test_calls(self) -> None:
+		await self.speech.braille(self.text)
+		self.backend.braille.assert_called_once_with(self.text)
+		await self.speech.output(self.text, interrupt=True, priority=Priority.IMPORTANT)
+		self.backend.output.assert_called_once_with(self.text, interrupt=True, priority=Priority.IMPORTANT)
+		await self.speech.say(self.text)
+		self.backend.say.assert_called_once_with(self.text, interrupt=False, priority=Priority.TEXT)
+		await self.speech.silence()
+		self.backend.silence.assert_called_once_with()
+		self.assertFalse(await self.speech.speaking())
+
+	async def test_completion(self) -> None:
+		self.backend.speaking.side_effect = [True, True, False]
+		done: asyncio.Future[None] = await self.speech.say(self.text)
+		await asyncio.wait_for(done, 5.0)
+		self.assertEqual(self.backend.speaking.call_count, 3)
+
+	async def test_wait_idle(self) -> None:
+		self.backend.speaking.return_value = True
+		self.assertFalse(await self.speech.wait_idle(timeout=0.01))
+		self.backend.speaking.return_value = False
+		self.assertTrue(await self.speech.wait_idle(timeout=5.0))
+
+	async def test_errors(self) -> None:
+		self.backend.say.side_effect = RuntimeError("Backend failure.")
+		with self.assertRaises(RuntimeError):
+			await self.speech.say(self.text)
+		self.assertIsNone(self.speech._poll_task)  # NOQA: SLF001
+
+	async def test_events(self) -> None:
+		# Events from a backend which doesn't track messages wake the polling task early.
+		backend: Mock = Mock(spec=[*dir(BaseSpeech), "add_event_listener", "remove_event_listener"])
+		backend.speaking.side_effect = [True, False]
+		speech: AsyncSpeech = AsyncSpeech(backend, poll_interval=60.0)
+		listener = backend.add_event_listener.call_args.args[0]
+		done: asyncio.Future[None] = await speech.say(self.text)
+		thread: threading.Thread = threading.Thread(target=listener, args=(CALLBACK_END,))
+		thread.start()
+		thread.join()
+		await asyncio.wait_for(done, 5.0)
+		speech.close()
+		backend.remove_event_listener.assert_called_once_with(listener)
+
+	async def test_closed_loop(self) -> None:
+		# Events which arrive before the first call, or after the event loop closes, are ignored.
+		backend: Mock = Mock(spec=[*dir(BaseSpeech), "add_event_listener", "remove_event_listener"])
+		speech: AsyncSpeech = AsyncSpeech(backend)
+		speech._on_event(CALLBACK_END)  # NOQA: SLF001
+		speech._handle_event()  # NOQA: SLF001
+		await speech.say(self.text)
+		loop: Mock = Mock()
+		loop.is_closed.return_value = True
+		speech._loop = loop  # NOQA: SLF001
+		speech._on_event(CALLBACK_END)  # NOQA: SLF001
+		loop.call_soon_threadsafe.assert_not_called()
+		speech.close()
+
+	async def test_executor(self) -> None:
+		executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+		speech: AsyncSpeech = AsyncSpeech(self.backend, executor=executor)
+		await speech.say(self.text)
+		speech.close()
+		# An executor which was passed in is left running.
+		self.assertFalse(executor._shutdown)  # NOQA: SLF001
+		executor.shutdown()
+
+
+@patch("speechlight.speech_dispatcher.logger", Mock())
+class TestAsyncSpeechEvents(IsolatedAsyncioTestCase):
+	def setUp(self) -> None:
+		self.text: str = "This is a test."
+		self.backend: SpeechDispatcher = SpeechDispatcher()
+		self.sd: Mock = Mock()
+		self.sd.speak.side_effect = [(225, "OK MESSAGE QUEUED", (str(i),)) for i in range(1, 10)]
+		self.backend._sd = self.sd  # NOQA: SLF001
+		self.speech: AsyncSpeech = AsyncSpeech(self.backend)
+
+	def tearDown(self) -> None:
+		self.speech.close()
+		self.backend._sd = None  # NOQA: SLF001
+		del self.speech
+		del self.backend
+
+	def fire(self, index: int, *event_types: str) -> None:
+		"""
+		Sends events for a message from another thread, like Speech Dispatcher's callback thread.
+
+		Args:
+			index: The index of the speak call which sent the message.
+			*event_types: The event types to send.
+		"""
+		callback = self.sd.speak.mock_calls[index].kwargs["callback"]
+
+		def send() -> None:
+			for event_type in event_types:
+				callback(event_type)
+
+		thread: threading.Thread = threading.Thread(target=send)
+		thread.start()
+		thread.join()
+
+	async def test_completion(self) -> None:
+		self.assertTrue(await self.speech.wait_idle(timeout=0.0))
+		first: asyncio.Future[None] = await self.speech.say(self.text)
+		second: asyncio.Future[None] = await self.speech.output(self.text)
+		self.fire(0, CALLBACK_BEGIN, CALLBACK_END)
+		self.fire(1, CALLBACK_BEGIN)
+		await asyncio.wait_for(first, 5.0)
+		self.assertFalse(second.done())
+		self.assertFalse(await self.speech.wait_idle(timeout=0.01))
+		self.fire(1, CALLBACK_END)
+		await asyncio.wait_for(second, 5.0)
+		self.assertTrue(await self.speech.wait_idle(timeout=5.0))
+
+	async def test_other_callers(self) -> None:
+		# Messages sent to the backend by other callers don't affect this instance's futures.
+		self.backend.say(self.text)
+		done: asyncio.Future[None] = await self.speech.say(self.text)
+		self.backend.say(self.text)
+		self.fire(0, CALLBACK_BEGIN, CALLBACK_END)
+		self.fire(2, CALLBACK_BEGIN, CALLBACK_CANCEL)
+		self.assertFalse(await self.speech.wait_idle(timeout=0.01))
+		self.assertFalse(done.done())
+		self.fire(1, CALLBACK_BEGIN, CALLBACK_END)
+		await asyncio.wait_for(done, 5.0)
+		self.assertTrue(await self.speech.wait_idle(timeout=0.0))
+
+	async def test_interrupt(self) -> None:
+		first: asyncio.Future[None] = await self.speech.say(self.text)
+		self.fire(0, CALLBACK_BEGIN)
+		second: asyncio.Future[None] = await self.speech.say(self.text, interrupt=True)
+		self.sd.cancel.assert_called_once_with()
+		# The interrupted message completes when its cancel event arrives, without completing the new message.
+		self.fire(0, CALLBACK_CANCEL)
+		await asyncio.wait_for(first, 5.0)
+		self.assertFalse(await self.speech.wait_idle(timeout=0.01))
+		self.fire(1, CALLBACK_BEGIN, CALLBACK_CANCEL)
+		await asyncio.wait_for(second, 5.0)
+
+	async def test_silence(self) -> None:
+		done: asyncio.Future[None] = await self.speech.say(self.text)
+		await self.speech.silence()
+		self.sd.cancel.assert_called_once_with()
+		self.fire(0, CALLBACK_CANCEL)
+		await asyncio.wait_for(done, 5.0)
+		self.assertTrue(await self.speech.wait_idle(timeout=0.0))
+
+	async def test_no_polling(self) -> None:
+		# Completion is driven by the backend's events, without checking the backend.
+		with (
+			patch.object(self.backend, "wait_message") as wait_message,
+			patch.object(self.backend, "speaking") as speaking,
+		):
+			done: asyncio.Future[None] = await self.speech.say(self.text)
+			self.assertFalse(await self.speech.wait_idle(timeout=0.05))
+			self.fire(0, CALLBACK_BEGIN, CALLBACK_END)
+			await asyncio.wait_for(done, 5.0)
+		wait_message.assert_not_called()
+		speaking.assert_not_called()
+		self.assertIsNone(self.speech._poll_task)  # NOQA: SLF001
+
+	async def test_finished_early(self) -> None:
+		# A message may finish before the event loop learns that it was sent.
+		add_message_listener = self.backend.add_message_listener
+
+		def finish_now(message_id: int, listener: Callable[[], object]) -> float | None:
+			deadline: float | None = add_message_listener(message_id, listener)
+			listener()
+			return deadline
+
+		with patch.object(self.backend, "add_message_listener", finish_now):
+			done: asyncio.Future[None] = await self.speech.say(self.text)
+		self.assertTrue(done.done())
+		self.assertTrue(await self.speech.wait_idle(timeout=0.0))
+		# A message which finished before its listener was added.
+		self.sd.speak.side_effect = lambda text, callback, event_types: (
+			callback(CALLBACK_CANCEL)
+			or (
+				225,
+				"OK MESSAGE QUEUED",
+				("2",),
+			)
+		)
+		done = await self.speech.say(self.text)
+		self.assertTrue(done.done())
+
+	async def test_untracked(self) -> None:
+		# Messages without an ID, such as those buffered while disconnected, complete immediately.
+		self.sd.speak.side_effect = None
+		self.sd.speak.return_value = None
+		done: asyncio.Future[None] = await self.speech.say(self.text)
+		self.assertTrue(done.done())
+		self.assertTrue(await self.speech.wait_idle(timeout=0.0))
+
+	async def test_lost_events(self) -> None:
+		# A message whose events never arrive completes once the backend assumes it finished.
+		with (
+			patch("speechlight.speech_dispatcher.MESSAGE_TIMEOUT", 0.0),
+			patch("speechlight.speech_dispatcher.MIN_SPEAKING_RATE", 1_000_000.0),
+		):
+			done: asyncio.Future[None] = await self.speech.say(self.text)
+		await asyncio.wait_for(done, 5.0)
+		self.assertTrue(await self.speech.wait_idle(timeout=0.0))
+		# The event arriving late is ignored.
+		self.fire(0, CALLBACK_END)
+		self.assertFalse(self.backend._in_flight)  # NOQA: SLF001
+
+	async def test_closed_loop(self) -> None:
+		# Messages which finish after the event loop closes are ignored.
+		future: Mock = Mock()
+		future.get_loop.return_value.is_closed.return_value = True
+		self.speech._on_message_finished(future)  # NOQA: SLF001
+		future.get_loop.return_value.call_soon_threadsafe.assert_not_called()
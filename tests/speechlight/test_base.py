@@ -0,0 +1,75 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import asyncio
+from collections.abc import AsyncIterator
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.base import Priority
+from speechlight.dummy import Speech
+
+
+class TestPriority(TestCase):
+	def test_rank(self) -> None:
+		self.assertEqual([priority.rank for priority in Priority], [0, 1, 2, 3, 4])
+		self.assertLess(Priority.IMPORTANT.rank, Priority.PROGRESS.rank)
+
+
+class TestSayStream(IsolatedAsyncioTestCase):
+	def setUp(self) -> None:
+		self.speech: Speech = Speech()
+		self.fragments: list[str] = ["Hello th", "ere. How are", " you? Fi", "ne"]
+		self.expected: list[object] = [
+			call(["Hello there."], interrupt=True, priority=Priority.MESSAGE),
+			call(["How are you?"], interrupt=False, priority=Priority.MESSAGE),
+			call(["Fine"], interrupt=False, priority=Priority.MESSAGE),
+		]
+
+	def test_say_stream(self) -> None:
+		with patch.object(self.speech, "say_many") as mock_say_many:
+			self.assertIsNone(
+				self.speech.say_stream(iter(self.fragments), interrupt=True, priority=Priority.MESSAGE)
+			)
+			self.assertEqual(mock_say_many.mock_calls, self.expected)
+			mock_say_many.reset_mock()
+			self.speech.say_stream([])
+			mock_say_many.assert_not_called()
+
+	async def test_say_stream_async(self) -> None:
+		async def fragments() -> AsyncIterator[str]:
+			for fragment in self.fragments:
+				await asyncio.sleep(0)  # Fragments arrive over time, like from a socket.
+				yield fragment
+
+		with patch.object(self.speech, "say_many") as mock_say_many:
+			await self.speech.say_stream(fragments(), interrupt=True, priority=Priority.MESSAGE)
+			self.assertEqual(mock_say_many.mock_calls, self.expected)
+
+	def test_say_stream_backend(self) -> None:
+		with patch.object(self.speech, "say", Mock()) as mock_say:
+			self.speech.say_stream(["One. Two", ". Three"])
+			self.assertEqual([c.args[0] for c in mock_say.mock_calls], ["One.", "Two.", "Three"])
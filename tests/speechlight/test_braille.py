@@ -0,0 +1,192 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.braille import BrailleScheduler
+
+
+class _SlowDisplay:
+	"""A display which blocks while sending one of its texts, the first by default, until released."""
+
+	def __init__(self, block: int = 0) -> None:
+		self.texts: list[str] = []
+		self.block: int = block
+		self.sending: threading.Event = threading.Event()
+		self.release: threading.Event = threading.Event()
+
+	def send(self, text: str) -> None:
+		if len(self.texts) == self.block:
+			self.sending.set()
+			self.release.wait(5.0)
+		self.texts.append(text)
+
+
+class TestBrailleScheduler(TestCase):
+	def setUp(self) -> None:
+		self.send: Mock = Mock()
+		# A long interval, so that tests control when pending text is sent.
+		self.scheduler: BrailleScheduler = BrailleScheduler(self.send, interval=60.0)
+
+	def tearDown(self) -> None:
+		self.scheduler.cancel()
+		del self.scheduler
+
+	def test_invalid_arguments(self) -> None:
+		with self.assertRaises(ValueError):
+			BrailleScheduler(self.send, interval=-1.0)
+
+	def test_last_wins(self) -> None:
+		self.scheduler.show("one")
+		self.scheduler.show("two")
+		self.scheduler.show("three")
+		self.send.assert_called_once_with("one")
+		self.assertEqual(self.scheduler.shown, "one")
+		self.assertEqual(self.scheduler.pending, "three")
+		self.scheduler.flush()
+		self.scheduler.flush()
+		self.assertEqual(self.send.mock_calls, [call("one"), call("three")])
+		self.assertEqual(self.scheduler.shown, "three")
+		self.assertIsNone(self.scheduler.pending)
+		self.assertEqual((self.scheduler.sent, self.scheduler.coalesced), (2, 1))
+
+	def test_skip_identical(self) -> None:
+		self.scheduler.show("one")
+		self.scheduler.show("two")
+		# The display already shows this, so the pending text is discarded rather than sent.
+		self.scheduler.show("one")
+		self.assertIsNone(self.scheduler.pending)
+		self.scheduler.flush()
+		self.send.assert_called_once_with("one")
+		self.assertEqual((self.scheduler.sent, self.scheduler.skipped, self.scheduler.coalesced), (1, 1, 1))
+		self.scheduler.reset()
+		self.assertIsNone(self.scheduler.shown)
+		self.scheduler.show("one")
+		self.scheduler.flush()
+		self.assertEqual(self.send.mock_calls, [call("one"), call("one")])
+
+	def test_send_failure(self) -> None:
+		self.send.side_effect = OSError("Display disconnected.")
+		with self.assertRaises(OSError):
+			self.scheduler.show("one")
+		# The display is not assumed to show text which failed to send.
+		self.assertIsNone(self.scheduler.shown)
+
+	def test_cancel(self) -> None:
+		self.scheduler.show("one")
+		self.scheduler.show("two")
+		self.scheduler.cancel()
+		self.assertIsNone(self.scheduler.pending)
+		self.scheduler.flush()
+		self.send.assert_called_once_with("one")
+
+	def test_timer(self) -> None:
+		sent: threading.Event = threading.Event()
+		texts: list[str] = []
+
+		def send(text: str) -> None:
+			texts.append(text)
+			sent.set()
+
+		scheduler: BrailleScheduler = BrailleScheduler(send, interval=0.01)
+		scheduler.show("one")
+		sent.clear()
+		scheduler.show("two")
+		self.assertTrue(sent.wait(timeout=5.0))
+		self.assertEqual(texts, ["one", "two"])
+
+	def test_concurrent(self) -> None:
+		display: _SlowDisplay = _SlowDisplay()
+		scheduler: BrailleScheduler = BrailleScheduler(display.send, interval=0.0)
+		sender: threading.Thread = threading.Thread(target=scheduler.show, args=("one",))
+		sender.start()
+		self.assertTrue(display.sending.wait(5.0))
+		# Callers don't wait for the slow send. The sending thread sends the latest text when it finishes.
+		scheduler.show("two")
+		scheduler.show("three")
+		self.assertEqual(scheduler.pending, "three")
+		display.release.set()
+		sender.join(5.0)
+		self.assertEqual(display.texts, ["one", "three"])
+		self.assertEqual((scheduler.shown, scheduler.sent, scheduler.coalesced), ("three", 2, 1))
+
+	def test_concurrent_duplicate(self) -> None:
+		display: _SlowDisplay = _SlowDisplay(block=1)
+		scheduler: BrailleScheduler = BrailleScheduler(display.send, interval=0.0)
+		scheduler.show("one")
+		sender: threading.Thread = threading.Thread(target=scheduler.show, args=("two",))
+		sender.start()
+		self.assertTrue(display.sending.wait(5.0))
+		# The display will show the text being sent, so text matching what it shows now isn't a duplicate.
+		scheduler.show("one")
+		self.assertEqual(scheduler.pending, "one")
+		display.release.set()
+		sender.join(5.0)
+		self.assertEqual(display.texts, ["one", "two", "one"])
+		self.assertEqual((scheduler.shown, scheduler.skipped), ("one", 0))
+		# Text matching the text being sent is a duplicate.
+		display.sending.clear()
+		display.release.clear()
+		display.block = 3
+		sender = threading.Thread(target=scheduler.show, args=("three",))
+		sender.start()
+		self.assertTrue(display.sending.wait(5.0))
+		scheduler.show("three")
+		self.assertIsNone(scheduler.pending)
+		display.release.set()
+		sender.join(5.0)
+		self.assertEqual(display.texts, ["one", "two", "one", "three"])
+		self.assertEqual(scheduler.skipped, 1)
+
+	def test_concurrent_interval(self) -> None:
+		display: _SlowDisplay = _SlowDisplay()
+		scheduler: BrailleScheduler = BrailleScheduler(display.send, interval=60.0)
+		sender: threading.Thread = threading.Thread(target=scheduler.show, args=("one",))
+		sender.start()
+		self.assertTrue(display.sending.wait(5.0))
+		scheduler.show("two")
+		display.release.set()
+		sender.join(5.0)
+		# Text which arrived during the send waits for the refresh interval.
+		self.assertEqual(display.texts, ["one"])
+		self.assertEqual(scheduler.pending, "two")
+		scheduler.flush()
+		self.assertEqual(display.texts, ["one", "two"])
+
+	@patch("speechlight.braille.logger")
+	def test_timer_failure(self, mock_logger: Mock) -> None:
+		self.send.side_effect = OSError("Display disconnected.")
+		scheduler: BrailleScheduler = BrailleScheduler(self.send, interval=60.0)
+		scheduler._pending = "one"  # NOQA: SLF001
+		scheduler._on_timer()  # NOQA: SLF001
+		mock_logger.exception.assert_called_once()
+		# A failed send doesn't stop later updates.
+		self.send.side_effect = None
+		scheduler.show("two")
+		scheduler.flush()
+		self.send.assert_called_with("two")
@@ -0,0 +1,231 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import threading
+import time
+from typing import Any
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.base import CALLBACK_BEGIN, CALLBACK_CANCEL, BaseSpeech, Priority
+from speechlight.chunking import ChunkingSpeech
+from speechlight.speech_dispatcher import Speech as SpeechDispatcher
+
+
+TEXT: str = "The first sentence. The second sentence. The third sentence."
+
+
+def wait_for_calls(func: Mock, count: int) -> None:
+	"""
+	Waits until a mock has been called a number of times.
+
+	Args:
+		func: The mock.
+		count: The number of calls.
+	"""
+	deadline: float = time.monotonic() + 5.0
+	while func.call_count < count and time.monotonic() < deadline:
+		time.sleep(0.001)
+
+
+class TestChunkingSpeechPolling(TestCase):
+	def setUp(self) -> None:
+		self.backend: Mock = Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = True
+		self.speech: ChunkingSpeech = ChunkingSpeech(self.backend, max_length=20, poll_interval=0.001)
+
+	def tearDown(self) -> None:
+		self.speech.close(timeout=1.0)
+		del self.speech
+
+	def test_short_text(self) -> None:
+		self.speech.say("Short.", interrupt=True)
+		self.backend.say.assert_called_once_with("Short.", interrupt=True, priority=Priority.TEXT)
+		self.speech.output("Short.")
+		self.backend.output.assert_called_once_with("Short.", interrupt=False, priority=Priority.TEXT)
+		self.speech.braille("Short.")
+		self.backend.braille.assert_called_once_with("Short.")
+		self.speech.say(" " * 30)
+		self.assertEqual(self.backend.say.call_count, 1)
+		with self.assertRaises(ValueError):
+			ChunkingSpeech(self.backend, max_length=0)
+
+	def test_chunks(self) -> None:
+		self.speech.say(TEXT, priority=Priority.MESSAGE)
+		self.backend.say.assert_called_once_with(
+			"The first sentence.", interrupt=False, priority=Priority.MESSAGE
+		)
+		# Later text waits behind the held back chunks.
+		self.speech.output("Short.")
+		self.backend.output.assert_not_called()
+		self.backend.braille.assert_called_once_with("Short.")
+		self.assertTrue(self.speech.speaking())
+		self.backend.speaking.return_value = False
+		wait_for_calls(self.backend.say, 4)
+		self.assertEqual(
+			self.backend.say.mock_calls[1:],
+			[
+				call("The second sentence.", priority=Priority.MESSAGE),
+				call("The third sentence.", priority=Priority.MESSAGE),
+				call("Short.", priority=Priority.TEXT),
+			],
+		)
+		self.assertFalse(self.speech.speaking())
+
+	def test_output(self) -> None:
+		self.speech.output(TEXT, interrupt=True)
+		self.backend.say.assert_called_once_with(
+			"The first sentence.", interrupt=True, priority=Priority.TEXT
+		)
+		self.backend.braille.assert_called_once_with(TEXT)
+
+	def test_silence(self) -> None:
+		self.speech.say(TEXT)
+		self.speech.silence()
+		self.backend.silence.assert_called_once_with()
+		self.assertFalse(self.speech._chunks)  # NOQA: SLF001
+		# Interrupting also discards held back chunks.
+		self.speech.say(TEXT)
+		self.speech.say("Short.", interrupt=True)
+		self.assertFalse(self.speech._chunks)  # NOQA: SLF001
+		self.assertEqual(
+			self.backend.say.mock_calls[-1], call("Short.", interrupt=True, priority=Priority.TEXT)
+		)
+
+	def test_send_next(self) -> None:
+		self.speech._chunks.append(("Held back.", Priority.TEXT))  # NOQA: SLF001
+		self.speech._send_next(polling=True)  # NOQA: SLF001
+		# Nothing is sent if the chunks were discarded before the worker thread could send them.
+		self.speech._chunks.clear()  # NOQA: SLF001
+		self.backend.speaking.return_value = False
+		self.speech._send_next(polling=True)  # NOQA: SLF001
+		self.speech._send_next(polling=False)  # NOQA: SLF001
+		self.backend.say.assert_not_called()
+
+	@patch("speechlight.chunking.logger")
+	def test_errors(self, mock_logger: Mock) -> None:
+		self.backend.speaking.return_value = False
+		self.backend.say.side_effect = [None, RuntimeError("Backend failure."), None]
+		self.speech.say(TEXT)
+		wait_for_calls(self.backend.say, 3)
+		mock_logger.exception.assert_called_once()
+
+
+@patch("speechlight.speech_dispatcher.logger", Mock())
+class TestChunkingSpeechEvents(TestCase):
+	def setUp(self) -> None:
+		self.backend: SpeechDispatcher = SpeechDispatcher()
+		self.sd: Mock = Mock()
+		self.backend._sd = self.sd  # NOQA: SLF001
+		self.speech: ChunkingSpeech = ChunkingSpeech(self.backend, max_length=20)
+
+	def tearDown(self) -> None:
+		self.speech.close(timeout=1.0)
+		self.backend._sd = None  # NOQA: SLF001
+		del self.speech
+		del self.backend
+
+	def fire(self, index: int, event_type: str) -> None:
+		"""
+		Sends an event for a message.
+
+		Args:
+			index: The index of the message in the calls to speak.
+			event_type: The event type.
+		"""
+		self.sd.speak.mock_calls[index].kwargs["callback"](event_type)
+
+	def test_chunks(self) -> None:
+		self.speech.say(TEXT)
+		self.assertEqual(self.sd.speak.call_count, 1)
+		# The next chunk is sent as soon as the previous one begins.
+		self.fire(0, CALLBACK_BEGIN)
+		wait_for_calls(self.sd.speak, 2)
+		self.assertEqual(self.sd.speak.mock_calls[1].args, ("The second sentence.",))
+		self.assertTrue(self.speech.speaking())
+		self.fire(1, CALLBACK_CANCEL)
+		wait_for_calls(self.sd.speak, 3)
+		self.assertEqual(self.sd.speak.mock_calls[2].args, ("The third sentence.",))
+		self.speech.close(timeout=1.0)
+		self.assertNotIn(self.speech._on_event, self.backend._event_listeners)  # NOQA: SLF001
+
+
+class _CommunicationThread:
+	"""
+	Configures a mock SSIP client to deliver events on a separate thread, and wait for them to be handled.
+
+	This is how speechd behaves, as the thread which delivers events also delivers the reply
+	to each command.
+	"""
+
+	def __init__(self) -> None:
+		self.sd: Mock = Mock()
+		self.sd.speak.side_effect = self._speak
+		self.sd.cancel.side_effect = self._cancel
+		self.callbacks: list[Any] = []
+		self.stalls: int = 0
+
+	def _deliver(self, event_type: str) -> None:
+		thread: threading.Thread = threading.Thread(
+			target=lambda: [callback(event_type) for callback in tuple(self.callbacks)], daemon=True
+		)
+		thread.start()
+		thread.join(5.0)
+		if thread.is_alive():
+			self.stalls += 1
+
+	def _speak(self, text: str, **kwargs: Any) -> None:
+		if kwargs.get("callback") is not None:
+			self.callbacks.append(kwargs["callback"])
+		self._deliver(CALLBACK_BEGIN)
+
+	def _cancel(self, *args: Any) -> None:
+		self._deliver(CALLBACK_CANCEL)
+
+
+@patch("speechlight.speech_dispatcher.logger", Mock())
+class TestChunkingSpeechCommunicationThread(TestCase):
+	def setUp(self) -> None:
+		self.backend: SpeechDispatcher = SpeechDispatcher()
+		self.communication: _CommunicationThread = _CommunicationThread()
+		self.sd: Mock = self.communication.sd
+		self.backend._sd = self.sd  # NOQA: SLF001
+		self.speech: ChunkingSpeech = ChunkingSpeech(self.backend, max_length=20)
+
+	def tearDown(self) -> None:
+		self.speech.close(timeout=1.0)
+		self.backend._sd = None  # NOQA: SLF001
+		del self.speech
+		del self.backend
+
+	def test_events_during_calls(self) -> None:
+		self.speech.say(TEXT)
+		# Each chunk's BEGIN event sends the next chunk, from the worker thread.
+		wait_for_calls(self.sd.speak, 3)
+		self.speech.say(TEXT, interrupt=True)
+		self.speech.silence()
+		self.assertEqual(self.communication.stalls, 0)
+		self.sd.cancel.assert_called()
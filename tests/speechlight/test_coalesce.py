@@ -0,0 +1,168 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.coalesce import CoalescingSpeech
+
+
+class TestCoalescingSpeech(TestCase):
+	def setUp(self) -> None:
+		self.backend: Mock = Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = False
+		# A long window, so that tests control when the buffer is flushed.
+		self.speech: CoalescingSpeech = CoalescingSpeech(self.backend, window=60.0)
+
+	def tearDown(self) -> None:
+		self.speech.close()
+		del self.speech
+
+	def test_invalid_arguments(self) -> None:
+		with self.assertRaises(ValueError):
+			CoalescingSpeech(self.backend, max_rate=0)
+		with self.assertRaises(ValueError):
+			CoalescingSpeech(self.backend, max_pending=0)
+
+	def test_merge(self) -> None:
+		self.speech.say("one")
+		self.speech.say("two")
+		self.speech.output("three")
+		self.speech.braille("four")
+		self.speech.braille("five")
+		self.speech.say_many(["six", "seven"])
+		self.assertTrue(self.speech.speaking())
+		self.backend.say.assert_not_called()
+		self.speech.flush()
+		self.assertEqual(
+			self.backend.mock_calls,
+			[
+				call.say("one\ntwo", priority=Priority.TEXT),
+				call.output("three", priority=Priority.TEXT),
+				call.braille("five"),
+				call.say("six\nseven", priority=Priority.TEXT),
+			],
+		)
+		self.assertEqual((self.speech.sent, self.speech.merged, self.speech.dropped), (4, 3, 0))
+		self.assertFalse(self.speech.speaking())
+		self.backend.speaking.assert_called_once()
+
+	def test_priority(self) -> None:
+		self.speech.say("one")
+		self.speech.say("two", priority=Priority.IMPORTANT)
+		self.speech.say("three", priority=Priority.IMPORTANT)
+		self.speech.flush()
+		self.assertEqual(
+			self.backend.mock_calls,
+			[call.say("one", priority=Priority.TEXT), call.say("two\nthree", priority=Priority.IMPORTANT)],
+		)
+
+	def test_window(self) -> None:
+		flushed: threading.Event = threading.Event()
+		self.backend.say.side_effect = lambda text, **kwargs: flushed.set()
+		speech: CoalescingSpeech = CoalescingSpeech(self.backend, window=0.001)
+		speech.say("one")
+		self.assertTrue(flushed.wait(timeout=5.0))
+		self.backend.say.assert_called_once_with("one", priority=Priority.TEXT)
+
+	def test_window_failure(self) -> None:
+		self.backend.say.side_effect = RuntimeError("Backend failure.")
+		self.speech.say("one")
+		self.speech._cancel_timer()  # NOQA: SLF001
+		with self.assertLogs("speechlight.coalesce", "ERROR"):
+			self.speech._on_timer()  # NOQA: SLF001
+		self.assertIsNone(self.speech._timer)  # NOQA: SLF001
+
+	def test_slow_backend(self) -> None:
+		started: threading.Event = threading.Event()
+		release: threading.Event = threading.Event()
+
+		def say(*args: object, **kwargs: object) -> None:
+			started.set()
+			release.wait(timeout=5.0)
+
+		self.backend.say.side_effect = say
+		self.speech.say("one")
+		sender: threading.Thread = threading.Thread(target=self.speech.flush)
+		sender.start()
+		self.assertTrue(started.wait(timeout=5.0))
+		# Messages are buffered without waiting for the slow call.
+		self.speech.say("two")
+		self.assertTrue(self.speech.speaking())
+		release.set()
+		sender.join(timeout=5.0)
+		self.speech.flush()
+		self.assertEqual([c.args[0] for c in self.backend.say.mock_calls], ["one", "two"])
+
+	def test_max_pending(self) -> None:
+		self.speech = CoalescingSpeech(self.backend, window=60.0, max_pending=2)
+		self.assertEqual(self.speech.max_pending, 2)
+		for text in ("one", "two", "three"):
+			self.speech.say(text)
+		self.speech.flush()
+		self.backend.say.assert_called_once_with("two\nthree", priority=Priority.TEXT)
+		self.assertEqual(self.speech.dropped, 1)
+
+	def test_interrupt(self) -> None:
+		self.speech.say("one")
+		self.speech.say("two", interrupt=True)
+		self.backend.say.assert_called_once_with("two", interrupt=True, priority=Priority.TEXT)
+		self.speech.output("three")
+		self.speech.output("four", interrupt=True)
+		self.backend.output.assert_called_once_with("four", interrupt=True, priority=Priority.TEXT)
+		self.assertEqual((self.speech.sent, self.speech.dropped), (2, 2))
+		self.speech.say("five")
+		self.speech.silence()
+		self.backend.silence.assert_called_once_with()
+		self.speech.flush()
+		self.assertEqual(self.backend.say.call_count, 1)
+		self.assertEqual(self.speech.dropped, 3)
+
+	@patch("speechlight.coalesce.time.monotonic")
+	def test_max_rate(self, mock_monotonic: Mock) -> None:
+		mock_monotonic.return_value = 0.0
+		speech: CoalescingSpeech = CoalescingSpeech(self.backend, window=60.0, max_rate=2.0)
+		speech.say("one")
+		speech.output("two")
+		speech.say("three")
+		speech.flush()
+		# The budget allows a burst of two calls, then the rest waits for a token.
+		self.assertEqual(
+			self.backend.mock_calls,
+			[call.say("one", priority=Priority.TEXT), call.output("two", priority=Priority.TEXT)],
+		)
+		speech.say("four")
+		mock_monotonic.return_value = 0.5
+		speech.flush()
+		self.backend.say.assert_called_with("three\nfour", priority=Priority.TEXT)
+		self.assertEqual((speech.sent, speech.merged), (3, 1))
+		speech.say("five")
+		speech.close()
+		self.backend.say.assert_called_with("five", priority=Priority.TEXT)
+		# Closing ignores the budget without changing it.
+		self.assertEqual(speech.max_rate, 2.0)
@@ -0,0 +1,188 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import threading
+from typing import Any
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.composite import BRAILLE, CHANNELS, SPEECH, CompositeSpeech
+
+
+class TestCompositeSpeech(TestCase):
+	def setUp(self) -> None:
+		self.voice: Mock = Mock(spec=BaseSpeech)
+		self.display: Mock = Mock(spec=BaseSpeech)
+		self.mirror: Mock = Mock(spec=BaseSpeech)
+		for backend in (self.voice, self.display, self.mirror):
+			backend.speaking.return_value = False
+		self.speech: CompositeSpeech = CompositeSpeech(
+			[
+				(self.voice, {SPEECH}),
+				(self.display, {BRAILLE}),
+				(self.mirror, CHANNELS),
+			]
+		)
+
+	def tearDown(self) -> None:
+		self.speech.close()
+		del self.speech
+
+	def test_children(self) -> None:
+		with self.assertRaises(ValueError):
+			self.speech.add(Mock(spec=BaseSpeech), ())
+		with self.assertRaises(ValueError):
+			self.speech.add(Mock(spec=BaseSpeech), {"smell"})
+		self.speech.remove(self.mirror)
+		with self.assertRaises(ValueError):
+			self.speech.remove(self.mirror)
+		self.assertEqual(self.speech.children, [(self.voice, {SPEECH}), (self.display, {BRAILLE})])
+
+	def test_routing(self) -> None:
+		self.speech.braille("one")
+		self.speech.say("two", priority=Priority.IMPORTANT)
+		self.speech.output("three")
+		self.speech.say_many(iter(["four", "five"]))
+		self.speech.output_many(iter(["six", "seven"]))
+		# Silencing discards calls which are still queued, so let them finish first.
+		self.assertTrue(self.speech.wait(timeout=5.0))
+		self.speech.silence()
+		self.assertTrue(self.speech.wait(timeout=5.0))
+		self.assertEqual(
+			self.voice.mock_calls,
+			[
+				call.say("two", interrupt=False, priority=Priority.IMPORTANT),
+				call.say("three", interrupt=False, priority=Priority.TEXT),
+				call.say_many(["four", "five"], interrupt=False, priority=Priority.TEXT),
+				call.say_many(["six", "seven"], interrupt=False, priority=Priority.TEXT),
+				call.silence(),
+			],
+		)
+		self.assertEqual(
+			self.display.mock_calls,
+			[call.braille("one"), call.braille("three"), call.braille("six"), call.braille("seven")],
+		)
+		self.assertEqual(
+			self.mirror.mock_calls,
+			[
+				call.braille("one"),
+				call.say("two", interrupt=False, priority=Priority.IMPORTANT),
+				call.output("three", interrupt=False, priority=Priority.TEXT),
+				call.say_many(["four", "five"], interrupt=False, priority=Priority.TEXT),
+				call.output_many(["six", "seven"], interrupt=False, priority=Priority.TEXT),
+				call.silence(),
+			],
+		)
+
+	def test_parallel(self) -> None:
+		release: threading.Event = threading.Event()
+		brailled: threading.Event = threading.Event()
+		self.voice.say.side_effect = lambda *args, **kwargs: release.wait(timeout=5.0)
+		self.display.braille.side_effect = lambda text: brailled.set()
+		self.speech.output("one")
+		# The display isn't held up by the slow voice.
+		self.assertTrue(brailled.wait(timeout=5.0))
+		self.assertFalse(self.speech.wait(timeout=0.0))
+		release.set()
+		self.assertTrue(self.speech.wait(timeout=5.0))
+
+	def test_interrupt(self) -> None:
+		started: threading.Event = threading.Event()
+		release: threading.Event = threading.Event()
+
+		def say(*args: object, **kwargs: object) -> None:
+			started.set()
+			release.wait(timeout=5.0)
+
+		self.voice.say.side_effect = say
+		self.speech.remove(self.mirror)
+		self.speech.say("one")
+		self.assertTrue(started.wait(timeout=5.0))
+		self.speech.say("two")
+		self.speech.braille("three")
+		self.speech.output("four", interrupt=True)
+		release.set()
+		self.assertTrue(self.speech.wait(timeout=5.0))
+		# The call in progress finishes, but the queued call is discarded.
+		self.assertEqual(
+			self.voice.say.mock_calls,
+			[
+				call("one", interrupt=False, priority=Priority.TEXT),
+				call("four", interrupt=True, priority=Priority.TEXT),
+			],
+		)
+		self.assertEqual(self.display.braille.mock_calls, [call("three"), call("four")])
+		self.assertEqual(self.speech.dropped, 1)
+
+	def test_closed(self) -> None:
+		self.speech.close()
+		# Calls after close are ignored, rather than failing in a stopped worker thread.
+		self.speech.output("one")
+		self.speech.say("two")
+		self.speech.silence()
+		self.assertTrue(self.speech.wait(timeout=0.0))
+		self.voice.say.assert_not_called()
+		with self.assertRaises(RuntimeError):
+			self.speech.add(Mock(spec=BaseSpeech))
+
+	def test_concurrent_remove(self) -> None:
+		# A child which is removed while a call is being queued receives all of the call or none of it.
+		removed: threading.Thread = threading.Thread(target=self.speech.remove, args=(self.mirror,))
+		original_submit = self.speech._submit  # NOQA: SLF001
+
+		def submit(*args: Any, **kwargs: Any) -> None:
+			if removed.ident is None:
+				removed.start()
+			original_submit(*args, **kwargs)
+
+		with patch.object(self.speech, "_submit", side_effect=submit):
+			self.speech.output("one")
+		removed.join(timeout=5.0)
+		self.assertTrue(self.speech.wait(timeout=5.0))
+		self.mirror.output.assert_called_once_with("one", interrupt=False, priority=Priority.TEXT)
+
+	def test_errors(self) -> None:
+		self.voice.say.side_effect = OSError("Speech server unavailable.")
+		with self.assertLogs("speechlight.composite", "ERROR"):
+			self.speech.say("one")
+			self.assertTrue(self.speech.wait(timeout=5.0))
+		self.mirror.say.assert_called_once_with("one", interrupt=False, priority=Priority.TEXT)
+		self.assertEqual(self.speech.errors, 1)
+
+	def test_speaking(self) -> None:
+		self.assertFalse(self.speech.speaking())
+		self.mirror.speaking.return_value = True
+		self.assertTrue(self.speech.speaking())
+		self.display.speaking.assert_not_called()
+		self.mirror.speaking.return_value = False
+		release: threading.Event = threading.Event()
+		self.voice.say.side_effect = lambda *args, **kwargs: release.wait(timeout=5.0)
+		self.speech.say("one")
+		# Queued calls count as speaking.
+		self.assertTrue(self.speech.speaking())
+		release.set()
+		self.assertTrue(self.speech.wait(timeout=5.0))
@@ -0,0 +1,399 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import concurrent.futures
+import importlib
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, cast
+from unittest import TestCase, mock
+
+# Speechlight Modules:
+import speechlight
+from speechlight.base import BaseSpeech, Priority
+from speechlight.daemon import _RequestHandler  # NOQA: PLC2701
+from speechlight.daemon import (
+	DEFAULT_PORT,
+	LOOPBACK,
+	SpeechClient,
+	SpeechServer,
+	connect,
+	default_address,
+	encode,
+	main,
+	make_private_directory,
+	parse_address,
+	token_path,
+)
+
+
+@contextmanager
+def without_attribute(obj: object, name: str) -> Iterator[None]:
+	"""
+	Removes an attribute, restoring it afterward.
+
+	Args:
+		obj: The object.
+		name: The attribute name.
+
+	Yields:
+		Nothing.
+	"""
+	value: Any = getattr(obj, name)
+	delattr(obj, name)
+	try:
+		yield
+	finally:
+		setattr(obj, name, value)
+
+
+def use_private_runtime_directory(test_case: TestCase) -> None:
+	"""
+	Points the runtime directory to a temporary directory for the rest of a test.
+
+	Args:
+		test_case: The test case.
+	"""
+	directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+	test_case.addCleanup(directory.cleanup)
+	patcher = mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": directory.name})
+	patcher.start()
+	test_case.addCleanup(patcher.stop)
+
+
+class TestFunctions(TestCase):
+	def test_default_address(self) -> None:
+		with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": "/run/user/1000"}):
+			self.assertEqual(default_address(), f"/run/user/1000/speechlight-{os.getuid()}/daemon.sock")
+		with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": ""}):
+			self.assertEqual(
+				default_address(),
+				str(Path(tempfile.gettempdir()) / f"speechlight-{os.getuid()}" / "daemon.sock"),
+			)
+
+	def test_without_unix_sockets(self) -> None:
+		# Platforms such as Windows have no UNIX domain sockets.
+		with (
+			mock.patch.dict(sys.modules),
+			mock.patch.dict(speechlight.__dict__),
+			without_attribute(socket, "AF_UNIX"),
+			without_attribute(socketserver, "ThreadingUnixStreamServer"),
+		):
+			del sys.modules["speechlight.daemon"]
+			sys.modules.pop("speechlight.record", None)
+			daemon: Any = importlib.import_module("speechlight.daemon")
+			importlib.import_module("speechlight.record")
+			self.assertFalse(hasattr(daemon, "_UnixServer"))
+			self.assertEqual(daemon.default_address(), (LOOPBACK, DEFAULT_PORT))
+
+	def test_make_private_directory(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			path: Path = Path(directory) / "private" / "nested"
+			make_private_directory(path)
+			self.assertEqual(path.stat().st_mode & 0o777, 0o700)
+			# An existing private directory is accepted.
+			make_private_directory(path)
+			path.chmod(0o755)
+			with self.assertRaises(PermissionError):
+				make_private_directory(path)
+
+	def test_parse_address(self) -> None:
+		self.assertEqual(parse_address("speechlight.sock"), "speechlight.sock")
+		self.assertEqual(parse_address("localhost:1234"), ("localhost", 1234))
+		self.assertEqual(parse_address(":1234"), (LOOPBACK, 1234))
+		self.assertEqual(parse_address("speech:socket"), "speech:socket")
+
+	def test_connect_failure(self) -> None:
+		with tempfile.TemporaryDirectory() as directory, self.assertRaises(OSError):
+			connect(str(Path(directory) / "missing.sock"))
+
+	@mock.patch("speechlight.daemon.SpeechServer")
+	def test_main(self, mock_server_class: mock.Mock) -> None:  # NOQA: PLR6301
+		mock_server: mock.Mock = mock_server_class.return_value
+		mock_server.serve_forever.side_effect = KeyboardInterrupt
+		with mock.patch("speechlight.registry.create") as mock_create:
+			main(["--address", ":1234"])
+		mock_create.assert_called_once_with()
+		mock_server_class.assert_called_once_with(mock_create.return_value, (LOOPBACK, 1234))
+		mock_server.close.assert_called_once()
+
+
+class TestSpeechServer(TestCase):
+	def setUp(self) -> None:
+		self.backend: mock.Mock = mock.Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = True
+		self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+		self.path: str = str(Path(self.directory.name) / "speechlight.sock")
+		self.server: SpeechServer = SpeechServer(self.backend, self.path)
+
+	def tearDown(self) -> None:
+		self.server.close()
+		self.directory.cleanup()
+		del self.server
+
+	def test_handle(self) -> None:
+		self.assertIsNone(self.server.handle(encode({"method": "braille", "text": "one"})))
+		self.server.handle(encode({"method": "output", "text": "two", "interrupt": True}))
+		self.server.handle(encode({"method": "say", "text": "three", "priority": "important"}))
+		self.server.handle(encode({"method": "output_many", "texts": ["four", "five"]}))
+		self.server.handle(encode({"method": "say_many", "texts": ["six"], "priority": "progress"}))
+		self.server.handle(encode({"method": "silence"}))
+		self.assertEqual(
+			self.backend.mock_calls,
+			[
+				mock.call.braille("one"),
+				mock.call.output("two", interrupt=True, priority=Priority.TEXT),
+				mock.call.say("three", interrupt=False, priority=Priority.IMPORTANT),
+				mock.call.output_many(["four", "five"], interrupt=False, priority=Priority.TEXT),
+				mock.call.say_many(["six"], interrupt=False, priority=Priority.PROGRESS),
+				mock.call.silence(),
+			],
+		)
+		self.assertEqual(
+			self.server.handle(encode({"method": "speaking", "id": 1})), b'{"id":1,"result":true}\n'
+		)
+		self.assertEqual((self.server.requests, self.server.errors), (7, 0))
+
+	def test_handle_errors(self) -> None:
+		with self.assertLogs("speechlight.daemon", "ERROR"):
+			self.assertIsNone(self.server.handle(b"not json\n"))
+			self.assertIsNone(self.server.handle(b"[]\n"))
+			self.assertIsNone(self.server.handle(encode({"method": "say", "text": "one", "priority": "low"})))
+			response: bytes | None = self.server.handle(encode({"method": "shout", "id": 2}))
+		self.assertEqual(response, b'{"id":2,"error":"ValueError: Unknown method: \'shout\'"}\n')
+		self.assertEqual(self.server.errors, 4)
+		self.backend.say.assert_not_called()
+
+	def test_private_directory(self) -> None:
+		self.assertEqual(Path(self.directory.name).stat().st_mode & 0o777, 0o700)
+		shared: Path = Path(self.directory.name) / "shared"
+		shared.mkdir(mode=0o755)
+		shared.chmod(0o755)
+		with self.assertRaises(PermissionError):
+			SpeechServer(self.backend, str(shared / "speechlight.sock"))
+		self.assertIsNone(self.server.token)
+
+	def test_address_in_use(self) -> None:
+		self.server.start()
+		with self.assertRaises(OSError):
+			SpeechServer(self.backend, self.path)
+
+	def test_stale_socket(self) -> None:
+		self.server.close()
+		# A socket file which nothing is listening on.
+		with socket.socket(socket.AF_UNIX) as sock:
+			sock.bind(self.path)
+		server: SpeechServer = SpeechServer(self.backend, self.path)
+		server.close()
+		self.assertFalse(Path(self.path).exists())
+
+	def test_client_disconnected(self) -> None:
+		client, peer = socket.socketpair()
+		client.sendall(encode({"method": "speaking", "id": 1}))
+		client.close()
+		with self.assertLogs("speechlight.daemon", "DEBUG"):
+			_RequestHandler(peer, "", mock.Mock(), speech_server=self.server)
+		peer.close()
+		self.backend.speaking.assert_called_once()
+
+
+class TestSpeechClient(TestCase):
+	def setUp(self) -> None:
+		use_private_runtime_directory(self)
+		self.backend: mock.Mock = mock.Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = True
+		self.server: SpeechServer = SpeechServer(self.backend, (LOOPBACK, 0))
+		self.server.start()
+		self.client: SpeechClient = SpeechClient(self.server.address)
+
+	def tearDown(self) -> None:
+		self.client.close()
+		self.server.close()
+		del self.client
+		del self.server
+
+	def test_invalid_arguments(self) -> None:
+		with self.assertRaises(ValueError):
+			SpeechClient(self.server.address, maxsize=0)
+
+	def test_token(self) -> None:
+		address: tuple[str, int] = cast("tuple[str, int]", self.server.address)
+		path: Path = token_path(address)
+		self.assertEqual(path.read_text(encoding="utf-8"), self.server.token)
+		self.assertEqual(path.stat().st_mode & 0o777, 0o600)
+		# Clients which don't send the token are disconnected before their requests are handled.
+		for first_line in (encode({"token": "wrong"}), encode({"method": "silence"}), b"[]\n", b"not json\n"):
+			with (
+				self.subTest(first_line=first_line),
+				self.assertLogs("speechlight.daemon", "WARNING"),
+				connect(address) as sock,
+			):
+				sock.sendall(first_line + encode({"method": "silence", "id": 1}))
+				self.assertEqual(sock.recv(1024), b"")
+		self.backend.silence.assert_not_called()
+		self.server.close()
+		self.assertFalse(path.exists())
+
+	def test_token_failure(self) -> None:
+		with (
+			mock.patch.object(SpeechServer, "_write_token", side_effect=PermissionError("Denied.")),
+			self.assertRaises(PermissionError),
+		):
+			SpeechServer(self.backend, (LOOPBACK, 0))
+
+	def test_calls(self) -> None:
+		self.client.output("one", interrupt=True)
+		self.client.braille("two")
+		self.client.say("three", priority=Priority.IMPORTANT)
+		self.client.output_many(iter(["four", "five"]))
+		self.client.say_many(["six"])
+		# Requests are pipelined, so a response means all earlier requests have been handled.
+		self.assertTrue(self.client.speaking())
+		self.assertEqual(
+			self.backend.mock_calls,
+			[
+				mock.call.output("one", interrupt=True, priority=Priority.TEXT),
+				mock.call.braille("two"),
+				mock.call.say("three", interrupt=False, priority=Priority.IMPORTANT),
+				mock.call.output_many(["four", "five"], interrupt=False, priority=Priority.TEXT),
+				mock.call.say_many(["six"], interrupt=False, priority=Priority.TEXT),
+				mock.call.speaking(),
+			],
+		)
+		# The writer thread counts a request as sent after it has been sent, so wait for it to finish.
+		self.client.close()
+		self.assertEqual((self.client.sent, self.client.dropped), (6, 0))
+
+	def test_silence(self) -> None:
+		# Hold the condition, so the writer thread can't take requests from the queue.
+		future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+		with self.client._condition:  # NOQA: SLF001
+			self.client.say("one")
+			self.client._responses[0] = future  # NOQA: SLF001
+			self.client._enqueue(encode({"method": "speaking", "id": 0}), request_id=0)  # NOQA: SLF001
+			# Unsent requests are discarded, except those waiting for a response.
+			self.client.silence()
+		self.assertTrue(future.result(5.0))
+		self.assertTrue(self.client.speaking())
+		self.assertEqual(
+			self.backend.mock_calls, [mock.call.speaking(), mock.call.silence(), mock.call.speaking()]
+		)
+		self.assertEqual(self.client.dropped, 1)
+
+	def test_queue_limits(self) -> None:
+		client: SpeechClient = SpeechClient(self.server.address, maxsize=2)
+		# Hold the condition, so the writer thread can't take requests from the queue.
+		future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+		with client._condition:  # NOQA: SLF001
+			client._responses[0] = future  # NOQA: SLF001
+			client._enqueue(encode({"method": "speaking", "id": 0}), request_id=0)  # NOQA: SLF001
+			client.say("one")
+			client.say("two")
+			# A dropped request which was waiting for a response fails immediately.
+			with self.assertRaises(RuntimeError):
+				future.result(0.0)
+			client.say("three")
+			self.assertEqual(client.dropped, 2)
+			client.say("four", interrupt=True)
+			self.assertEqual(client.dropped, 4)
+		client.close()
+		client.say("five")
+		with self.assertRaises(RuntimeError):
+			client.request("speaking")
+		self.assertTrue(self.client.speaking())
+		self.backend.say.assert_called_once_with("four", interrupt=True, priority=Priority.TEXT)
+
+	def test_error_response(self) -> None:
+		self.backend.speaking.side_effect = OSError("Speech server unavailable.")
+		with self.assertLogs("speechlight.daemon", "DEBUG"):
+			self.assertFalse(self.client.speaking())
+		# A response to a request which is no longer waiting is ignored.
+		self.client._resolve({"id": 0, "result": True})  # NOQA: SLF001
+
+	def test_daemon_unavailable(self) -> None:
+		self.server.close()
+		with self.assertLogs("speechlight.daemon", "DEBUG"):
+			self.assertFalse(self.client.speaking())
+		self.assertEqual(self.client.dropped, 1)
+
+	def test_send_failure(self) -> None:
+		sock: mock.Mock = mock.Mock(spec=socket.socket)
+		sock.sendall.side_effect = OSError("Connection reset.")
+		with self.client._condition:  # NOQA: SLF001
+			self.client._socket = sock  # NOQA: SLF001
+		with self.assertLogs("speechlight.daemon", "DEBUG"):
+			self.assertFalse(self.client.speaking())
+		sock.close.assert_called_once()
+		self.assertEqual(self.client.dropped, 1)
+		# The next request reconnects.
+		self.assertTrue(self.client.speaking())
+
+
+class TestSpeechClientProtocol(TestCase):
+	"""Tests the client against a listening socket which doesn't follow the protocol."""
+
+	def setUp(self) -> None:
+		use_private_runtime_directory(self)
+		self.listener: socket.socket = socket.create_server((LOOPBACK, 0))
+		make_private_directory(token_path(self.listener.getsockname()[:2]).parent)
+		token_path(self.listener.getsockname()[:2]).write_text("token", encoding="utf-8")
+		self.client: SpeechClient = SpeechClient(self.listener.getsockname()[:2], timeout=0.1)
+
+	def tearDown(self) -> None:
+		self.client.close()
+		self.listener.close()
+
+	def test_timeout(self) -> None:
+		with self.assertLogs("speechlight.daemon", "DEBUG"):
+			self.assertFalse(self.client.speaking())
+		self.assertEqual(self.client._responses, {})  # NOQA: SLF001
+
+	def test_invalid_response(self) -> None:
+		def reply() -> None:
+			connection, _ = self.listener.accept()
+			with connection:
+				connection.recv(1024)
+				connection.sendall(b"not json\n")
+
+		thread: threading.Thread = threading.Thread(target=reply)
+		thread.start()
+		self.client.timeout = 5.0
+		with self.assertLogs("speechlight.daemon", "DEBUG") as logs:
+			self.assertFalse(self.client.speaking())
+		thread.join()
+		self.assertIn("Reading from the speech daemon failed", logs.output[0])
+
+	def test_missing_token(self) -> None:
+		token_path(self.listener.getsockname()[:2]).unlink()
+		with self.assertLogs("speechlight.daemon", "DEBUG") as logs:
+			self.assertFalse(self.client.speaking())
+		self.assertIn("Sending to the speech daemon failed", logs.output[0])
@@ -26,6 +26,7 @@ from __future__ import annotations
 from unittest import TestCase, mock
 
 # Speechlight Modules:
+from speechlight.base import Priority
 from speechlight.darwin import Speech
 
 
@@ -44,9 +45,23 @@ class TestDarwin(TestCase):
 	@mock.patch("speechlight.darwin.Speech.say")
 	def test_output(self, mock_say: mock.Mock, mock_braille: mock.Mock) -> None:
 		self.speech.output(self.text, interrupt=True)
-		mock_say.assert_called_once_with(self.text, interrupt=True)
+		mock_say.assert_called_once_with(self.text, interrupt=True, priority=Priority.TEXT)
 		mock_braille.assert_called_once_with(self.text)
 
+	@mock.patch("speechlight.darwin.Speech.output")
+	def test_output_many(self, mock_output: mock.Mock) -> None:
+		self.speech.output_many([])
+		mock_output.assert_not_called()
+		self.speech.output_many(["first", "second"], interrupt=True)
+		mock_output.assert_called_once_with("first\nsecond", interrupt=True, priority=Priority.TEXT)
+
+	@mock.patch("speechlight.darwin.Speech.say")
+	def test_say_many(self, mock_say: mock.Mock) -> None:
+		self.speech.say_many([])
+		mock_say.assert_not_called()
+		self.speech.say_many(["first", "second"], interrupt=True)
+		mock_say.assert_called_once_with("first\nsecond", interrupt=True, priority=Priority.TEXT)
+
 	@mock.patch("speechlight.darwin.Speech.silence")
 	def test_say(self, mock_silence: mock.Mock) -> None:
 		with mock.patch.object(self.speech, "_darwin", mock.Mock()) as mock_darwin:
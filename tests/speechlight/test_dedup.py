@@ -0,0 +1,170 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.dedup import DeduplicatingSpeech
+
+
+@patch("speechlight.dedup.threading.Timer")
+@patch("speechlight.dedup.time.monotonic", return_value=100.0)
+class TestDeduplicatingSpeech(TestCase):
+	def setUp(self) -> None:
+		self.text: str = "You are hungry."
+		self.backend: Mock = Mock(spec=BaseSpeech)
+
+	def test_suppress(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend, window=5.0)
+		speech.output(self.text)
+		speech.output(self.text)
+		speech.say(self.text)
+		self.backend.output.assert_called_once_with(self.text, interrupt=False, priority=Priority.TEXT)
+		self.backend.say.assert_not_called()
+		# Interrupting calls are always passed on.
+		speech.say(self.text, interrupt=True)
+		self.backend.say.assert_called_once_with(self.text, interrupt=True, priority=Priority.TEXT)
+		mock_monotonic.return_value = 105.0
+		speech.output(self.text)
+		self.assertEqual(self.backend.output.call_count, 2)
+		self.assertEqual((speech.hits, speech.misses), (2, 3))
+		self.assertEqual(speech.hit_rate, 0.4)
+		mock_timer.assert_not_called()
+		speech.braille(self.text)
+		self.backend.braille.assert_called_once_with(self.text)
+		self.backend.speaking.return_value = True
+		self.assertTrue(speech.speaking())
+
+	def test_collapse(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend, window=5.0, collapse=True)
+		self.assertEqual(speech.hit_rate, 0.0)
+		speech.output(self.text)
+		mock_monotonic.return_value = 101.0
+		speech.output(self.text)
+		speech.say(self.text, priority=Priority.NOTIFICATION)
+		mock_timer.assert_called_once_with(4.0, speech._on_timer)  # NOQA: SLF001
+		# Other messages are spoken, and their repeats are summarized when their own window expires.
+		mock_monotonic.return_value = 103.0
+		speech.output("You are thirsty.")
+		speech.output("You are thirsty.")
+		mock_monotonic.return_value = 105.0
+		speech._on_timer()  # NOQA: SLF001
+		self.backend.say.assert_called_once_with(
+			"You are hungry. (x3)", interrupt=False, priority=Priority.NOTIFICATION
+		)
+		self.assertEqual(mock_timer.mock_calls[-2], call(3.0, speech._on_timer))  # NOQA: SLF001
+		speech.flush()
+		self.assertEqual(
+			self.backend.output.mock_calls[-1],
+			call("You are thirsty. (x2)", interrupt=False, priority=Priority.TEXT),
+		)
+		# A repeat after the window expires, before the summary was spoken, is spoken as the summary.
+		speech.output(self.text)
+		mock_monotonic.return_value = 111.0
+		speech.output(self.text)
+		self.assertEqual(
+			self.backend.output.mock_calls[-1],
+			call("You are hungry. (x2)", interrupt=False, priority=Priority.TEXT),
+		)
+
+	def test_eviction(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend, maxsize=2)
+		for text in ("first", "second", "first", "third", "second"):
+			speech.say(text)
+		# Second was the least recently seen when third was added.
+		self.assertEqual(
+			[c.args[0] for c in self.backend.say.mock_calls], ["first", "second", "third", "second"]
+		)
+		self.assertEqual(speech.evictions, 2)
+		speech.clear()
+		speech.say("first")
+		self.assertEqual(self.backend.say.call_count, 5)
+		with self.assertRaises(ValueError):
+			DeduplicatingSpeech(self.backend, window=-1.0)
+		with self.assertRaises(ValueError):
+			DeduplicatingSpeech(self.backend, maxsize=0)
+
+	def test_collapse_eviction(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend, maxsize=1, collapse=True)
+		speech.say("first")
+		speech.say("first", priority=Priority.IMPORTANT)
+		speech.say("second")
+		speech.say("third")
+		# The summary of an evicted message is spoken before the message which evicted it.
+		self.assertEqual(
+			self.backend.say.mock_calls,
+			[
+				call("first", interrupt=False, priority=Priority.TEXT),
+				call("first (x2)", interrupt=False, priority=Priority.IMPORTANT),
+				call("second", interrupt=False, priority=Priority.TEXT),
+				call("third", interrupt=False, priority=Priority.TEXT),
+			],
+		)
+		self.assertEqual(speech.evictions, 2)
+
+	def test_timer_failure(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend, collapse=True)
+		speech.say(self.text)
+		speech.say(self.text)
+		self.backend.say.side_effect = OSError("Speech server unavailable.")
+		mock_monotonic.return_value = 200.0
+		with self.assertLogs("speechlight.dedup", "ERROR"):
+			speech._on_timer()  # NOQA: SLF001
+
+	def test_slow_backend(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend)
+		started: threading.Event = threading.Event()
+		release: threading.Event = threading.Event()
+
+		def say(*args: object, **kwargs: object) -> None:
+			started.set()
+			release.wait(timeout=5.0)
+
+		self.backend.say.side_effect = say
+		sender: threading.Thread = threading.Thread(target=speech.say, args=(self.text,))
+		sender.start()
+		self.assertTrue(started.wait(timeout=5.0))
+		# A repeat is suppressed without waiting for the slow call.
+		speech.say(self.text)
+		self.assertEqual(speech.hits, 1)
+		release.set()
+		sender.join(timeout=5.0)
+		self.backend.say.assert_called_once()
+
+	def test_silence(self, mock_monotonic: Mock, mock_timer: Mock) -> None:
+		speech: DeduplicatingSpeech = DeduplicatingSpeech(self.backend, collapse=True)
+		speech.say(self.text)
+		speech.say(self.text)
+		speech.silence()
+		self.backend.silence.assert_called_once_with()
+		mock_timer.return_value.cancel.assert_called_once()
+		speech.flush()
+		self.assertEqual(self.backend.say.call_count, 1)
+		speech.say(self.text)
+		speech.close()
+		self.assertEqual(mock_timer.return_value.cancel.call_count, 2)
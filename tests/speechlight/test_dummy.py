@@ -23,10 +23,12 @@
 from __future__ import annotations
 
 # Built-in Modules:
+from typing import Any
 from unittest import TestCase, mock
 
 # Speechlight Modules:
-from speechlight.dummy import Speech
+from speechlight.base import Priority
+from speechlight.dummy import TYPICAL_RATE, SimulatedFailureError, Speech
 
 
 class TestDummy(TestCase):
@@ -44,17 +46,94 @@ class TestDummy(TestCase):
 	@mock.patch("speechlight.dummy.Speech.say")
 	def test_output(self, mock_say: mock.Mock, mock_braille: mock.Mock) -> None:
 		self.speech.output(self.text, interrupt=True)
-		mock_say.assert_called_once_with(self.text, interrupt=True)
+		mock_say.assert_called_once_with(self.text, interrupt=True, priority=Priority.TEXT)
 		mock_braille.assert_called_once_with(self.text)
 
+	@mock.patch("speechlight.dummy.Speech.output")
+	def test_output_many(self, mock_output: mock.Mock) -> None:
+		self.speech.output_many(["first", "second"], interrupt=True)
+		self.assertEqual(
+			mock_output.mock_calls,
+			[
+				mock.call("first", interrupt=True, priority=Priority.TEXT),
+				mock.call("second", interrupt=False, priority=Priority.TEXT),
+			],
+		)
+
 	@mock.patch("speechlight.dummy.Speech.silence")
 	def test_say(self, mock_silence: mock.Mock) -> None:
 		self.speech.say(self.text)
 		self.speech.say(self.text, interrupt=True)
 		mock_silence.assert_called_once()
 
+	@mock.patch("speechlight.dummy.Speech.say")
+	def test_say_many(self, mock_say: mock.Mock) -> None:
+		self.speech.say_many(["first", "second"], interrupt=True)
+		self.assertEqual(
+			mock_say.mock_calls,
+			[
+				mock.call("first", interrupt=True, priority=Priority.TEXT),
+				mock.call("second", interrupt=False, priority=Priority.TEXT),
+			],
+		)
+
 	def test_silence(self) -> None:
 		self.speech.silence()
 
 	def test_speaking(self) -> None:
 		self.assertFalse(self.speech.speaking())
+
+	def test_invalid_arguments(self) -> None:
+		invalid: tuple[dict[str, Any], ...] = (
+			{"latency": -1.0},
+			{"jitter": -1.0},
+			{"rate": 0.0},
+			{"failure_rate": 1.5},
+		)
+		for kwargs in invalid:
+			with self.subTest(**kwargs), self.assertRaises(ValueError):
+				Speech(**kwargs)
+
+
+class TestDummySimulation(TestCase):
+	@mock.patch("speechlight.dummy.time.monotonic", return_value=100.0)
+	def test_speaking(self, mock_monotonic: mock.Mock) -> None:
+		speech: Speech = Speech(rate=TYPICAL_RATE)
+		speech.say("a" * 15)
+		# Queued speech starts once the current utterance finishes.
+		speech.output("a" * 30)
+		mock_monotonic.return_value = 102.9
+		self.assertTrue(speech.speaking())
+		mock_monotonic.return_value = 103.0
+		self.assertFalse(speech.speaking())
+		speech.say("a" * 15)
+		speech.say("a" * 15, interrupt=True)
+		mock_monotonic.return_value = 103.5
+		self.assertTrue(speech.speaking())
+		speech.silence()
+		self.assertFalse(speech.speaking())
+
+	@mock.patch("speechlight.dummy.time.sleep")
+	def test_latency(self, mock_sleep: mock.Mock) -> None:
+		speech: Speech = Speech(latency=0.25, jitter=0.1, seed=1)
+		speech.braille("one")
+		speech.output("two")
+		self.assertEqual(speech.calls, 3)
+		self.assertEqual(mock_sleep.call_count, 3)
+		for delay in (call.args[0] for call in mock_sleep.mock_calls):
+			self.assertGreaterEqual(delay, 0.25)
+			self.assertLessEqual(delay, 0.35)
+
+	def test_failures(self) -> None:
+		speech: Speech = Speech(failure_rate=0.5, seed=1)
+		failed: int = 0
+		for _ in range(100):
+			try:
+				speech.say("one")
+			except SimulatedFailureError:  # NOQA: PERF203
+				failed += 1
+		self.assertEqual(speech.failures, failed)
+		self.assertGreater(failed, 25)
+		self.assertLess(failed, 75)
+		with self.assertRaises(SimulatedFailureError):
+			Speech(failure_rate=1.0).silence()
@@ -0,0 +1,70 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import json
+import subprocess  # NOQA: S404
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+# Speechlight Modules:
+import speechlight
+from speechlight.base import BaseSpeech
+
+
+# Modules which must not be loaded by 'import speechlight'.
+EXPENSIVE_MODULES: tuple[str, ...] = (
+	"Cocoa",
+	"knickknacks",
+	"speechd",
+	"speechlight.darwin",
+	"speechlight.dummy",
+	"speechlight.speech_dispatcher",
+	"speechlight.windows",
+	"win32com",
+)
+
+
+class TestInit(TestCase):
+	def test_import_is_lazy(self) -> None:
+		code: str = (
+			"import json, sys, speechlight; prefixes = tuple(sys.argv[1:]); "
+			+ "print(json.dumps(sorted(name for name in sys.modules if name.startswith(prefixes))))"
+		)
+		result = subprocess.run(  # NOQA: S603
+			[sys.executable, "-c", code, *EXPENSIVE_MODULES],
+			capture_output=True,
+			check=True,
+			text=True,
+		)
+		self.assertEqual(json.loads(result.stdout), [])
+
+	def test_lazy_attributes(self) -> None:
+		self.assertTrue(issubclass(speechlight.Speech, BaseSpeech))
+		self.assertIsInstance(speechlight.LIB_DIRECTORY, Path)
+		self.assertEqual(speechlight.LIB_DIRECTORY.name, "speech_libs")
+		self.assertIn(speechlight.SYSTEM_ARCHITECTURE, {"32bit", "64bit"})
+		with self.assertRaises(AttributeError):
+			speechlight.invalid_attribute  # NOQA: B018
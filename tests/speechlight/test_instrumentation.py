@@ -0,0 +1,121 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+from unittest import TestCase, mock
+
+# Speechlight Modules:
+from speechlight.dummy import Speech
+from speechlight.instrumentation import LATENCY_BUCKETS, CallRecord, Instrumentation
+
+
+class TestInstrumentation(TestCase):
+	def test_record(self) -> None:
+		instrumentation: Instrumentation = Instrumentation()
+		error: OSError = OSError("Failed.")
+		instrumentation.record(CallRecord("say", 0.0002, 5, None))
+		instrumentation.record(CallRecord("say", 2.0, 3, error))
+		stats = instrumentation.snapshot()["say"]
+		self.assertEqual((stats["calls"], stats["errors"], stats["characters"]), (2, 1, 8))
+		self.assertAlmostEqual(stats["total_time"], 2.0002)
+		self.assertAlmostEqual(stats["mean_time"], 1.0001)
+		self.assertEqual(stats["max_time"], 2.0)
+		self.assertEqual(stats["histogram"][LATENCY_BUCKETS[1]], 1)
+		self.assertEqual(stats["histogram"][float("inf")], 1)
+		self.assertEqual(sum(stats["histogram"].values()), 2)
+		instrumentation.reset()
+		self.assertEqual(instrumentation.snapshot(), {})
+
+	def test_listeners(self) -> None:
+		instrumentation: Instrumentation = Instrumentation()
+		listener: mock.Mock = mock.Mock()
+		failing_listener: mock.Mock = mock.Mock(side_effect=RuntimeError("Failed."))
+		instrumentation.add_listener(failing_listener)
+		instrumentation.add_listener(listener)
+		record: CallRecord = CallRecord("silence", 0.0, 0, None)
+		with self.assertLogs("speechlight.instrumentation", level="ERROR"):
+			instrumentation.record(record)
+		listener.assert_called_once_with(record)
+		instrumentation.remove_listener(failing_listener)
+		instrumentation.remove_listener(listener)
+		instrumentation.record(record)
+		listener.assert_called_once()
+
+	def test_wrap(self) -> None:
+		instrumentation: Instrumentation = Instrumentation()
+		func: mock.Mock = mock.Mock(return_value=True)
+		wrapped = instrumentation.wrap("say", func)
+		self.assertTrue(wrapped("Hello", interrupt=True))
+		func.assert_called_once_with("Hello", interrupt=True)
+		func.side_effect = OSError("Failed.")
+		with self.assertRaises(OSError):
+			wrapped()
+		stats = instrumentation.snapshot()["say"]
+		self.assertEqual((stats["calls"], stats["errors"], stats["characters"]), (2, 1, 5))
+
+	def test_characters(self) -> None:
+		instrumentation: Instrumentation = Instrumentation()
+		func: mock.Mock = mock.Mock()
+		wrapped = instrumentation.wrap("say", func)
+		wrapped(text="Hello", interrupt=True)
+		wrapped(None)
+		self.assertEqual(instrumentation.snapshot()["say"]["characters"], 5)
+		wrapped = instrumentation.wrap("say_many", func)
+		wrapped(["Hello", "there"])
+		wrapped(texts=("Hi",))
+		# Iterators aren't counted, as that would exhaust them.
+		texts = iter(["Hello"])
+		wrapped(texts)
+		func.assert_called_with(texts)
+		self.assertEqual(list(texts), ["Hello"])
+		self.assertEqual(instrumentation.snapshot()["say_many"]["characters"], 12)
+
+	def test_enable_instrumentation(self) -> None:
+		speech: Speech = Speech()
+		self.assertIsNone(speech.instrumentation)
+		instrumentation: Instrumentation = speech.enable_instrumentation()
+		self.assertIs(speech.enable_instrumentation(), instrumentation)
+		self.assertIs(speech.enable_instrumentation(instrumentation), instrumentation)
+		speech.output("Hello")
+		speech.speaking()
+		speech.say_many(["Hello", "there"])
+		speech.output_many(["Hi"])
+		snapshot = instrumentation.snapshot()
+		self.assertEqual(
+			{method: stats["calls"] for method, stats in snapshot.items()},
+			{"output": 2, "say": 4, "braille": 2, "speaking": 1, "say_many": 1, "output_many": 1},
+		)
+		self.assertEqual(snapshot["say_many"]["characters"], 10)
+		shared: Instrumentation = Instrumentation()
+		self.assertIs(speech.enable_instrumentation(shared), shared)
+		speech.silence()
+		self.assertEqual(list(shared.snapshot()), ["silence"])
+		self.assertNotIn("silence", instrumentation.snapshot())
+		speech.disable_instrumentation()
+		speech.disable_instrumentation()
+		self.assertIsNone(speech.instrumentation)
+		self.assertNotIn("say", vars(speech))
+		speech.say("Hello")
+		self.assertEqual(shared.snapshot()["silence"]["calls"], 1)
+		self.assertNotIn("say", shared.snapshot())
@@ -0,0 +1,124 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.normalize import NormalizingSpeech, TextNormalizer
+
+
+class TestTextNormalizer(TestCase):
+	def test_normalize(self) -> None:
+		normalizer: TextNormalizer = TextNormalizer(
+			symbols={"&": "and", "<": "less than", "<-": "left arrow"}
+		)
+		text: str = (
+			"\x1b[1;31mYou are   hungry.\x1b[0m\r\n\n\t Tom & Jerry <- < ====== wait...\x1b]0;Title\x07 "
+		)
+		self.assertEqual(normalizer(text), "You are hungry.\nTom and Jerry left arrow less than = wait...")
+		self.assertEqual(normalizer.normalize("\x1bcReset\x1b(B\x07"), "Reset")
+		normalizer = TextNormalizer(symbols={"lol": "laughing", "": "ignored"})
+		self.assertEqual(normalizer("Well lol."), "Well laughing.")
+
+	def test_whitespace_after_replacement(self) -> None:
+		normalizer: TextNormalizer = TextNormalizer(symbols={"&": " and ", "*": ""})
+		self.assertEqual(normalizer("Tom & Jerry"), "Tom and Jerry")
+		self.assertEqual(normalizer("Tom * & * Jerry"), "Tom and Jerry")
+		self.assertEqual(normalizer("One \x1b[0m two\n\x1b[0m\nthree"), "One two\nthree")
+		normalizer = TextNormalizer(collapse_whitespace=False, symbols={"&": " and "})
+		self.assertEqual(normalizer("a & b"), "a  and  b")
+
+	def test_options(self) -> None:
+		text: str = " \x1b[32mGreen\x1b[0m  ---- "
+		self.assertEqual(TextNormalizer(strip_ansi=False)(text), "\x1b[32mGreen\x1b[0m -")
+		self.assertEqual(TextNormalizer(collapse_whitespace=False)(text), " Green  - ")
+		self.assertEqual(TextNormalizer(collapse_punctuation=False)(text), "Green ----")
+		normalizer: TextNormalizer = TextNormalizer(
+			strip_ansi=False, collapse_whitespace=False, collapse_punctuation=False
+		)
+		self.assertEqual(normalizer(text), text)
+
+	def test_cache(self) -> None:
+		normalizer: TextNormalizer = TextNormalizer(cache_size=1)
+		normalizer("  First  ")
+		normalizer("  First  ")
+		self.assertEqual(normalizer.cache_info().hits, 1)
+		normalizer.cache_clear()
+		self.assertEqual(normalizer.cache_info().currsize, 0)
+
+
+class TestNormalizingSpeech(TestCase):
+	def setUp(self) -> None:
+		self.backend: Mock = Mock(spec=BaseSpeech)
+		self.speech: NormalizingSpeech = NormalizingSpeech(self.backend, TextNormalizer(symbols={"&": "and"}))
+
+	def test_say(self) -> None:
+		self.speech.say("\x1b[1mTom  & Jerry\x1b[0m", interrupt=True, priority=Priority.MESSAGE)
+		self.backend.say.assert_called_once_with("Tom and Jerry", interrupt=True, priority=Priority.MESSAGE)
+		self.speech.say("\x1b[0m")
+		self.backend.say.assert_called_once()
+		self.backend.silence.assert_not_called()
+
+	def test_empty_interrupt(self) -> None:
+		# Speech is still interrupted when nothing is left to speak.
+		self.speech.say("\x1b[0m", interrupt=True)
+		self.backend.silence.assert_called_once_with()
+		self.speech.output("\x1b[0m", interrupt=True)
+		self.assertEqual(self.backend.silence.call_count, 2)
+		self.speech = NormalizingSpeech(self.backend, TextNormalizer(symbols={"&": ""}))
+		self.speech.output("&", interrupt=True)
+		self.assertEqual(self.backend.silence.call_count, 3)
+		self.backend.braille.assert_called_once_with("&")
+		self.backend.say.assert_not_called()
+		self.backend.output.assert_not_called()
+
+	def test_braille(self) -> None:
+		self.speech.braille("\x1b[1mTom  & Jerry ----\x1b[0m")
+		self.backend.braille.assert_called_once_with("Tom & Jerry ----")
+		self.speech.braille("\x1b[0m")
+		self.backend.braille.assert_called_once()
+
+	def test_output(self) -> None:
+		self.speech.output("\x1b[1mYou  are hungry.\x1b[0m", interrupt=True)
+		self.backend.output.assert_called_once_with("You are hungry.", interrupt=True, priority=Priority.TEXT)
+		# Symbol replacements only apply to speech.
+		self.speech.output("Tom & Jerry")
+		self.backend.say.assert_called_once_with("Tom and Jerry", interrupt=False, priority=Priority.TEXT)
+		self.backend.braille.assert_called_once_with("Tom & Jerry")
+		self.speech.output("\x1b[0m")
+		self.backend.output.assert_called_once()
+		self.speech = NormalizingSpeech(self.backend, TextNormalizer(symbols={"&": ""}))
+		self.speech.output("&")
+		self.assertEqual(self.backend.braille.mock_calls, [call("Tom & Jerry"), call("&")])
+		self.backend.say.assert_called_once()
+
+	def test_silence_speaking(self) -> None:
+		self.speech.silence()
+		self.backend.silence.assert_called_once_with()
+		self.backend.speaking.return_value = True
+		self.assertTrue(self.speech.speaking())
+		self.assertIsInstance(NormalizingSpeech(self.backend).normalizer, TextNormalizer)
@@ -0,0 +1,149 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.pronunciation import PronunciationDictionary, PronunciationSpeech
+
+
+class TestPronunciationDictionary(TestCase):
+	def test_apply(self) -> None:
+		dictionary: PronunciationDictionary = PronunciationDictionary(
+			{"he": "HE", "she": "SHE", "his": "HIS", "hers": "HERS"}, whole_word=False
+		)
+		self.assertEqual(len(dictionary), 4)
+		self.assertIn("hers", dictionary)
+		# The leftmost match wins, then the longest.
+		self.assertEqual(dictionary("ushers"), "uSHErs")
+		self.assertEqual(dictionary.apply("hershis"), "HERSHIS")
+		self.assertEqual(dictionary("nothing to see"), "nothing to see")
+		self.assertEqual(PronunciationDictionary()("text"), "text")
+
+	def test_whole_word(self) -> None:
+		dictionary: PronunciationDictionary = PronunciationDictionary(
+			{"mud": "multi user dungeon", "a b": "AB"}
+		)
+		self.assertEqual(
+			dictionary("A MUD! Muddy mud_ mud"), "A multi user dungeon! Muddy mud_ multi user dungeon"
+		)
+		self.assertEqual(dictionary("a ba b xa b a b"), "a ba b xa b AB")
+		dictionary.add("mud", "mood", whole_word=False)
+		self.assertEqual(dictionary("muddy"), "mooddy")
+
+	def test_case(self) -> None:
+		dictionary: PronunciationDictionary = PronunciationDictionary({"us": "we"})
+		dictionary.add("US", "United States", case_sensitive=True)
+		self.assertEqual(dictionary("US and us and Us"), "United States and we and we")
+		# Characters whose lower case form has a different length don't shift matches.
+		self.assertEqual(dictionary("\u0130 us"), "\u0130 we")
+		dictionary = PronunciationDictionary({"Gandalf": "Gan-dalf"}, case_sensitive=True)
+		self.assertEqual(dictionary("gandalf Gandalf"), "gandalf Gan-dalf")
+
+	def test_remove(self) -> None:
+		dictionary: PronunciationDictionary = PronunciationDictionary(
+			{"he": "HE", "hers": "HERS"}, whole_word=False
+		)
+		self.assertEqual(dictionary("hers"), "HERS")
+		dictionary.remove("hers")
+		dictionary.remove("missing")
+		self.assertEqual(dictionary("hers"), "HErs")
+		dictionary.add("he", "him", whole_word=True)
+		self.assertEqual(dictionary("he hers"), "him hers")
+		dictionary.clear()
+		self.assertEqual(len(dictionary), 0)
+		self.assertEqual(dictionary("he"), "he")
+		with self.assertRaises(ValueError):
+			dictionary.add("", "empty")
+
+	def test_load(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			path: Path = Path(directory) / "dictionary.txt"
+			path.write_text("# Names.\n\ngandalf = Gan-dalf\nmud=multi user dungeon\n", encoding="utf-8")
+			dictionary: PronunciationDictionary = PronunciationDictionary()
+			dictionary.load(path)
+			self.assertEqual(dictionary("Gandalf in the mud"), "Gan-dalf in the multi user dungeon")
+			self.assertFalse(dictionary.reload())
+			path.write_text("gandalf = Gandalf the Grey\nafk=away from keyboard\n", encoding="utf-8")
+			os.utime(path, ns=(0, 1))
+			with patch.object(dictionary, "add", wraps=dictionary.add) as mock_add:
+				self.assertTrue(dictionary.reload())
+				# Only changed entries are updated.
+				self.assertEqual(mock_add.call_count, 2)
+			self.assertEqual(dictionary("gandalf, mud, afk"), "Gandalf the Grey, mud, away from keyboard")
+			path.write_text("no separator\n", encoding="utf-8")
+			with self.assertRaisesRegex(ValueError, "line 1"):
+				dictionary.load(path)
+			path.unlink()
+			self.assertFalse(dictionary.reload())
+
+
+class TestPronunciationSpeech(TestCase):
+	def setUp(self) -> None:
+		self.backend: Mock = Mock(spec=BaseSpeech)
+		self.dictionary: PronunciationDictionary = PronunciationDictionary({"afk": "away from keyboard"})
+		self.speech: PronunciationSpeech = PronunciationSpeech(
+			self.backend, self.dictionary, reload_interval=None
+		)
+
+	def test_say(self) -> None:
+		self.speech.say("I am afk.", interrupt=True, priority=Priority.MESSAGE)
+		self.backend.say.assert_called_once_with(
+			"I am away from keyboard.", interrupt=True, priority=Priority.MESSAGE
+		)
+
+	def test_output(self) -> None:
+		self.speech.output("Hello.")
+		self.backend.output.assert_called_once_with("Hello.", interrupt=False, priority=Priority.TEXT)
+		self.speech.output("afk")
+		self.backend.say.assert_called_once_with(
+			"away from keyboard", interrupt=False, priority=Priority.TEXT
+		)
+		self.backend.braille.assert_called_once_with("afk")
+		self.speech.braille("afk")
+		self.assertEqual(self.backend.braille.call_count, 2)
+
+	def test_silence_speaking(self) -> None:
+		self.speech.silence()
+		self.backend.silence.assert_called_once_with()
+		self.backend.speaking.return_value = True
+		self.assertTrue(self.speech.speaking())
+
+	@patch("speechlight.pronunciation.time.monotonic")
+	def test_reload(self, mock_monotonic: Mock) -> None:
+		mock_monotonic.return_value = 100.0
+		speech: PronunciationSpeech = PronunciationSpeech(self.backend, self.dictionary, reload_interval=2.0)
+		with patch.object(self.dictionary, "reload") as mock_reload:
+			speech.say("afk")
+			mock_reload.assert_not_called()
+			mock_monotonic.return_value = 102.0
+			speech.say("afk")
+			speech.say("afk")
+			mock_reload.assert_called_once_with()
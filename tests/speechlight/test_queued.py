@@ -0,0 +1,174 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.queued import QueuedSpeech
+
+
+class TestQueuedSpeech(TestCase):
+	def setUp(self) -> None:
+		self.text: str = "This is a test."
+		self.backend: Mock = Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = False
+		self.speech: QueuedSpeech = QueuedSpeech(self.backend, maxsize=2)
+
+	def tearDown(self) -> None:
+		self.speech.close(timeout=1.0)
+		del self.speech
+
+	def block_backend(self) -> threading.Event:
+		"""
+		Makes the backend's say method block.
+
+		Returns:
+			An event which releases the blocked call when set.
+		"""
+		started: threading.Event = threading.Event()
+		release: threading.Event = threading.Event()
+
+		def say(text: str, **kwargs: object) -> None:
+			started.set()
+			release.wait(timeout=5.0)
+
+		self.backend.say.side_effect = say
+		self.speech.say("blocking")
+		self.assertTrue(started.wait(timeout=5.0))
+		return release
+
+	def test_invalid_maxsize(self) -> None:
+		with self.assertRaises(ValueError):
+			QueuedSpeech(self.backend, maxsize=0)
+
+	def test_calls(self) -> None:
+		self.speech.maxsize = 3
+		self.speech.braille(self.text)
+		self.speech.output(self.text)
+		self.speech.say(self.text)
+		self.assertTrue(self.speech.join(timeout=5.0))
+		self.backend.braille.assert_called_once_with(self.text)
+		self.backend.output.assert_called_once_with(self.text, interrupt=False, priority=Priority.TEXT)
+		self.backend.say.assert_called_once_with(self.text, interrupt=False, priority=Priority.TEXT)
+
+	def test_many(self) -> None:
+		self.speech.output_many(iter(["first", "second"]), interrupt=True)
+		self.speech.say_many(iter(["first", "second"]))
+		self.assertTrue(self.speech.join(timeout=5.0))
+		self.backend.output_many.assert_called_once_with(
+			("first", "second"), interrupt=True, priority=Priority.TEXT
+		)
+		self.backend.say_many.assert_called_once_with(
+			("first", "second"), interrupt=False, priority=Priority.TEXT
+		)
+
+	def test_priority(self) -> None:
+		release: threading.Event = self.block_backend()
+		self.speech.maxsize = 3
+		self.speech.say("progress", priority=Priority.PROGRESS)
+		self.speech.say("text")
+		self.speech.say("important", priority=Priority.IMPORTANT)
+		# The full queue drops the least urgent call.
+		self.speech.say("message", priority=Priority.MESSAGE)
+		self.assertEqual(self.speech.dropped, 1)
+		release.set()
+		self.assertTrue(self.speech.join(timeout=5.0))
+		spoken: list[str] = [c.args[0] for c in self.backend.say.mock_calls]
+		self.assertEqual(spoken, ["blocking", "important", "message", "text"])
+
+	def test_less_urgent(self) -> None:
+		release: threading.Event = self.block_backend()
+		self.speech.maxsize = 1
+		self.speech.say("important", priority=Priority.IMPORTANT)
+		# A full queue keeps the more urgent pending call.
+		self.speech.say("progress", priority=Priority.PROGRESS)
+		self.assertEqual(self.speech.dropped, 1)
+		release.set()
+		self.assertTrue(self.speech.join(timeout=5.0))
+		spoken: list[str] = [c.args[0] for c in self.backend.say.mock_calls]
+		self.assertEqual(spoken, ["blocking", "important"])
+
+	def test_maxsize(self) -> None:
+		release: threading.Event = self.block_backend()
+		for i in range(3):
+			self.speech.output(str(i))
+		self.assertEqual(self.speech.dropped, 1)
+		self.assertTrue(self.speech.speaking())
+		release.set()
+		self.assertTrue(self.speech.join(timeout=5.0))
+		# A call which is no more urgent than the pending calls is dropped.
+		expected: list[object] = [
+			call("0", interrupt=False, priority=Priority.TEXT),
+			call("1", interrupt=False, priority=Priority.TEXT),
+		]
+		self.assertEqual(self.backend.output.mock_calls, expected)
+		self.assertFalse(self.speech.speaking())
+		self.backend.speaking.assert_called_once()
+
+	def test_interrupt(self) -> None:
+		release: threading.Event = self.block_backend()
+		self.speech.output("dropped")
+		self.speech.output(self.text, interrupt=True)
+		self.assertEqual(self.speech.dropped, 1)
+		release.set()
+		self.assertTrue(self.speech.join(timeout=5.0))
+		self.backend.output.assert_called_once_with(self.text, interrupt=True, priority=Priority.TEXT)
+
+	def test_silence(self) -> None:
+		release: threading.Event = self.block_backend()
+		self.speech.output(self.text)
+		self.speech.silence()
+		release.set()
+		self.assertTrue(self.speech.join(timeout=5.0))
+		self.backend.output.assert_not_called()
+		self.backend.silence.assert_called_once_with()
+
+	def test_flush(self) -> None:
+		release: threading.Event = self.block_backend()
+		self.speech.output(self.text)
+		self.assertEqual(self.speech.flush(), 1)
+		self.assertFalse(self.speech.join(timeout=0.0))
+		release.set()
+		self.assertTrue(self.speech.join(timeout=5.0))
+		self.backend.output.assert_not_called()
+
+	@patch("speechlight.queued.logger")
+	def test_errors(self, mock_logger: Mock) -> None:
+		self.backend.say.side_effect = RuntimeError("Backend failure.")
+		self.speech.say(self.text)
+		self.speech.braille(self.text)
+		self.assertTrue(self.speech.join(timeout=5.0))
+		mock_logger.exception.assert_called_once()
+		self.backend.braille.assert_called_once_with(self.text)
+
+	def test_close(self) -> None:
+		self.speech.say(self.text)
+		self.speech.close(timeout=5.0)
+		self.backend.say.assert_called_once_with(self.text, interrupt=False, priority=Priority.TEXT)
+		self.speech.say(self.text)
+		self.assertEqual(self.backend.say.call_count, 1)
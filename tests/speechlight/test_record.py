@@ -0,0 +1,166 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any
+from unittest import TestCase, mock
+
+# Speechlight Modules:
+from speechlight.base import BaseSpeech, Priority
+from speechlight.record import RecordingSpeech, ReplayResult, main, read_journal, replay
+
+
+class TestRecordingSpeech(TestCase):
+	def setUp(self) -> None:
+		self.backend: mock.Mock = mock.Mock(spec=BaseSpeech)
+		self.backend.speaking.return_value = True
+		self.journal: io.StringIO = io.StringIO()
+		self.speech: RecordingSpeech = RecordingSpeech(self.journal, self.backend)
+
+	def entries(self) -> list[dict[str, Any]]:
+		return [json.loads(line) for line in self.journal.getvalue().splitlines()]
+
+	@mock.patch("speechlight.record.time.time", side_effect=[1.0, 2.5, 3.0, 4.0, 5.0, 6.1234567])
+	def test_record(self, mock_time: mock.Mock) -> None:
+		self.speech.braille("one")
+		self.speech.output("two", interrupt=True)
+		self.speech.output_many(iter(["three", "four"]), priority=Priority.IMPORTANT)
+		self.speech.say("five", priority=Priority.PROGRESS)
+		self.speech.say_many(iter(["six"]))
+		self.speech.silence()
+		self.assertTrue(self.speech.speaking())
+		self.speech.close()
+		self.assertFalse(self.journal.closed)
+		self.assertEqual(
+			self.entries(),
+			[
+				{"t": 1.0, "method": "braille", "text": "one"},
+				{"t": 2.5, "method": "output", "text": "two", "interrupt": True},
+				{"t": 3.0, "method": "output_many", "texts": ["three", "four"], "priority": "important"},
+				{"t": 4.0, "method": "say", "text": "five", "priority": "progress"},
+				{"t": 5.0, "method": "say_many", "texts": ["six"]},
+				{"t": 6.123457, "method": "silence"},
+			],
+		)
+		self.assertEqual(
+			self.backend.mock_calls,
+			[
+				mock.call.braille("one"),
+				mock.call.output("two", interrupt=True, priority=Priority.TEXT),
+				mock.call.output_many(["three", "four"], interrupt=False, priority=Priority.IMPORTANT),
+				mock.call.say("five", interrupt=False, priority=Priority.PROGRESS),
+				mock.call.say_many(["six"], interrupt=False, priority=Priority.TEXT),
+				mock.call.silence(),
+				mock.call.speaking(),
+			],
+		)
+		self.assertEqual(self.speech.recorded, 6)
+
+	def test_record_only(self) -> None:
+		speech: RecordingSpeech = RecordingSpeech(self.journal)
+		speech.braille("one")
+		speech.output("two")
+		speech.output_many(["three"])
+		speech.say("four")
+		speech.say_many(["five"])
+		speech.silence()
+		self.assertFalse(speech.speaking())
+		self.assertEqual(len(self.entries()), 6)
+
+	def test_record_to_path(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			path: Path = Path(directory) / "journal.jsonl"
+			for text in ("one", "two"):
+				speech: RecordingSpeech = RecordingSpeech(path)
+				speech.say(text)
+				speech.flush()
+				speech.close()
+			# Sessions are appended to the journal.
+			self.assertEqual([entry["text"] for entry in read_journal(path)], ["one", "two"])
+
+
+class TestReplay(TestCase):
+	def setUp(self) -> None:
+		self.backend: mock.Mock = mock.Mock(spec=BaseSpeech)
+		self.entries: list[dict[str, Any]] = [
+			{"t": 10.0, "method": "say", "text": "one"},
+			{"t": 12.0, "method": "say", "text": "two", "interrupt": True, "priority": "important"},
+			{"t": 100.0, "method": "silence"},
+			{"t": 101.0, "method": "braille", "text": "three"},
+		]
+
+	def test_read_journal(self) -> None:
+		journal: io.StringIO = io.StringIO('{"t":1,"method":"silence"}\n\n{"t":2.5,"method":"silence"}\n')
+		self.assertEqual([entry["t"] for entry in read_journal(journal)], [1, 2.5])
+		for line in ("not json", "[]", '{"method":"silence"}', '{"t":"now","method":"silence"}'):
+			with self.subTest(line=line), self.assertRaisesRegex(ValueError, "line 2"):
+				list(read_journal(io.StringIO(f'{{"t":1,"method":"silence"}}\n{line}\n')))
+
+	def test_replay_fast(self) -> None:
+		result: ReplayResult = replay(self.entries, self.backend, speed=None)
+		self.assertEqual(
+			self.backend.mock_calls,
+			[
+				mock.call.say("one", interrupt=False, priority=Priority.TEXT),
+				mock.call.say("two", interrupt=True, priority=Priority.IMPORTANT),
+				mock.call.silence(),
+				mock.call.braille("three"),
+			],
+		)
+		self.assertEqual((result.calls, result.max_lag), (4, 0.0))
+		self.assertGreater(result.throughput, 0.0)
+
+	@mock.patch("speechlight.record.time.sleep")
+	@mock.patch("speechlight.record.time.monotonic")
+	def test_replay_paced(self, mock_monotonic: mock.Mock, mock_sleep: mock.Mock) -> None:
+		# The gap before the third call is capped at 5 seconds, but the call is made a second late.
+		mock_monotonic.side_effect = [0.0, 0.0, 0.0, 7.0, 7.0, 8.0]
+		result: ReplayResult = replay(self.entries, self.backend, speed=2.0, max_delay=5.0)
+		mock_sleep.assert_called_once_with(1.0)
+		self.assertEqual(result, ReplayResult(4, 8.0, 1.0))
+		self.assertEqual(self.backend.braille.call_count, 1)
+
+	def test_invalid_arguments(self) -> None:
+		with self.assertRaises(ValueError):
+			replay(self.entries, self.backend, speed=0.0)
+
+	def test_throughput(self) -> None:
+		self.assertEqual(ReplayResult(0, 0.0, 0.0).throughput, 0.0)
+		self.assertEqual(ReplayResult(10, 2.0, 0.0).throughput, 5.0)
+
+	@mock.patch("speechlight.registry.create")
+	def test_main(self, mock_create: mock.Mock) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			path: Path = Path(directory) / "journal.jsonl"
+			path.write_text('{"t":1,"method":"say","text":"one"}\n', encoding="utf-8")
+			with redirect_stdout(io.StringIO()) as output:
+				main([str(path)])
+		mock_create.assert_called_once_with()
+		mock_create.return_value.say.assert_called_once_with("one", interrupt=False, priority=Priority.TEXT)
+		self.assertIn("Replayed 1 calls", output.getvalue())
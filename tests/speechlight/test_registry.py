@@ -0,0 +1,129 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest import TestCase, mock
+
+# Speechlight Modules:
+from speechlight import dummy, registry
+from speechlight.registry import (
+	CONFIG_ENVIRONMENT_VARIABLE,
+	ENVIRONMENT_VARIABLE,
+	Backend,
+	backends,
+	config_path,
+	create,
+	get_backend,
+	load,
+	platform_backend,
+	register,
+	selected_backend,
+	unregister,
+)
+
+
+class TestRegistry(TestCase):
+	def setUp(self) -> None:
+		# Isolate each test from the registered backends, and from the environment.
+		patchers: tuple[Any, ...] = (
+			mock.patch.dict(registry._backends),  # NOQA: SLF001
+			mock.patch.object(registry, "_entry_points_loaded", new=False),
+			mock.patch.dict(os.environ, {ENVIRONMENT_VARIABLE: "", CONFIG_ENVIRONMENT_VARIABLE: ""}),
+			mock.patch("importlib.metadata.entry_points", return_value=[]),
+		)
+		for patcher in patchers:
+			patcher.start()
+			self.addCleanup(patcher.stop)
+		self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+		self.addCleanup(self.directory.cleanup)
+		self.config: Path = Path(self.directory.name) / "config.ini"
+
+	def test_register(self) -> None:
+		factory: mock.Mock = mock.Mock()
+		register("custom", factory, volume=5)
+		self.assertEqual(get_backend("custom"), Backend(factory, {"volume": 5}))
+		self.assertIn("custom", backends())
+		self.assertIs(create("custom", rate=2), factory.return_value)
+		factory.assert_called_once_with(volume=5, rate=2)
+		unregister("custom")
+		self.assertNotIn("custom", backends())
+		with self.assertRaises(ValueError):
+			unregister("custom")
+		with self.assertRaises(ValueError):
+			get_backend("custom")
+
+	def test_load(self) -> None:
+		self.assertIs(load("dummy"), dummy.Speech)
+		register("nested", "speechlight.registry:Backend._make")
+		self.assertEqual(load("nested"), Backend._make)
+		register("invalid", "speechlight.dummy.Speech")
+		with self.assertRaises(ValueError):
+			load("invalid")
+
+	def test_pinned_backends(self) -> None:
+		for name in ("jfw", "nvda", "sa", "sapi"):
+			self.assertEqual(
+				get_backend(name), Backend("speechlight.windows:Speech", {"screen_reader": name})
+			)
+
+	def test_entry_points(self) -> None:
+		entry_point: mock.Mock = mock.Mock(value="speechlight.dummy:Speech")
+		entry_point.name = "third_party"
+		with mock.patch("importlib.metadata.entry_points", return_value=[entry_point]) as mock_entry_points:
+			self.assertIsInstance(create("third_party"), dummy.Speech)
+			self.assertIn("third_party", backends())
+		# Installed packages are only looked up once, and the entry point is never loaded.
+		mock_entry_points.assert_called_once_with(group="speechlight.backends")
+		entry_point.load.assert_not_called()
+
+	def test_selected_backend(self) -> None:
+		with mock.patch.dict(os.environ, {CONFIG_ENVIRONMENT_VARIABLE: str(self.config)}):
+			self.assertEqual(selected_backend(), platform_backend())
+			self.config.write_text("[speechlight]\nbackend = nvda\n", encoding="utf-8")
+			self.assertEqual(selected_backend(), "nvda")
+			with mock.patch.dict(os.environ, {ENVIRONMENT_VARIABLE: "dummy"}):
+				self.assertEqual(selected_backend(), "dummy")
+			self.config.write_text("[other]\nbackend = nvda\n", encoding="utf-8")
+			self.assertEqual(selected_backend(), platform_backend())
+			self.config.write_text("backend = nvda\n", encoding="utf-8")
+			with self.assertLogs("speechlight.registry", "WARNING"):
+				self.assertEqual(selected_backend(), platform_backend())
+
+	def test_create_selected(self) -> None:
+		with mock.patch.dict(os.environ, {ENVIRONMENT_VARIABLE: "dummy"}):
+			self.assertIsInstance(create(), dummy.Speech)
+
+	def test_config_path(self) -> None:
+		with mock.patch.dict(os.environ, {CONFIG_ENVIRONMENT_VARIABLE: str(self.config)}):
+			self.assertEqual(config_path(), self.config)
+		if sys.platform != "win32":
+			with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": self.directory.name}):
+				self.assertEqual(config_path(), Path(self.directory.name) / "speechlight" / "config.ini")
+			with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": ""}):
+				self.assertEqual(config_path(), Path.home() / ".config" / "speechlight" / "config.ini")
@@ -23,11 +23,14 @@
 from __future__ import annotations
 
 # Built-in Modules:
+import threading
+from collections.abc import Callable
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, call, patch
 
 # Speechlight Modules:
-from speechlight.speech_dispatcher import Speech
+from speechlight.base import CALLBACK_BEGIN, CALLBACK_CANCEL, CALLBACK_END, Priority
+from speechlight.speech_dispatcher import MESSAGE_TIMEOUT, MIN_SPEAKING_RATE, Speech, SSIPCommunicationError
 
 
 @patch("speechlight.speech_dispatcher.logger", Mock())
@@ -39,6 +42,21 @@ class TestSpeechDispatcher(TestCase):
 	def tearDown(self) -> None:
 		del self.speech
 
+	def test_speak_callback(self) -> None:
+		listener: Mock = Mock()
+		self.speech.add_event_listener(listener)
+		self.speech._speak_callback(CALLBACK_BEGIN)  # NOQA: SLF001
+		self.speech._speak_callback(CALLBACK_END)  # NOQA: SLF001
+		self.speech._speak_callback(CALLBACK_BEGIN)  # NOQA: SLF001
+		self.speech._speak_callback(CALLBACK_CANCEL)  # NOQA: SLF001
+		self.assertEqual(
+			[c.args for c in listener.mock_calls],
+			[(CALLBACK_BEGIN,), (CALLBACK_END,), (CALLBACK_BEGIN,), (CALLBACK_CANCEL,)],
+		)
+		self.speech.remove_event_listener(listener)
+		self.speech._speak_callback(CALLBACK_BEGIN)  # NOQA: SLF001
+		self.assertEqual(listener.call_count, 4)
+
 	def test_braille(self) -> None:
 		self.speech.braille(self.text)
 
@@ -46,9 +64,16 @@ class TestSpeechDispatcher(TestCase):
 	@patch("speechlight.speech_dispatcher.Speech.say")
 	def test_output(self, mock_say: Mock, mock_braille: Mock) -> None:
 		self.speech.output(self.text, interrupt=True)
-		mock_say.assert_called_once_with(self.text, interrupt=True)
+		mock_say.assert_called_once_with(self.text, interrupt=True, priority=Priority.TEXT)
 		mock_braille.assert_called_once_with(self.text)
 
+	@patch("speechlight.speech_dispatcher.Speech.braille")
+	@patch("speechlight.speech_dispatcher.Speech.say_many")
+	def test_output_many(self, mock_say_many: Mock, mock_braille: Mock) -> None:
+		self.speech.output_many(iter(["first", "second"]), interrupt=True)
+		mock_say_many.assert_called_once_with(("first", "second"), interrupt=True, priority=Priority.TEXT)
+		self.assertEqual(mock_braille.mock_calls, [call("first"), call("second")])
+
 	@patch("speechlight.speech_dispatcher.Speech.silence")
 	def test_say(self, mock_silence: Mock) -> None:
 		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
@@ -59,13 +84,279 @@ class TestSpeechDispatcher(TestCase):
 			mock_silence.assert_called_once()
 			mock_sd.speak.assert_called_once()
 
+	@patch("speechlight.speech_dispatcher.Speech.silence")
+	def test_say_many(self, mock_silence: Mock) -> None:
+		callback = ANY
+		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
+			self.speech.say_many([])
+			mock_sd.block_begin.assert_not_called()
+			self.speech.say_many(["first", "second", "third"], interrupt=True)
+			mock_silence.assert_called_once()
+			self.assertEqual(
+				mock_sd.mock_calls,
+				[
+					call.block_begin(),
+					call.speak("first", callback=callback, event_types=(CALLBACK_BEGIN, CALLBACK_CANCEL)),
+					call.speak("second"),
+					call.speak("third", callback=callback, event_types=(CALLBACK_CANCEL, CALLBACK_END)),
+					call.block_end(),
+				],
+			)
+			mock_sd.reset_mock()
+			self.speech.say_many(["first"])
+			mock_sd.speak.assert_called_once_with(
+				"first", callback=callback, event_types=(CALLBACK_BEGIN, CALLBACK_CANCEL, CALLBACK_END)
+			)
+
+	def test_priority(self) -> None:
+		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
+			self.speech.say(self.text)
+			mock_sd.set_priority.assert_not_called()
+			self.speech.say(self.text, priority=Priority.IMPORTANT)
+			self.speech.say(self.text, priority=Priority.IMPORTANT)
+			mock_sd.set_priority.assert_called_once_with("important")
+			mock_sd.reset_mock()
+			self.speech.say_many(["first", "second"], priority=Priority.PROGRESS)
+			self.assertEqual(mock_sd.mock_calls[:2], [call.set_priority("progress"), call.block_begin()])
+
 	def test_silence(self) -> None:
 		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
 			self.speech.silence()
 			mock_sd.cancel.assert_called_once()
 
+	@patch("speechlight.speech_dispatcher.time.monotonic")
+	@patch("speechlight.speech_dispatcher.Speech._open_client")
+	def test_reconnect(self, mock_open_client: Mock, mock_monotonic: Mock) -> None:
+		mock_monotonic.return_value = 100.0
+		mock_open_client.side_effect = SSIPCommunicationError("Connection refused.")
+		speech: Speech = Speech(max_pending=2, reconnect_delay=1.0, max_reconnect_delay=3.0)
+		self.assertIsNone(speech._sd)  # NOQA: SLF001
+		with patch("speechlight.speech_dispatcher.threading.Timer") as mock_timer:
+			# Buffered while waiting for the backoff delay, and a reconnection is scheduled.
+			speech.say("first")
+			mock_timer.assert_called_once_with(1.0, speech._on_timer)  # NOQA: SLF001
+			speech.say_many(["second", "third"], priority=Priority.IMPORTANT)
+			speech.say("fourth")
+			self.assertEqual(mock_open_client.call_count, 1)
+			# Only the most recent messages are kept.
+			self.assertEqual(
+				list(speech._pending),  # NOQA: SLF001
+				[(("second", "third"), Priority.IMPORTANT), (("fourth",), Priority.TEXT)],
+			)
+			# The backoff doubles, up to the maximum.
+			mock_monotonic.return_value = 101.0
+			speech._on_timer()  # NOQA: SLF001
+			self.assertEqual(speech._next_attempt, 103.0)  # NOQA: SLF001
+			mock_monotonic.return_value = 103.0
+			speech._on_timer()  # NOQA: SLF001
+			self.assertEqual(speech._next_attempt, 106.0)  # NOQA: SLF001
+			self.assertEqual(mock_open_client.call_count, 3)
+		# Buffered messages are replayed once the connection returns.
+		mock_sd: Mock = Mock()
+		mock_open_client.side_effect = None
+		mock_open_client.return_value = mock_sd
+		mock_monotonic.return_value = 106.0
+		speech.say("fifth")
+		self.assertEqual(
+			[c for c in mock_sd.mock_calls if c[0] != "speak"],
+			[call.set_priority("important"), call.block_begin(), call.block_end(), call.set_priority("text")],
+		)
+		self.assertEqual(
+			[c.args[0] for c in mock_sd.speak.mock_calls], ["second", "third", "fourth", "fifth"]
+		)
+		self.assertFalse(speech._pending)  # NOQA: SLF001
+		self.assertEqual((speech.reconnects, speech._delay), (0, 1.0))  # NOQA: SLF001
+		# A lost connection is reopened immediately, and the failed message is sent on the new connection.
+		new_sd: Mock = Mock()
+		mock_open_client.return_value = new_sd
+		mock_sd.speak.side_effect = SSIPCommunicationError("Broken pipe.")
+		speech._in_flight[1] = Mock(**{"finish.return_value": []})  # NOQA: SLF001
+		speech.say("sixth")
+		mock_sd.close.assert_called_once()
+		self.assertFalse(speech.speaking())
+		new_sd.speak.assert_called_once_with("sixth", callback=ANY, event_types=speech._event_types)  # NOQA: SLF001
+		self.assertEqual(speech.reconnects, 1)
+		# A connection which fails during replay backs off again.
+		new_sd.speak.side_effect = SSIPCommunicationError("Broken pipe.")
+		with patch("speechlight.speech_dispatcher.threading.Timer") as mock_timer:
+			speech.say("seventh")
+			mock_timer.assert_called_once()
+		self.assertEqual(list(speech._pending), [(("seventh",), Priority.TEXT)])  # NOQA: SLF001
+		self.assertEqual(speech._next_attempt, 107.0)  # NOQA: SLF001
+		# Silencing discards buffered messages.
+		speech.silence()
+		self.assertFalse(speech._pending)  # NOQA: SLF001
+		speech._send(("eighth",), Priority.TEXT)  # Not connected.  # NOQA: SLF001
+
+	@patch("speechlight.speech_dispatcher.Speech._open_client")
+	def test_silence_failure(self, mock_open_client: Mock) -> None:
+		mock_sd: Mock = Mock()
+		mock_sd.cancel.side_effect = SSIPCommunicationError("Broken pipe.")
+		with patch.object(self.speech, "_sd", mock_sd):
+			self.speech.silence()
+			self.assertIsNone(self.speech._sd)  # NOQA: SLF001
+		mock_sd.close.assert_called_once()
+
 	def test_speaking(self) -> None:
-		self.speech._is_speaking = True  # NOQA: SLF001
-		self.assertEqual(self.speech.speaking(), self.speech._is_speaking)  # NOQA: SLF001
-		self.speech._is_speaking = False  # NOQA: SLF001
-		self.assertEqual(self.speech.speaking(), self.speech._is_speaking)  # NOQA: SLF001
+		self.assertFalse(self.speech.speaking())
+		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
+			mock_sd.speak.side_effect = [
+				(225, "OK MESSAGE QUEUED", ("1",)),
+				(225, "OK MESSAGE QUEUED", ("2",)),
+			]
+			self.speech.say("first")
+			self.speech.say("second")
+			first, second = (c.kwargs["callback"] for c in mock_sd.speak.mock_calls)
+			self.assertEqual(self.speech.last_message_id, 2)
+			self.assertTrue(self.speech.speaking())
+			# The second message begins before the first one ends.
+			first(CALLBACK_BEGIN)
+			second(CALLBACK_BEGIN)
+			first(CALLBACK_END)
+			self.assertTrue(self.speech.speaking())
+			self.assertTrue(self.speech.wait_message(1, timeout=0.0))
+			self.assertFalse(self.speech.wait_message(2, timeout=0.0))
+			timer: threading.Timer = threading.Timer(0.01, second, args=(CALLBACK_CANCEL,))
+			timer.start()
+			self.assertTrue(self.speech.wait_message(2, timeout=5.0))
+			timer.join()
+			self.assertFalse(self.speech.speaking())
+			self.assertTrue(self.speech.wait_message(2, timeout=0.0))
+
+	def test_message_listener(self) -> None:
+		listener: Mock = Mock()
+		self.assertIsNone(self.speech.add_message_listener(1, listener))
+		with (
+			patch.object(self.speech, "_sd", Mock()) as mock_sd,
+			patch("speechlight.speech_dispatcher.logger") as mock_logger,
+		):
+			mock_sd.speak.side_effect = [
+				(225, "OK MESSAGE QUEUED", ("1",)),
+				(225, "OK MESSAGE QUEUED", ("2",)),
+			]
+			self.speech.say("first")
+			self.speech.say("second")
+			first, second = (c.kwargs["callback"] for c in mock_sd.speak.mock_calls)
+			self.assertEqual(
+				self.speech.add_message_listener(1, listener),
+				self.speech._in_flight[1].deadline,  # NOQA: SLF001
+			)
+			failing: Mock = Mock(side_effect=RuntimeError("Listener failure."))
+			self.speech.add_message_listener(2, failing)
+			self.speech.add_message_listener(2, listener)
+			first(CALLBACK_BEGIN)
+			listener.assert_not_called()
+			first(CALLBACK_END)
+			listener.assert_called_once_with()
+			# A failing listener doesn't prevent the others from being called.
+			second(CALLBACK_CANCEL)
+			failing.assert_called_once_with()
+			mock_logger.exception.assert_called_once_with("Message listener failed.")
+			self.assertEqual(listener.call_count, 2)
+			# Listeners are only called once.
+			second(CALLBACK_CANCEL)
+			self.assertEqual(listener.call_count, 2)
+			self.assertIsNone(self.speech.add_message_listener(2, listener))
+
+	def test_speaking_block(self) -> None:
+		listener: Mock = Mock()
+		self.speech.add_event_listener(listener)
+		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
+			mock_sd.speak.side_effect = [
+				(225, "OK MESSAGE QUEUED", ("3",)),
+				(225, "OK MESSAGE QUEUED", ("4",)),
+				(225, "OK MESSAGE QUEUED", ("5",)),
+				(225, "OK MESSAGE QUEUED", ("11",)),
+				(225, "OK MESSAGE QUEUED", ("12",)),
+			]
+			self.speech.say_many(["first", "second", "third"])
+			self.assertEqual(self.speech.last_message_id, 3)
+			first = mock_sd.speak.mock_calls[0].kwargs["callback"]
+			first(CALLBACK_BEGIN)
+			self.assertFalse(self.speech.wait_message(3, timeout=0.0))
+			mock_sd.speak.mock_calls[2].kwargs["callback"](CALLBACK_END)
+			self.assertFalse(self.speech.speaking())
+			self.assertEqual([c.args for c in listener.mock_calls], [(CALLBACK_BEGIN,), (CALLBACK_END,)])
+			# Both ends of a cancelled block report CANCEL, but listeners only receive it once.
+			self.speech.say_many(["fourth", "fifth"])
+			listener.reset_mock()
+			for c in mock_sd.speak.mock_calls[3:]:
+				c.kwargs["callback"](CALLBACK_CANCEL)
+			listener.assert_called_once_with(CALLBACK_CANCEL)
+
+	@patch("speechlight.speech_dispatcher.logger", Mock())
+	@patch("speechlight.speech_dispatcher.time.monotonic")
+	def test_speaking_lost_events(self, mock_monotonic: Mock) -> None:
+		mock_monotonic.return_value = 100.0
+		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
+			mock_sd.speak.side_effect = [
+				(225, "OK MESSAGE QUEUED", ("7",)),
+				(225, "OK MESSAGE QUEUED", ("8",)),
+			]
+			# Speech Dispatcher dropped the events of both messages.
+			self.speech.say("a" * 40)
+			self.speech.say("b" * 40)
+			first_deadline: float = 100.0 + MESSAGE_TIMEOUT + 40 / MIN_SPEAKING_RATE
+			self.assertEqual(self.speech._in_flight[7].deadline, first_deadline)  # NOQA: SLF001
+			# The second message is queued behind the first.
+			second_deadline: float = first_deadline + MESSAGE_TIMEOUT + 40 / MIN_SPEAKING_RATE
+			self.assertEqual(self.speech._in_flight[8].deadline, second_deadline)  # NOQA: SLF001
+			first_listener: Mock = Mock()
+			second_listener: Mock = Mock()
+			self.speech.add_message_listener(7, first_listener)
+			self.speech.add_message_listener(8, second_listener)
+			mock_monotonic.return_value = first_deadline
+			self.assertTrue(self.speech.speaking())
+			first_listener.assert_called_once_with()
+			self.assertFalse(self.speech.wait_message(8, timeout=0.0))
+			# Waiting without a timeout is bounded by the deadline.
+			self.assertTrue(self.speech.wait_message(7))
+			mock_monotonic.return_value = second_deadline
+			self.assertTrue(self.speech.wait_message(8))
+			second_listener.assert_called_once_with()
+			self.assertFalse(self.speech.speaking())
+			# A late event is ignored.
+			listener: Mock = Mock()
+			self.speech.add_event_listener(listener)
+			mock_sd.speak.mock_calls[0].kwargs["callback"](CALLBACK_END)
+			listener.assert_not_called()
+
+	@patch("speechlight.speech_dispatcher.Speech._open_client")
+	def test_reconnect_clears_in_flight(self, mock_open_client: Mock) -> None:
+		mock_open_client.return_value.speak.side_effect = [
+			(225, "OK MESSAGE QUEUED", ("9",)),
+			(225, "OK MESSAGE QUEUED", ("10",)),
+		]
+		speech: Speech = Speech()
+		speech.say(self.text)
+		message = speech._in_flight[9]  # NOQA: SLF001
+		listener: Mock = Mock()
+		speech.add_message_listener(9, listener)
+		# The connection was replaced, so the message's events will never arrive.
+		speech._sd = None  # NOQA: SLF001
+		speech.say(self.text)
+		self.assertEqual(list(speech._in_flight), [10])  # NOQA: SLF001
+		self.assertTrue(message.finished)
+		listener.assert_called_once_with()
+		self.assertEqual(speech.reconnects, 1)
+
+	def test_speaking_early_events(self) -> None:
+		def speak(
+			text: str, callback: Callable[..., None], event_types: tuple[str, ...]
+		) -> tuple[int, str, tuple[str, ...]]:
+			# Events may arrive from the callback thread before speak returns.
+			callback(CALLBACK_BEGIN)
+			callback(CALLBACK_END)
+			return (225, "OK MESSAGE QUEUED", ("6",))
+
+		with patch.object(self.speech, "_sd", Mock()) as mock_sd:
+			mock_sd.speak.side_effect = speak
+			self.speech.say(self.text)
+			self.assertEqual(self.speech.last_message_id, 6)
+			self.assertFalse(self.speech.speaking())
+			# Without a message ID, the message can't be tracked.
+			mock_sd.speak.side_effect = None
+			mock_sd.speak.return_value = (225, "OK MESSAGE QUEUED", ())
+			self.speech.say(self.text)
+			self.assertIsNone(self.speech.last_message_id)
+			self.assertFalse(self.speech.speaking())
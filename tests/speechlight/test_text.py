@@ -0,0 +1,81 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+from unittest import TestCase
+
+# Speechlight Modules:
+from speechlight.text import TextAccumulator, split_text
+
+
+class TestText(TestCase):
+	def test_split_text_sentences(self) -> None:
+		text: str = 'Hello there. How are you? I am "fine." Thanks!\nNext line.'
+		self.assertEqual(split_text(text), [text])
+		self.assertEqual(
+			split_text(text, 20),
+			["Hello there.", "How are you?", 'I am "fine." Thanks!', "Next line."],
+		)
+		self.assertEqual(
+			split_text(text, 30), ["Hello there. How are you?", 'I am "fine." Thanks!', "Next line."]
+		)
+
+	def test_split_text_clauses_and_words(self) -> None:
+		text: str = "First clause, second clause; third clause: a final clause which is much too long."
+		self.assertEqual(
+			split_text(text, 30),
+			["First clause, second clause;", "third clause: a final clause", "which is much too long."],
+		)
+		self.assertEqual(split_text("x" * 25, 10), ["x" * 10, "x" * 10, "x" * 5])
+
+	def test_split_text_empty(self) -> None:
+		self.assertEqual(split_text(""), [])
+		self.assertEqual(split_text(" \n "), [])
+		self.assertEqual(split_text("  Padded.  "), ["Padded."])
+		with self.assertRaises(ValueError):
+			split_text("Text.", 0)
+
+
+class TestTextAccumulator(TestCase):
+	def test_feed(self) -> None:
+		accumulator: TextAccumulator = TextAccumulator(max_length=20)
+		self.assertEqual(accumulator.feed("Hello th"), [])
+		self.assertEqual(accumulator.feed("ere. How are"), ["Hello there."])
+		# Punctuation at the end of a fragment isn't a boundary until whitespace follows.
+		self.assertEqual(accumulator.feed(" you?"), [])
+		self.assertEqual(accumulator.feed("\nFine"), ["How are you?"])
+		self.assertEqual(accumulator.flush(), ["Fine"])
+		self.assertEqual(accumulator.flush(), [])
+		with self.assertRaises(ValueError):
+			TextAccumulator(max_length=0)
+
+	def test_feed_long(self) -> None:
+		accumulator: TextAccumulator = TextAccumulator(max_length=20)
+		# Without a sentence boundary, text is released at a clause, then a word, boundary.
+		self.assertEqual(accumulator.feed("First clause, second clause"), ["First clause,"])
+		self.assertEqual(accumulator.feed(" and some more wor"), ["second clause and", "some more"])
+		self.assertEqual(accumulator.flush(), ["wor"])
+		# A single word which is too long is cut.
+		self.assertEqual(accumulator.feed("x" * 25), ["x" * 20])
+		self.assertEqual(accumulator.flush(), ["x" * 5])
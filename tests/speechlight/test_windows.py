@@ -23,20 +23,149 @@
 from __future__ import annotations
 
 # Built-in Modules:
+import threading
 from unittest import TestCase, mock
 
 # Speechlight Modules:
-from speechlight.windows import SPF_ASYNC, SPF_IS_NOT_XML, SPF_PURGE_BEFORE_SPEAK, Speech
+from speechlight.base import Priority
+from speechlight.windows import (
+	COM_THREAD_NAME,
+	SCREEN_READER_JFW,
+	SCREEN_READER_NVDA,
+	SCREEN_READER_SA,
+	SCREEN_READER_SAPI,
+	SPF_ASYNC,
+	SPF_IS_NOT_XML,
+	SPF_PURGE_BEFORE_SPEAK,
+	ComError,
+	ComThread,
+	ScreenReaderError,
+	Speech,
+)
+
+
+RPC_S_SERVER_UNAVAILABLE: int = 1722  # The error code returned by NVDA's client when NVDA isn't running.
+
+
+class TestComThread(TestCase):
+	def setUp(self) -> None:
+		self.com_thread: ComThread = ComThread()
+
+	def tearDown(self) -> None:
+		self.com_thread.close(5.0)
+
+	def test_submit(self) -> None:
+		self.assertFalse(self.com_thread.running)
+		self.assertEqual(self.com_thread.call(max, 1, 2), 2)
+		self.assertTrue(self.com_thread.running)
+		with self.assertRaises(ComError):
+			self.com_thread.call(mock.Mock(side_effect=ComError("Failed.")))
+		# Every call is made on the same thread.
+		futures = [self.com_thread.submit(threading.current_thread) for _ in range(3)]
+		self.assertEqual({future.result(5.0) for future in futures}, {self.com_thread._thread})  # NOQA: SLF001
+
+	def test_submit_from_com_thread(self) -> None:
+		# A call made from the COM thread which waits for a nested call must not deadlock.
+		result: int = self.com_thread.call(lambda: self.com_thread.call(len, "abc"))
+		self.assertEqual(result, 3)
+
+	def test_cancel(self) -> None:
+		started: threading.Event = threading.Event()
+		release: threading.Event = threading.Event()
+
+		def block() -> None:
+			started.set()
+			release.wait(5.0)
+
+		blocking = self.com_thread.submit(block)
+		self.assertTrue(started.wait(5.0))
+		cancelled = self.com_thread.submit(mock.Mock())
+		self.assertTrue(cancelled.cancel())
+		release.set()
+		self.assertIsNone(blocking.result(5.0))
+		self.assertIsNone(self.com_thread.call(lambda: None))
+		self.assertTrue(cancelled.cancelled())
+
+	def test_close(self) -> None:
+		pending = self.com_thread.submit(len, "abc")
+		self.com_thread.close(5.0)
+		# Calls submitted before closing are still made.
+		self.assertEqual(pending.result(5.0), 3)
+		self.assertFalse(self.com_thread.running)
+		with self.assertRaises(RuntimeError):
+			self.com_thread.submit(len, "abc")
 
 
 class TestWindows(TestCase):  # NOQA: PLR0904
 	def setUp(self) -> None:
 		self.text: str = "This is a test."
-		self.speech: Speech = Speech()
+		# Probe for the active screen reader on every call, so routing can be tested.
+		# Update the braille display on every call, so routing can be tested.
+		self.speech: Speech = Speech(detection_ttl=0.0, braille_interval=0.0)
 
 	def tearDown(self) -> None:
+		self.speech.close()
 		del self.speech
 
+	@mock.patch("speechlight.windows.Speech.nvda_say")
+	@mock.patch("speechlight.windows.Speech.nvda_running", return_value=True)
+	def test_concurrent_calls(self, mock_nvda_running: mock.Mock, mock_nvda_say: mock.Mock) -> None:
+		speech: Speech = Speech(detection_ttl=60.0)
+		started: threading.Event = threading.Event()
+		release: threading.Event = threading.Event()
+
+		def nvda_say(text: str, *, interrupt: bool = False) -> None:
+			if text == "slow":
+				started.set()
+				release.wait(5.0)
+
+		mock_nvda_say.side_effect = nvda_say
+		slow: threading.Thread = threading.Thread(target=speech.say, args=("slow",))
+		slow.start()
+		self.assertTrue(started.wait(5.0))
+		# Another caller doesn't wait behind the slow call.
+		fast: threading.Thread = threading.Thread(target=speech.say, args=("fast",))
+		fast.start()
+		fast.join(5.0)
+		self.assertFalse(fast.is_alive())
+		self.assertTrue(slow.is_alive())
+		release.set()
+		slow.join(5.0)
+		self.assertEqual(mock_nvda_running.call_count, 1)
+
+	def test_com_thread(self) -> None:
+		threads: list[threading.Thread] = []
+
+		def create() -> mock.Mock:
+			threads.append(threading.current_thread())
+			return mock.Mock()
+
+		with mock.patch("speechlight.windows.Speech.sapi", mock.PropertyMock(side_effect=create)):
+			self.speech._com_call("sapi", lambda sapi: threads.append(threading.current_thread()))  # NOQA: SLF001
+		# COM objects are created and used on the COM thread, not the calling thread.
+		self.assertEqual([thread.name for thread in threads], [COM_THREAD_NAME, COM_THREAD_NAME])
+		self.assertTrue(self.speech.com_thread.running)
+		self.speech.close()
+		self.assertFalse(self.speech.com_thread.running)
+
+	def test_com_call(self) -> None:
+		stale: mock.Mock = mock.Mock()
+		stale.Speak.side_effect = ComError("Stale COM reference.")
+		fresh: mock.Mock = mock.Mock()
+		with mock.patch("speechlight.windows.Speech.sapi", mock.PropertyMock()) as mock_sapi:
+			mock_sapi.side_effect = [stale, fresh]
+			self.speech.sapi_say(self.text)
+			stale.Speak.assert_called_once()
+			fresh.Speak.assert_called_once_with(self.text, SPF_ASYNC | SPF_IS_NOT_XML)
+			self.assertIsNone(self.speech._sapi)  # NOQA: SLF001
+			# Failing again with the recreated object propagates the error.
+			mock_sapi.side_effect = None
+			mock_sapi.return_value = stale
+			with self.assertRaises(ComError):
+				self.speech.sapi_say(self.text)
+			mock_sapi.return_value = None
+			self.assertIsNone(self.speech._com_call("sapi", lambda sapi: sapi.Speak(self.text)))  # NOQA: SLF001
+
 	@mock.patch("speechlight.windows.Speech.jfw_output")
 	def test_jfw_braille(self, mock_jfw_output: mock.Mock) -> None:
 		self.speech.jfw_braille(self.text)
@@ -59,6 +188,17 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 			self.speech.jfw_output(self.text, braille=True, speak=True, interrupt=True)
 			mock_jfw.return_value.SayString.assert_called_once_with(self.text, 1)
 			mock_jfw.return_value.RunFunction.assert_called_once_with(f'BrailleString("{self.text}")')
+			# JFW rejects the text.
+			mock_jfw.return_value.SayString.return_value = False
+			with self.assertRaises(ScreenReaderError):
+				self.speech.jfw_output(self.text, speak=True)
+			mock_jfw.return_value.RunFunction.return_value = False
+			with self.assertRaises(ScreenReaderError):
+				self.speech.jfw_output(self.text, braille=True)
+			# JFW is unavailable.
+			mock_jfw.return_value = None
+			with self.assertRaises(ScreenReaderError):
+				self.speech.jfw_output(self.text, speak=True)
 
 	def test_jfw_running(self) -> None:
 		with mock.patch.object(self.speech, "_find_window") as mock_find_window:
@@ -76,11 +216,18 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 		with mock.patch("speechlight.windows.Speech.jfw", mock.PropertyMock()) as mock_jfw:
 			self.speech.jfw_silence()
 			mock_jfw.return_value.StopSpeech.assert_called_once()
+			mock_jfw.return_value = None
+			with self.assertRaises(ScreenReaderError):
+				self.speech.jfw_silence()
 
 	def test_nvda_braille(self) -> None:
 		with mock.patch.object(self.speech, "_nvda") as mock_nvda:
+			mock_nvda.nvdaController_brailleMessage.return_value = 0
 			self.speech.nvda_braille(self.text)
 			mock_nvda.nvdaController_brailleMessage.assert_called_once_with(self.text)
+			mock_nvda.nvdaController_brailleMessage.return_value = RPC_S_SERVER_UNAVAILABLE
+			with self.assertRaises(ScreenReaderError):
+				self.speech.nvda_braille(self.text)
 
 	@mock.patch("speechlight.windows.Speech.nvda_braille")
 	@mock.patch("speechlight.windows.Speech.nvda_say")
@@ -97,22 +244,34 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 	@mock.patch("speechlight.windows.Speech.nvda_silence")
 	def test_nvda_say(self, mock_nvda_silence: mock.Mock) -> None:
 		with mock.patch.object(self.speech, "_nvda") as mock_nvda:
+			mock_nvda.nvdaController_speakText.return_value = 0
 			self.speech.nvda_say(self.text)
 			mock_nvda.nvdaController_speakText.assert_called_once_with(self.text)
 			mock_nvda.reset_mock()
 			self.speech.nvda_say(self.text, interrupt=True)
 			mock_nvda_silence.assert_called_once()
 			mock_nvda.nvdaController_speakText.assert_called_once_with(self.text)
+			mock_nvda.nvdaController_speakText.return_value = RPC_S_SERVER_UNAVAILABLE
+			with self.assertRaises(ScreenReaderError) as context:
+				self.speech.nvda_say(self.text)
+			self.assertEqual(context.exception.errno, RPC_S_SERVER_UNAVAILABLE)
 
 	def test_nvda_silence(self) -> None:
 		with mock.patch.object(self.speech, "_nvda") as mock_nvda:
+			mock_nvda.nvdaController_cancelSpeech.return_value = 0
 			self.speech.nvda_silence()
 			mock_nvda.nvdaController_cancelSpeech.assert_called_once()
+			mock_nvda.nvdaController_cancelSpeech.return_value = RPC_S_SERVER_UNAVAILABLE
+			with self.assertRaises(ScreenReaderError):
+				self.speech.nvda_silence()
 
 	def test_sa_braille(self) -> None:
 		with mock.patch.object(self.speech, "_sa") as mock_sa:
 			self.speech.sa_braille(self.text)
 			mock_sa.SA_BrlShowTextW.assert_called_once_with(self.text)
+			mock_sa.SA_BrlShowTextW.return_value = 0
+			with self.assertRaises(ScreenReaderError):
+				self.speech.sa_braille(self.text)
 
 	@mock.patch("speechlight.windows.Speech.sa_braille")
 	@mock.patch("speechlight.windows.Speech.sa_say")
@@ -131,7 +290,11 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 		with mock.patch.object(self.speech, "_sa") as mock_sa:
 			self.speech.sa_say(self.text)
 			mock_sa.SA_SayW.assert_called_once_with(self.text)
+			mock_sa.SA_SayW.return_value = 0
+			with self.assertRaises(ScreenReaderError):
+				self.speech.sa_say(self.text)
 			mock_sa.reset_mock()
+			mock_sa.SA_SayW.return_value = 1
 			self.speech.sa_say(self.text, interrupt=True)
 			mock_sa_silence.assert_called_once()
 			mock_sa.SA_SayW.assert_called_once_with(self.text)
@@ -140,6 +303,9 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 		with mock.patch.object(self.speech, "_sa") as mock_sa:
 			self.speech.sa_silence()
 			mock_sa.SA_StopAudio.assert_called_once()
+			mock_sa.SA_StopAudio.return_value = 0
+			with self.assertRaises(ScreenReaderError):
+				self.speech.sa_silence()
 
 	def test_sapi_say(self) -> None:
 		with mock.patch("speechlight.windows.Speech.sapi", mock.PropertyMock()) as mock_sapi:
@@ -158,6 +324,75 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 				"", SPF_ASYNC | SPF_PURGE_BEFORE_SPEAK | SPF_IS_NOT_XML
 			)
 
+	@mock.patch("speechlight.windows.Speech.jfw_running", return_value=False)
+	@mock.patch("speechlight.windows.Speech.sa_running", return_value=False)
+	@mock.patch("speechlight.windows.Speech.nvda_running", return_value=False)
+	def test_screen_reader(
+		self,
+		mock_nvda_running: mock.Mock,
+		mock_sa_running: mock.Mock,
+		mock_jfw_running: mock.Mock,
+	) -> None:
+		self.assertEqual(self.speech.screen_reader(), SCREEN_READER_SAPI)
+		mock_jfw_running.return_value = True
+		self.assertEqual(self.speech.screen_reader(), SCREEN_READER_JFW)
+		mock_sa_running.return_value = True
+		self.assertEqual(self.speech.screen_reader(), SCREEN_READER_SA)
+		mock_nvda_running.return_value = True
+		self.assertEqual(self.speech.screen_reader(), SCREEN_READER_NVDA)
+		self.assertEqual(self.speech.detection_hits, 0)
+		self.assertEqual(self.speech.detection_misses, 4)
+
+	@mock.patch("speechlight.windows.time.monotonic")
+	@mock.patch("speechlight.windows.Speech.nvda_running", return_value=True)
+	def test_screen_reader_cache(self, mock_nvda_running: mock.Mock, mock_monotonic: mock.Mock) -> None:
+		speech: Speech = Speech(detection_ttl=5.0)
+		mock_monotonic.return_value = 100.0
+		self.assertEqual(speech.screen_reader(), SCREEN_READER_NVDA)
+		mock_monotonic.return_value = 104.0
+		self.assertEqual(speech.screen_reader(), SCREEN_READER_NVDA)
+		mock_nvda_running.assert_called_once()
+		self.assertEqual((speech.detection_hits, speech.detection_misses), (1, 1))
+		# The cached screen reader expires after the TTL.
+		mock_monotonic.return_value = 105.0
+		self.assertEqual(speech.screen_reader(), SCREEN_READER_NVDA)
+		self.assertEqual(mock_nvda_running.call_count, 2)
+		self.assertEqual((speech.detection_hits, speech.detection_misses), (1, 2))
+		speech.invalidate_screen_reader()
+		self.assertEqual(speech.screen_reader(), SCREEN_READER_NVDA)
+		self.assertEqual((speech.detection_hits, speech.detection_misses), (1, 3))
+
+	@mock.patch("speechlight.windows.Speech.jfw_say")
+	@mock.patch("speechlight.windows.Speech.nvda_running")
+	def test_screen_reader_pinned(self, mock_nvda_running: mock.Mock, mock_jfw_say: mock.Mock) -> None:
+		with self.assertRaises(ValueError):
+			Speech(screen_reader="orca")
+		speech: Speech = Speech(screen_reader=SCREEN_READER_JFW)
+		speech.say(self.text)
+		self.assertEqual(speech.screen_reader(), SCREEN_READER_JFW)
+		mock_jfw_say.assert_called_once_with(self.text, interrupt=False)
+		# A pinned screen reader is never probed for.
+		mock_nvda_running.assert_not_called()
+		self.assertEqual((speech.detection_hits, speech.detection_misses), (0, 0))
+
+	@mock.patch("speechlight.windows.Speech.sapi_say")
+	def test_screen_reader_failure(self, mock_sapi_say: mock.Mock) -> None:
+		speech: Speech = Speech(detection_ttl=60.0)
+		mock_nvda: mock.Mock = mock.Mock()
+		# NVDA is detected, then exits before the text is spoken.
+		mock_nvda.nvdaController_testIfRunning.side_effect = [0, RPC_S_SERVER_UNAVAILABLE]
+		mock_nvda.nvdaController_speakText.return_value = RPC_S_SERVER_UNAVAILABLE
+		with (
+			mock.patch.object(speech, "_nvda", mock_nvda),
+			mock.patch.object(speech, "sa_running", return_value=False),
+			mock.patch.object(speech, "jfw_running", return_value=False),
+		):
+			speech.say(self.text)
+		mock_nvda.nvdaController_speakText.assert_called_once_with(self.text)
+		mock_sapi_say.assert_called_once_with(self.text, interrupt=False)
+		self.assertEqual(speech.screen_reader(), SCREEN_READER_SAPI)
+		self.assertEqual(speech.detection_misses, 2)
+
 	@mock.patch("speechlight.windows.Speech.jfw_braille")
 	@mock.patch("speechlight.windows.Speech.jfw_running", return_value=False)
 	@mock.patch("speechlight.windows.Speech.sa_braille")
@@ -187,21 +422,59 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 		mock_sa_braille.assert_called_once_with(self.text)
 		mock_jfw_braille.assert_called_once_with(self.text)
 
+	@mock.patch("speechlight.windows.Speech.jfw_braille")
+	@mock.patch("speechlight.windows.Speech.sa_braille")
+	@mock.patch("speechlight.windows.Speech.nvda_braille")
+	@mock.patch("speechlight.windows.Speech.nvda_running", return_value=True)
+	def test_braille_throttled(
+		self,
+		mock_nvda_running: mock.Mock,
+		mock_nvda_braille: mock.Mock,
+		mock_sa_braille: mock.Mock,
+		mock_jfw_braille: mock.Mock,
+	) -> None:
+		speech: Speech = Speech(detection_ttl=60.0, braille_interval=60.0)
+		speech.braille("first")
+		speech.braille("second")
+		speech.braille("third")
+		mock_nvda_braille.assert_called_once_with("first")
+		self.assertEqual(speech.braille_scheduler.pending, "third")
+		speech.braille_scheduler.flush()
+		mock_nvda_braille.assert_called_with("third")
+		# Text which is already on the display is not sent again.
+		speech.output("third")
+		self.assertIsNone(speech.braille_scheduler.pending)
+		self.assertEqual((speech.braille_scheduler.sent, speech.braille_scheduler.skipped), (2, 1))
+		# The display of a newly detected screen reader is updated, even if the text matches.
+		speech.invalidate_screen_reader()
+		mock_nvda_running.return_value = False
+		with mock.patch.object(speech, "sa_running", return_value=True):
+			speech.braille_scheduler.interval = 0.0
+			speech.braille("third")
+		mock_sa_braille.assert_called_once_with("third")
+		mock_jfw_braille.assert_not_called()
+
 	@mock.patch("speechlight.windows.Speech.sapi_say")
-	@mock.patch("speechlight.windows.Speech.jfw_output")
+	@mock.patch("speechlight.windows.Speech.jfw_braille")
+	@mock.patch("speechlight.windows.Speech.jfw_say")
 	@mock.patch("speechlight.windows.Speech.jfw_running", return_value=False)
-	@mock.patch("speechlight.windows.Speech.sa_output")
+	@mock.patch("speechlight.windows.Speech.sa_braille")
+	@mock.patch("speechlight.windows.Speech.sa_say")
 	@mock.patch("speechlight.windows.Speech.sa_running", return_value=False)
-	@mock.patch("speechlight.windows.Speech.nvda_output")
+	@mock.patch("speechlight.windows.Speech.nvda_braille")
+	@mock.patch("speechlight.windows.Speech.nvda_say")
 	@mock.patch("speechlight.windows.Speech.nvda_running", return_value=False)
 	def test_output(
 		self,
 		mock_nvda_running: mock.Mock,
-		mock_nvda_output: mock.Mock,
+		mock_nvda_say: mock.Mock,
+		mock_nvda_braille: mock.Mock,
 		mock_sa_running: mock.Mock,
-		mock_sa_output: mock.Mock,
+		mock_sa_say: mock.Mock,
+		mock_sa_braille: mock.Mock,
 		mock_jfw_running: mock.Mock,
-		mock_jfw_output: mock.Mock,
+		mock_jfw_say: mock.Mock,
+		mock_jfw_braille: mock.Mock,
 		mock_sapi_say: mock.Mock,
 	) -> None:
 		mock_nvda_running.return_value = True
@@ -214,11 +487,29 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 		self.speech.output(self.text, interrupt=True)
 		mock_jfw_running.return_value = False
 		self.speech.output(self.text, interrupt=True)
-		mock_nvda_output.assert_called_once_with(self.text, interrupt=True)
-		mock_sa_output.assert_called_once_with(self.text, interrupt=True)
-		mock_jfw_output.assert_called_once_with(self.text, braille=True, speak=True, interrupt=True)
+		for mock_say, mock_braille in (
+			(mock_nvda_say, mock_nvda_braille),
+			(mock_sa_say, mock_sa_braille),
+			(mock_jfw_say, mock_jfw_braille),
+		):
+			mock_say.assert_called_once_with(self.text, interrupt=True)
+			mock_braille.assert_called_once_with(self.text)
 		mock_sapi_say.assert_called_once_with(self.text, interrupt=True)
 
+	@mock.patch("speechlight.windows.Speech.output")
+	def test_output_many(self, mock_output: mock.Mock) -> None:
+		self.speech.output_many([])
+		mock_output.assert_not_called()
+		self.speech.output_many(["first", "second"], interrupt=True)
+		mock_output.assert_called_once_with("first\nsecond", interrupt=True, priority=Priority.TEXT)
+
+	@mock.patch("speechlight.windows.Speech.say")
+	def test_say_many(self, mock_say: mock.Mock) -> None:
+		self.speech.say_many([])
+		mock_say.assert_not_called()
+		self.speech.say_many(["first", "second"], interrupt=True)
+		mock_say.assert_called_once_with("first\nsecond", interrupt=True, priority=Priority.TEXT)
+
 	@mock.patch("speechlight.windows.Speech.sapi_say")
 	@mock.patch("speechlight.windows.Speech.jfw_say")
 	@mock.patch("speechlight.windows.Speech.jfw_running", return_value=False)
@@ -308,3 +599,22 @@ class TestWindows(TestCase):  # NOQA: PLR0904
 			self.assertFalse(self.speech.speaking())
 			mock_sapi.return_value = None
 			self.assertFalse(self.speech.speaking())
+
+	@mock.patch("speechlight.windows.Speech.sapi_say")
+	def test_instrumentation(self, mock_sapi_say: mock.Mock) -> None:
+		speech: Speech = Speech(detection_ttl=60.0)
+		mock_nvda: mock.Mock = mock.Mock()
+		mock_nvda.nvdaController_testIfRunning.side_effect = [0, RPC_S_SERVER_UNAVAILABLE]
+		mock_nvda.nvdaController_speakText.return_value = RPC_S_SERVER_UNAVAILABLE
+		instrumentation = speech.enable_instrumentation()
+		with (
+			mock.patch.object(speech, "_nvda", mock_nvda),
+			mock.patch.object(speech, "sa_running", return_value=False),
+			mock.patch.object(speech, "jfw_running", return_value=False),
+		):
+			speech.say(self.text)
+		snapshot = instrumentation.snapshot()
+		self.assertEqual(sorted(snapshot), ["nvda_say", "sapi_say", "say"])
+		self.assertEqual((snapshot["nvda_say"]["calls"], snapshot["nvda_say"]["errors"]), (1, 1))
+		self.assertEqual((snapshot["sapi_say"]["calls"], snapshot["sapi_say"]["errors"]), (1, 0))
+		self.assertEqual(snapshot["say"]["characters"], len(self.text))
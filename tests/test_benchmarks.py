@@ -0,0 +1,51 @@
+# Copyright (C) 2026 Nick Stockton
+# SPDX-License-Identifier: MIT
+# -----------------------------------------------------------------------------
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# -----------------------------------------------------------------------------
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# -----------------------------------------------------------------------------
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Future Modules:
+from __future__ import annotations
+
+# Built-in Modules:
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+# Speechlight Modules:
+from benchmarks import bench_backends, bench_normalize, bench_pronunciation
+
+
+class TestBenchmarks(TestCase):
+	"""Runs every benchmark once, so that a change which breaks a benchmark doesn't go unnoticed."""
+
+	def test_backends(self) -> None:
+		with redirect_stdout(io.StringIO()) as output:
+			bench_backends.main(["--iterations", "1"])
+		for backend in bench_backends.BACKENDS:
+			self.assertIn(backend, output.getvalue())
+
+	def test_normalize(self) -> None:
+		with redirect_stdout(io.StringIO()) as output:
+			bench_normalize.main(["--iterations", "1", "--lines", "10", "--unique", "5"])
+		self.assertIn("compiled", output.getvalue())
+
+	def test_pronunciation(self) -> None:
+		with redirect_stdout(io.StringIO()) as output:
+			bench_pronunciation.main(["--entries", "10", "--iterations", "1", "--lines", "10"])
+		self.assertIn("dictionary", output.getvalue())